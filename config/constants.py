@@ -178,4 +178,5 @@ PATHS = {
     'DATABASE': 'signal_bot.db',
     'CONFIG_DIR': 'config',
     'WEB_DIR': 'web',
+    'THUMBNAIL_CACHE_DIR': 'cache/thumbs',
 }
\ No newline at end of file
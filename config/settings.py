@@ -142,6 +142,7 @@ class Config:
     MAX_GROUP_MEMBERS: int = int(os.getenv('MAX_GROUP_MEMBERS', '1000'))
     MAX_SUMMARY_LENGTH: int = int(os.getenv('MAX_SUMMARY_LENGTH', '500'))
     MIN_MESSAGES_FOR_SUMMARY: int = int(os.getenv('MIN_MESSAGES_FOR_SUMMARY', '5'))
+    AI_ANALYSIS_WORKERS: int = int(os.getenv('AI_ANALYSIS_WORKERS', '4'))
 
     # ============= UI Configuration =============
     UI_THEME: str = os.getenv('UI_THEME', 'dark')
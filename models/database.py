@@ -12,12 +12,42 @@ from config.settings import Config
 import json
 import logging
 import threading
+import time
 from contextlib import contextmanager
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from .user_display_utils import get_user_display_sql
+from .versioned_cache import VersionedCache
+
+
+@lru_cache(maxsize=64)
+def _get_zone(user_timezone: str):
+    """Get the ZoneInfo for a timezone name; memoized as every date filter and chart looks one up."""
+    import zoneinfo
+    return zoneinfo.ZoneInfo(user_timezone)
+
+
+@lru_cache(maxsize=256)
+def _day_bounds_ms(date_str: str, user_timezone: Optional[str]) -> Tuple[int, int]:
+    """Get the first and last millisecond of a YYYY-MM-DD day in a timezone, falling back to UTC."""
+    target_date = date.fromisoformat(date_str)
+    tz = timezone.utc
+    if user_timezone:
+        try:
+            tz = _get_zone(user_timezone)
+        except Exception:
+            # Fall back to UTC if the timezone is unknown
+            pass
+
+    start_of_day = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=tz)
+    if tz is timezone.utc:
+        end_of_day = start_of_day.replace(hour=23, minute=59, second=59, microsecond=999000)
+    else:
+        end_of_day = datetime.combine(target_date, datetime.max.time()).replace(tzinfo=tz)
+    return int(start_of_day.timestamp() * 1000), int(end_of_day.timestamp() * 1000)
 
 
 @dataclass
@@ -111,6 +141,20 @@ class Group:
 class DatabaseManager:
     """UUID-based database manager for Signal bot."""
 
+    COUNT_CACHE_TTL = 600  # seconds; safety net, the data version already invalidates on writes
+    COUNT_CACHE_MAXSIZE = 1024
+    MONITORED_GROUPS_CACHE_TTL = 60  # seconds
+    GROUP_CACHE_TTL = 30  # seconds
+    GROUP_CACHE_MAXSIZE = 256
+    # Per-connection settings; journal_mode=WAL is stored in the file and set once in _init_database
+    CONNECTION_PRAGMAS = (
+        'PRAGMA synchronous=NORMAL',  # Safe with WAL; skips an fsync per commit
+        'PRAGMA busy_timeout=15000',  # Increased to 15 seconds
+        'PRAGMA cache_size=-64000',  # 64MB cache
+        'PRAGMA temp_store=MEMORY',  # Use memory for temp tables
+        'PRAGMA mmap_size=268435456',  # Map up to 256MB; pages are shared through the OS cache across connections
+    )
+
     def __init__(self, db_path: str = "signal_bot.db", logger: Optional[logging.Logger] = None):
         """
         Initialize database manager.
@@ -122,11 +166,20 @@ class DatabaseManager:
         self.db_path = Path(db_path)
         self.logger = logger or logging.getLogger(__name__)
         self._lock = threading.RLock()  # Use reentrant lock to allow nested calls
+        self._commit_count = 0  # Commits that changed rows, for get_data_version
+        # Filtered message counts, tagged with the data version they were computed under
+        self._count_cache = VersionedCache(self.COUNT_CACHE_TTL, self.COUNT_CACHE_MAXSIZE)
+        # Monitored groups, tagged the same way; toggling monitoring is a commit so it invalidates too
+        self._monitored_groups_cache = VersionedCache(self.MONITORED_GROUPS_CACHE_TTL, 1)
+        # Single groups by id (None for unknown ids), looked up by most page and API handlers
+        self._group_cache = VersionedCache(self.GROUP_CACHE_TTL, self.GROUP_CACHE_MAXSIZE)
         self._init_database()
 
     def _init_database(self):
         """Initialize clean UUID-based database schema."""
         with self._get_connection() as conn:
+            # Enable WAL mode for better concurrent access; it persists in the database file
+            conn.execute('PRAGMA journal_mode=WAL')
             cursor = conn.cursor()
 
             # Core users table - UUID as primary key
@@ -289,7 +342,12 @@ class DatabaseManager:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_configured ON users(is_configured)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_groups_monitored ON groups(is_monitored)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_messages_group ON messages(group_id)")
+            # Group (and sender) pages filter on these and order by timestamp, id; SQLite walks the
+            # index backwards for DESC, which a DESC column would prevent once the rowid tie-break is added
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_messages_group_ts ON messages(group_id, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_messages_group_sender_ts ON messages(group_id, sender_uuid, timestamp)")
+            # Superseded by idx_messages_group_ts, which has group_id as its prefix
+            cursor.execute("DROP INDEX IF EXISTS idx_messages_group")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_processed_timestamp ON processed_messages(timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_group_date ON sentiment_analysis(group_id, analysis_date)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_summary_group_date ON summary_analysis(group_id, analysis_date)")
@@ -300,7 +358,6 @@ class DatabaseManager:
     @contextmanager
     def _get_connection(self):
         """Get thread-safe database connection with retry logic."""
-        import time
         max_retries = 3
         retry_delay = 0.1
 
@@ -310,16 +367,14 @@ class DatabaseManager:
                     # Allow connections from multiple threads
                     conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False)
                     conn.row_factory = sqlite3.Row
-                    # Enable WAL mode for better concurrent access
-                    conn.execute('PRAGMA journal_mode=WAL')
-                    conn.execute('PRAGMA synchronous=NORMAL')
-                    conn.execute('PRAGMA busy_timeout=15000')  # Increased to 15 seconds
-                    conn.execute('PRAGMA cache_size=-32000')  # 32MB cache
-                    conn.execute('PRAGMA temp_store=MEMORY')  # Use memory for temp tables
+                    for pragma in self.CONNECTION_PRAGMAS:
+                        conn.execute(pragma)
 
                     try:
                         yield conn
                         conn.commit()
+                        if conn.total_changes:
+                            self._commit_count += 1
                         return
                     except Exception:
                         conn.rollback()
@@ -336,6 +391,23 @@ class DatabaseManager:
                     else:
                         raise
 
+    @contextmanager
+    def _get_read_connection(self):
+        """Get a read-only connection that skips the write lock.
+
+        WAL mode lets readers run alongside each other and alongside the single
+        writer, so page renders in concurrent request threads do not queue up
+        behind one another. Only use this for SELECTs.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            for pragma in self.CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            yield conn
+        finally:
+            conn.close()
+
     # Bot Configuration Methods
     def set_config(self, key: str, value: str) -> None:
         """Set bot configuration value."""
@@ -462,28 +534,34 @@ class DatabaseManager:
             if not row:
                 return None
 
-            # Helper function to safely get field from row
-            def safe_get(field_name: str):
-                try:
-                    return row[field_name] if field_name in row.keys() else None
-                except (KeyError, TypeError):
-                    return None
+            return self._row_to_user(row)
 
-            return User(
-                uuid=row['uuid'],
-                phone_number=row['phone_number'],
-                friendly_name=row['friendly_name'],
-                contact_name=safe_get('contact_name'),
-                given_name=safe_get('given_name'),
-                family_name=safe_get('family_name'),
-                profile_given_name=safe_get('profile_given_name'),
-                profile_family_name=safe_get('profile_family_name'),
-                username=safe_get('username'),
-                first_seen=datetime.fromisoformat(row['first_seen']) if row['first_seen'] else None,
-                last_seen=datetime.fromisoformat(row['last_seen']) if row['last_seen'] else None,
-                message_count=row['message_count'],
-                is_configured=bool(row['is_configured'])
-            )
+    def _row_to_user(self, row: sqlite3.Row) -> User:
+        """Build a User from a users table row."""
+        # Helper function to safely get field from row
+        keys = row.keys()
+
+        def safe_get(field_name: str):
+            try:
+                return row[field_name] if field_name in keys else None
+            except (KeyError, TypeError):
+                return None
+
+        return User(
+            uuid=row['uuid'],
+            phone_number=row['phone_number'],
+            friendly_name=row['friendly_name'],
+            contact_name=safe_get('contact_name'),
+            given_name=safe_get('given_name'),
+            family_name=safe_get('family_name'),
+            profile_given_name=safe_get('profile_given_name'),
+            profile_family_name=safe_get('profile_family_name'),
+            username=safe_get('username'),
+            first_seen=datetime.fromisoformat(row['first_seen']) if row['first_seen'] else None,
+            last_seen=datetime.fromisoformat(row['last_seen']) if row['last_seen'] else None,
+            message_count=row['message_count'],
+            is_configured=bool(row['is_configured'])
+        )
 
     def get_user_by_phone(self, phone_number: str) -> Optional[User]:
         """Get user by phone number (for backward compatibility)."""
@@ -504,7 +582,8 @@ class DatabaseManager:
                                     end_date: Optional[str] = None,
                                     user_timezone: Optional[str] = None,
                                     attachments_only: bool = False,
-                                    monitored_only: bool = True) -> tuple[List[str], List[Any]]:
+                                    monitored_only: bool = True,
+                                    displayable_only: bool = False) -> tuple[List[str], List[Any]]:
         """Build standardized WHERE conditions and parameters for message queries.
 
         This is the SINGLE SOURCE OF TRUTH for message filtering logic.
@@ -518,6 +597,7 @@ class DatabaseManager:
             user_timezone: User's timezone for date conversion
             attachments_only: Only include messages with attachments
             monitored_only: Only include messages from monitored groups
+            displayable_only: Skip messages with neither text nor attachments
 
         Returns:
             Tuple of (where_conditions list, params list)
@@ -562,6 +642,13 @@ class DatabaseManager:
                 )
             """)
 
+        # Messages the All tab would render as an empty card (blank text, no attachments)
+        if displayable_only:
+            where_conditions.append("""
+                (TRIM(COALESCE(m.message_text, ''), ' ' || char(9) || char(10) || char(13)) <> ''
+                 OR EXISTS (SELECT 1 FROM attachments a WHERE a.message_id = m.id))
+            """)
+
         return where_conditions, params
 
     def get_user_uuid_by_phone(self, phone_number: str) -> Optional[str]:
@@ -580,15 +667,15 @@ class DatabaseManager:
         """Get all users."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT uuid FROM users ORDER BY last_seen DESC")
-            return [self.get_user(row['uuid']) for row in cursor.fetchall()]
+            cursor.execute("SELECT * FROM users ORDER BY last_seen DESC")
+            return [self._row_to_user(row) for row in cursor.fetchall()]
 
     def get_configured_users(self) -> List[User]:
         """Get users with emoji configurations."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT uuid FROM users WHERE is_configured = TRUE ORDER BY last_seen DESC")
-            return [self.get_user(row['uuid']) for row in cursor.fetchall()]
+            cursor.execute("SELECT * FROM users WHERE is_configured = TRUE ORDER BY last_seen DESC")
+            return [self._row_to_user(row) for row in cursor.fetchall()]
 
     def get_discovered_users(self) -> List[User]:
         """Get users without emoji configurations (discovered but not configured), sorted by monitored group membership."""
@@ -596,7 +683,7 @@ class DatabaseManager:
             cursor = conn.cursor()
             # Sort by whether user is in monitored groups (users in monitored groups first), then by last_seen
             cursor.execute("""
-                SELECT DISTINCT u.uuid,
+                SELECT u.*,
                        CASE WHEN EXISTS (
                            SELECT 1 FROM group_members gm
                            JOIN groups g ON gm.group_id = g.group_id
@@ -606,7 +693,31 @@ class DatabaseManager:
                 WHERE u.is_configured = FALSE
                 ORDER BY in_monitored_group DESC, u.last_seen DESC
             """)
-            return [self.get_user(row['uuid']) for row in cursor.fetchall()]
+            return [self._row_to_user(row) for row in cursor.fetchall()]
+
+    def get_all_users_with_status(self) -> List[Tuple[User, bool]]:
+        """Get configured then discovered users with their configured flag, in one query.
+
+        Orders each group the same way as get_configured_users and get_discovered_users.
+        """
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT u.*, 1 AS configured, 0 AS in_monitored_group
+                FROM users u
+                WHERE u.is_configured = TRUE
+                UNION ALL
+                SELECT u.*, 0 AS configured,
+                       CASE WHEN EXISTS (
+                           SELECT 1 FROM group_members gm
+                           JOIN groups g ON gm.group_id = g.group_id
+                           WHERE gm.user_uuid = u.uuid AND g.is_monitored = 1
+                       ) THEN 1 ELSE 0 END AS in_monitored_group
+                FROM users u
+                WHERE u.is_configured = FALSE
+                ORDER BY configured DESC, in_monitored_group DESC, last_seen DESC
+            """)
+            return [(self._row_to_user(row), bool(row['configured'])) for row in cursor.fetchall()]
 
     def get_user_statistics(self) -> dict:
         """Get user statistics including total, configured, and discovered counts."""
@@ -687,6 +798,30 @@ class DatabaseManager:
                 is_active=bool(row['is_active'])
             )
 
+    def get_reactions_for_uuids(self, uuids: List[str]) -> Dict[str, UserReactions]:
+        """Get reaction preferences for many users at once, keyed by uuid."""
+        reactions_by_uuid: Dict[str, UserReactions] = {}
+        if not uuids:
+            return reactions_by_uuid
+
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            # Chunk to stay under SQLite's bound-variable limit
+            for i in range(0, len(uuids), 500):
+                chunk = uuids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"SELECT * FROM user_reactions WHERE uuid IN ({placeholders})", chunk)
+
+                for row in cursor.fetchall():
+                    reactions_by_uuid[row['uuid']] = UserReactions(
+                        uuid=row['uuid'],
+                        emojis=json.loads(row['emojis']),
+                        reaction_mode=row['reaction_mode'],
+                        is_active=bool(row['is_active'])
+                    )
+
+        return reactions_by_uuid
+
     def get_all_user_reactions(self) -> List[UserReactions]:
         """Get all active user reactions."""
         with self._get_connection() as conn:
@@ -721,41 +856,62 @@ class DatabaseManager:
                 VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
             """, (group_id, group_name, is_monitored, member_count))
 
-            return self.get_group(group_id)
+            # Read back on this connection; the write is not committed yet, so get_group's cache could be stale
+            cursor.execute("SELECT * FROM groups WHERE group_id = ?", (group_id,))
+            return self._row_to_group(cursor.fetchone())
 
     def get_group(self, group_id: str) -> Optional[Group]:
-        """Get group by ID."""
-        with self._get_connection() as conn:
+        """Get group by ID.
+
+        Results are cached until the database changes (see get_data_version) or the TTL expires.
+        """
+        return self._group_cache.get_or_load(group_id, self.get_data_version(),
+                                             lambda: self._load_group(group_id))
+
+    def _load_group(self, group_id: str) -> Optional[Group]:
+        """Read a group from the database, bypassing the cache."""
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM groups WHERE group_id = ?", (group_id,))
             row = cursor.fetchone()
-
-            if not row:
-                return None
-
-            # Convert row to dict to handle column names properly
-            row_dict = dict(row)
-            return Group(
-                group_id=row_dict['group_id'],
-                group_name=row_dict.get('group_name'),
-                is_monitored=bool(row_dict.get('is_monitored', 0)),
-                member_count=row_dict.get('member_count', 0),
-                last_synced=datetime.fromisoformat(row_dict['last_synced']) if row_dict.get('last_synced') else None
-            )
+        return self._row_to_group(row) if row else None
+
+    def _row_to_group(self, row: sqlite3.Row) -> Group:
+        """Build a Group from a groups table row."""
+        # Convert row to dict to handle column names properly
+        row_dict = dict(row)
+        return Group(
+            group_id=row_dict['group_id'],
+            group_name=row_dict.get('group_name'),
+            is_monitored=bool(row_dict.get('is_monitored', 0)),
+            member_count=row_dict.get('member_count', 0),
+            last_synced=datetime.fromisoformat(row_dict['last_synced']) if row_dict.get('last_synced') else None
+        )
 
     def get_all_groups(self) -> List[Group]:
         """Get all groups."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT group_id FROM groups ORDER BY is_monitored DESC, group_name")
-            return [self.get_group(row['group_id']) for row in cursor.fetchall()]
+            cursor.execute("SELECT * FROM groups ORDER BY is_monitored DESC, group_name")
+            return [self._row_to_group(row) for row in cursor.fetchall()]
 
     def get_monitored_groups(self) -> List[Group]:
-        """Get groups that are being monitored."""
-        with self._get_connection() as conn:
+        """Get groups that are being monitored.
+
+        The list is cached until the database changes (see get_data_version) or the TTL
+        expires, since every messages page asks for it to build the group filter.
+        """
+        groups = self._monitored_groups_cache.get_or_load(None, self.get_data_version(),
+                                                          self._load_monitored_groups)
+        # Callers may modify the list, so hand out a copy
+        return list(groups)
+
+    def _load_monitored_groups(self) -> List[Group]:
+        """Read the monitored groups from the database, bypassing the cache."""
+        with self._get_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT group_id FROM groups WHERE is_monitored = TRUE")
-            return [self.get_group(row['group_id']) for row in cursor.fetchall()]
+            cursor.execute("SELECT * FROM groups WHERE is_monitored = TRUE")
+            return [self._row_to_group(row) for row in cursor.fetchall()]
 
     def set_group_monitoring(self, group_id: str, is_monitored: bool) -> None:
         """Set group monitoring status."""
@@ -795,10 +951,41 @@ class DatabaseManager:
         """Get all members of a group."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            # Join the users in rather than looking each member up; dangling memberships stay None
             cursor.execute("""
-                SELECT user_uuid FROM group_members WHERE group_id = ?
+                SELECT u.* FROM group_members gm
+                LEFT JOIN users u ON u.uuid = gm.user_uuid
+                WHERE gm.group_id = ?
             """, (group_id,))
-            return [self.get_user(row['user_uuid']) for row in cursor.fetchall()]
+            return [self._row_to_user(row) if row['uuid'] is not None else None
+                    for row in cursor.fetchall()]
+
+    def get_members_for_groups(self, group_ids: List[str]) -> Dict[str, List[Optional[User]]]:
+        """Get members of many groups at once, keyed by group_id."""
+        members_by_group: Dict[str, List[Optional[User]]] = {group_id: [] for group_id in group_ids}
+        if not group_ids:
+            return members_by_group
+
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            # Chunk to stay under SQLite's bound-variable limit
+            for i in range(0, len(group_ids), 500):
+                chunk = group_ids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT gm.group_id AS member_group_id, u.*
+                    FROM group_members gm
+                    LEFT JOIN users u ON u.uuid = gm.user_uuid
+                    WHERE gm.group_id IN ({placeholders})
+                    ORDER BY gm.group_id, gm.user_uuid
+                """, chunk)
+
+                for row in cursor.fetchall():
+                    # Keep dangling memberships as None, like get_group_members
+                    user = self._row_to_user(row) if row['uuid'] is not None else None
+                    members_by_group[row['member_group_id']].append(user)
+
+        return members_by_group
 
     def get_user_groups(self, user_uuid: str) -> List[Group]:
         """Get all groups a user is a member of."""
@@ -821,6 +1008,35 @@ class DatabaseManager:
                 groups.append(group)
             return groups
 
+    def get_groups_for_uuids(self, uuids: List[str]) -> Dict[str, List[Group]]:
+        """Get the groups of many users at once, keyed by user uuid."""
+        groups_by_uuid: Dict[str, List[Group]] = {uuid: [] for uuid in uuids}
+        if not uuids:
+            return groups_by_uuid
+
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            # Chunk to stay under SQLite's bound-variable limit
+            for i in range(0, len(uuids), 500):
+                chunk = uuids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT gm.user_uuid, g.* FROM groups g
+                    JOIN group_members gm ON g.group_id = gm.group_id
+                    WHERE gm.user_uuid IN ({placeholders})
+                    ORDER BY gm.user_uuid, gm.group_id
+                """, chunk)
+
+                for row in cursor.fetchall():
+                    groups_by_uuid[row['user_uuid']].append(Group(
+                        group_id=row['group_id'],
+                        group_name=row['group_name'],
+                        is_monitored=bool(row['is_monitored']),
+                        member_count=row['member_count']
+                    ))
+
+        return groups_by_uuid
+
     def sync_group_members(self, group_id: str, member_uuids: List[str]) -> None:
         """Sync group membership (replace all members)."""
         with self._get_connection() as conn:
@@ -1182,6 +1398,38 @@ class DatabaseManager:
                 'recent_messages_24h': recent_messages
             }
 
+    def get_data_version(self) -> str:
+        """Cheap stamp that changes whenever any connection commits (main file + WAL mtime/size)."""
+        # File times can be coarse, so also count this process's own writing commits exactly
+        parts = [f"{self._commit_count:x}"]
+        for path in (self.db_path, self.db_path.with_name(self.db_path.name + '-wal')):
+            try:
+                st = path.stat()
+                parts.append(f"{st.st_mtime_ns:x}.{st.st_size:x}")
+            except OSError:
+                parts.append('0')
+        return '-'.join(parts)
+
+
+    def get_combined_stats(self, start_of_today_ms: int) -> Dict[str, Any]:
+        """Get message, user and group statistics for the stats API in a single query.
+
+        Args:
+            start_of_today_ms: Start of the current day in the user's timezone (UTC milliseconds)
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM messages) as total_messages,
+                    (SELECT COUNT(*) FROM messages WHERE timestamp >= ?) as messages_today,
+                    (SELECT COUNT(DISTINCT group_id) FROM messages
+                     WHERE timestamp > (strftime('%s', 'now') - 86400) * 1000) as active_groups,
+                    (SELECT COUNT(*) FROM users) as total_users,
+                    (SELECT COUNT(*) FROM groups) as total_groups,
+                    (SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()) as database_size
+            """, (start_of_today_ms,))
+            return dict(cursor.fetchone())
 
     # Sentiment Analysis Methods
     def get_sentiment_analysis(self, group_id: str, analysis_date: date) -> Optional[str]:
@@ -1195,6 +1443,17 @@ class DatabaseManager:
             row = cursor.fetchone()
             return row['analysis_result'] if row else None
 
+    def get_sentiment_analysis_record(self, group_id: str, analysis_date: date) -> Optional[Dict[str, Any]]:
+        """Get the stored sentiment analysis for a group and date with its message count and creation time."""
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT analysis_result, message_count, created_at FROM sentiment_analysis
+                WHERE group_id = ? AND analysis_date = ?
+            """, (group_id, analysis_date.strftime('%Y-%m-%d')))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
     def store_sentiment_analysis(self, group_id: str, analysis_date: date,
                                 message_count: int, analysis_result: str) -> None:
         """Store sentiment analysis result."""
@@ -1277,9 +1536,7 @@ class DatabaseManager:
 
             if user_timezone:
                 try:
-                    import zoneinfo
-                    from datetime import datetime
-                    tz = zoneinfo.ZoneInfo(user_timezone)
+                    tz = _get_zone(user_timezone)
                     start_of_day = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=tz)
                     offset_seconds = tz.utcoffset(start_of_day).total_seconds()
 
@@ -1331,6 +1588,101 @@ class DatabaseManager:
 
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_hourly_activity(self, group_id: Optional[str] = None,
+                            sender_uuid: Optional[str] = None,
+                            start_date: Optional[str] = None,
+                            end_date: Optional[str] = None,
+                            user_timezone: Optional[str] = None,
+                            attachments_only: bool = False,
+                            monitored_only: bool = True) -> List[int]:
+        """Get message counts per hour of day (user's local time) as a 24-slot list.
+
+        Uses the standard message filters; the bucketing is a single SQL GROUP BY.
+        """
+        offset_seconds = self._hour_offset_seconds(user_timezone, start_date)
+
+        where_conditions, params = self._build_message_query_filters(
+            group_id=group_id,
+            sender_uuid=sender_uuid,
+            start_date=start_date,
+            end_date=end_date,
+            user_timezone=user_timezone,
+            attachments_only=attachments_only,
+            monitored_only=monitored_only
+        )
+        where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT
+                    CAST((m.timestamp / 1000 + ?) / 3600 % 24 AS INTEGER) as hour,
+                    COUNT(*) as message_count
+                FROM messages m
+                {where_clause}
+                GROUP BY hour
+            """, [offset_seconds] + params)
+
+            counts = [0] * 24
+            for row in cursor.fetchall():
+                counts[row['hour']] = row['message_count']
+            return counts
+
+    def get_hourly_activity_by_group(self, group_id: Optional[str] = None,
+                                     sender_uuid: Optional[str] = None,
+                                     start_date: Optional[str] = None,
+                                     end_date: Optional[str] = None,
+                                     user_timezone: Optional[str] = None,
+                                     attachments_only: bool = False) -> Dict[str, List[int]]:
+        """Get get_hourly_activity's 24-slot lists for every monitored group (or just group_id) in one query.
+
+        Groups with no matching messages are absent from the result.
+        """
+        offset_seconds = self._hour_offset_seconds(user_timezone, start_date)
+
+        where_conditions, params = self._build_message_query_filters(
+            group_id=group_id,
+            sender_uuid=sender_uuid,
+            start_date=start_date,
+            end_date=end_date,
+            user_timezone=user_timezone,
+            attachments_only=attachments_only,
+            monitored_only=not group_id  # If no specific group, show only monitored
+        )
+        where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT
+                    m.group_id,
+                    CAST((m.timestamp / 1000 + ?) / 3600 % 24 AS INTEGER) as hour,
+                    COUNT(*) as message_count
+                FROM messages m
+                {where_clause}
+                GROUP BY m.group_id, hour
+            """, [offset_seconds] + params)
+
+            counts_by_group: Dict[str, List[int]] = {}
+            for row in cursor.fetchall():
+                counts_by_group.setdefault(row['group_id'], [0] * 24)[row['hour']] = row['message_count']
+            return counts_by_group
+
+    def _hour_offset_seconds(self, user_timezone: Optional[str], start_date: Optional[str]) -> float:
+        """Get the UTC offset used to bucket timestamps into the user's local hours."""
+        if not user_timezone:
+            return 0
+        try:
+            tz = _get_zone(user_timezone)
+            if start_date:
+                reference = datetime.combine(date.fromisoformat(start_date), datetime.min.time()).replace(tzinfo=tz)
+            else:
+                reference = datetime.now(tz)
+            return tz.utcoffset(reference).total_seconds()
+        except Exception:
+            # Fall back to UTC buckets if the timezone is unknown
+            return 0
+
     def get_group_activity_summary(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get activity summary for groups over the last N days."""
         with self._get_connection() as conn:
@@ -1607,6 +1959,32 @@ class DatabaseManager:
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
 
+    def get_attachments_for_messages(self, message_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Get attachment metadata (no file_data) for many messages at once, keyed by message id."""
+        attachments_by_message: Dict[int, List[Dict[str, Any]]] = {message_id: [] for message_id in message_ids}
+        if not message_ids:
+            return attachments_by_message
+
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            # Chunk to stay under SQLite's bound-variable limit
+            for i in range(0, len(message_ids), 500):
+                chunk = message_ids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(f"""
+                    SELECT message_id, id, attachment_id, filename, content_type, file_size,
+                           file_path, downloaded_at, pack_id, sticker_id
+                    FROM attachments
+                    WHERE message_id IN ({placeholders})
+                    ORDER BY message_id, downloaded_at
+                """, chunk)
+
+                for row in cursor.fetchall():
+                    attachment = dict(row)
+                    attachments_by_message[attachment.pop('message_id')].append(attachment)
+
+        return attachments_by_message
+
     def get_messages_with_attachments(self, group_id: Optional[str] = None,
                                     limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """Get messages with their attachments included."""
@@ -1639,12 +2017,18 @@ class DatabaseManager:
                                                  start_date: Optional[str] = None,
                                                  end_date: Optional[str] = None,
                                                  user_timezone: Optional[str] = None,
-                                                 limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+                                                 limit: int = 100, offset: int = 0,
+                                                 before: Optional[Tuple[int, int]] = None,
+                                                 after: Optional[Tuple[int, int]] = None,
+                                                 displayable_only: bool = False) -> List[Dict[str, Any]]:
         """Get messages with proper server-side filtering including attachments and date ranges.
 
         Args:
             start_date: Start date in YYYY-MM-DD format (inclusive)
             end_date: End date in YYYY-MM-DD format (inclusive)
+            before: Keyset cursor (timestamp, id); return the messages just older than it
+            after: Keyset cursor (timestamp, id); return the messages just newer than it
+            displayable_only: Skip messages with neither text nor attachments
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -1670,58 +2054,133 @@ class DatabaseManager:
                 end_date=end_date,
                 user_timezone=user_timezone,
                 attachments_only=attachments_only,
-                monitored_only=not group_id  # If no specific group, show only monitored
+                monitored_only=not group_id,  # If no specific group, show only monitored
+                displayable_only=displayable_only
             )
 
+            # Keyset pagination: seek past the cursor row instead of skipping OFFSET rows
+            order = "DESC"
+            if before:
+                where_conditions.append("(m.timestamp < ? OR (m.timestamp = ? AND m.id < ?))")
+                params.extend([before[0], before[0], before[1]])
+            elif after:
+                where_conditions.append("(m.timestamp > ? OR (m.timestamp = ? AND m.id > ?))")
+                params.extend([after[0], after[0], after[1]])
+                order = "ASC"
+
             where_clause = ""
             if where_conditions:
                 where_clause = "WHERE " + " AND ".join(where_conditions)
 
+            # Pick the page from messages alone, then join names onto just those rows;
+            # joining first made SQLite look up both names for every match before sorting
             query = f"""
                 SELECT {', '.join(base_columns)}
-                FROM messages m
+                FROM (
+                    SELECT m.* FROM messages m
+                    {where_clause}
+                    ORDER BY m.timestamp {order}, m.id {order}
+                    LIMIT ? OFFSET ?
+                ) m
                 LEFT JOIN groups g ON m.group_id = g.group_id
                 LEFT JOIN users u ON m.sender_uuid = u.uuid
-                {where_clause}
-                ORDER BY m.timestamp DESC
-                LIMIT ? OFFSET ?
+                ORDER BY m.timestamp {order}, m.id {order}
             """
 
             params.extend([limit, offset])
             cursor.execute(query, params)
             rows = cursor.fetchall()
+            if order == "ASC":
+                # Walking forward from an "after" cursor; hand back newest first like every other page
+                rows.reverse()
 
-            # Get attachments for each message
-            messages = []
-            for row in rows:
-                message = dict(row)
-                # Get attachments for this specific message
-                cursor.execute("""
-                    SELECT id FROM messages
-                    WHERE timestamp = ? AND group_id = ? AND sender_uuid = ?
-                    LIMIT 1
-                """, (message['timestamp'], message['group_id'], message['sender']))
-                msg_row = cursor.fetchone()
-                if msg_row:
-                    message['attachments'] = self.get_message_attachments(msg_row['id'])
-                else:
-                    message['attachments'] = []
-                messages.append(message)
+        # One query for every message's attachments instead of two per message
+        messages = [dict(row) for row in rows]
+        attachments_by_message = self.get_attachments_for_messages([message['id'] for message in messages])
+        for message in messages:
+            message['attachments'] = attachments_by_message[message['id']]
 
-            return messages
+        return messages
 
     def get_message_count_filtered(self, group_id: Optional[str] = None,
                                   sender_uuid: Optional[str] = None,
                                   attachments_only: bool = False,
                                   start_date: Optional[str] = None,
                                   end_date: Optional[str] = None,
-                                  user_timezone: Optional[str] = None) -> int:
+                                  user_timezone: Optional[str] = None,
+                                  displayable_only: bool = False) -> int:
         """Get count of messages with proper server-side filtering including attachments and date ranges.
 
+        Counts are cached until the database changes (see get_data_version) or the TTL expires,
+        so page loads do not re-run COUNT(*) over an unchanged table.
+
         Args:
             start_date: Start date in YYYY-MM-DD format (inclusive)
             end_date: End date in YYYY-MM-DD format (inclusive)
+            displayable_only: Skip messages with neither text nor attachments
+        """
+        key = (group_id, sender_uuid, attachments_only, start_date, end_date, user_timezone, displayable_only)
+        return self._count_cache.get_or_load(
+            key, self.get_data_version(),
+            lambda: self._count_messages_filtered(group_id, sender_uuid, attachments_only,
+                                                  start_date, end_date, user_timezone, displayable_only))
+
+    def get_message_counts_by_group_filtered(self, group_id: Optional[str] = None,
+                                             sender_uuid: Optional[str] = None,
+                                             attachments_only: bool = False,
+                                             start_date: Optional[str] = None,
+                                             end_date: Optional[str] = None,
+                                             user_timezone: Optional[str] = None) -> Dict[str, int]:
+        """Get get_message_count_filtered for every monitored group (or just group_id) in one query.
+
+        Groups with no matching messages are absent from the result.
         """
+        return self._count_messages_grouped('m.group_id', group_id, sender_uuid, attachments_only,
+                                            start_date, end_date, user_timezone)
+
+    def get_message_counts_by_sender_filtered(self, group_id: Optional[str] = None,
+                                              sender_uuid: Optional[str] = None,
+                                              attachments_only: bool = False,
+                                              start_date: Optional[str] = None,
+                                              end_date: Optional[str] = None,
+                                              user_timezone: Optional[str] = None) -> Dict[str, int]:
+        """Get get_message_count_filtered for every sender in one query.
+
+        Senders with no matching messages are absent from the result.
+        """
+        return self._count_messages_grouped('m.sender_uuid', group_id, sender_uuid, attachments_only,
+                                            start_date, end_date, user_timezone)
+
+    def _count_messages_grouped(self, column: str, group_id: Optional[str], sender_uuid: Optional[str],
+                                attachments_only: bool, start_date: Optional[str],
+                                end_date: Optional[str], user_timezone: Optional[str]) -> Dict[str, int]:
+        """Run _count_messages_filtered's COUNT(*) grouped by a messages column."""
+        where_conditions, params = self._build_message_query_filters(
+            group_id=group_id,
+            sender_uuid=sender_uuid,
+            start_date=start_date,
+            end_date=end_date,
+            user_timezone=user_timezone,
+            attachments_only=attachments_only,
+            monitored_only=not group_id  # If no specific group, show only monitored
+        )
+        where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+
+        with self._get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {column} as key, COUNT(*) as total
+                FROM messages m
+                {where_clause}
+                GROUP BY {column}
+            """, params)
+            return {row['key']: row['total'] for row in cursor.fetchall()}
+
+    def _count_messages_filtered(self, group_id: Optional[str], sender_uuid: Optional[str],
+                                 attachments_only: bool, start_date: Optional[str],
+                                 end_date: Optional[str], user_timezone: Optional[str],
+                                 displayable_only: bool = False) -> int:
+        """Run the COUNT(*) behind get_message_count_filtered."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
@@ -1734,7 +2193,8 @@ class DatabaseManager:
                 end_date=end_date,
                 user_timezone=user_timezone,
                 attachments_only=attachments_only,
-                monitored_only=not group_id  # If no specific group, show only monitored
+                monitored_only=not group_id,  # If no specific group, show only monitored
+                displayable_only=displayable_only
             )
 
             where_clause = ""
@@ -1837,38 +2297,7 @@ class DatabaseManager:
 
         This ensures consistent date filtering across all methods.
         """
-        import datetime
-
-        if user_timezone:
-            try:
-                import zoneinfo
-                # Parse date and create start/end of day in user's timezone
-                target_date = datetime.date.fromisoformat(date_str)
-                tz = zoneinfo.ZoneInfo(user_timezone)
-
-                # Create start and end of day in user's timezone
-                start_of_day = datetime.datetime.combine(target_date, datetime.datetime.min.time()).replace(tzinfo=tz)
-                end_of_day = datetime.datetime.combine(target_date, datetime.datetime.max.time()).replace(tzinfo=tz)
-
-                # Convert to UTC timestamps (milliseconds)
-                start_timestamp = int(start_of_day.timestamp() * 1000)
-                end_timestamp = int(end_of_day.timestamp() * 1000)
-
-                return start_timestamp, end_timestamp
-            except Exception:
-                # Fall back to UTC if timezone conversion fails
-                pass
-
-        # Original UTC-based logic as fallback
-        start_dt = datetime.datetime.strptime(date_str, '%Y-%m-%d')
-        start_dt = start_dt.replace(tzinfo=datetime.timezone.utc)
-        start_timestamp = int(start_dt.timestamp() * 1000)
-
-        # Create end of day in UTC
-        end_dt = start_dt.replace(hour=23, minute=59, second=59, microsecond=999000)
-        end_timestamp = int(end_dt.timestamp() * 1000)
-
-        return start_timestamp, end_timestamp
+        return _day_bounds_ms(date_str, user_timezone)
 
     def is_bot_running(self, max_heartbeat_age_minutes: int = 5) -> bool:
         """Check if bot is currently running based on recent heartbeat."""
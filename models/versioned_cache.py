@@ -0,0 +1,42 @@
+"""
+Data-versioned caching for the database layer.
+
+Keeps query results tagged with the database data version they were read
+under, so any commit invalidates them, with a TTL as a safety net.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class VersionedCache:
+    """Bounded, lock-protected cache whose entries expire when the data version changes or the TTL passes."""
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (data version, expiry, value); dicts keep insertion order, so the first key is the oldest
+        self._entries: Dict[Hashable, Tuple[str, float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, version: str, load: Callable[[], T]) -> T:
+        """Get the value cached for key under this data version, calling load() on a miss.
+
+        load() runs outside the lock, so concurrent misses may each run it; the last one is kept.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] == version and entry[1] > now:
+            return entry[2]
+
+        value = load()
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (version, now + self.ttl, value)
+        return value
@@ -7,11 +7,14 @@ summarization and sentiment services.
 """
 
 import json
+import threading
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from .ai_provider import get_ai_response, get_ai_status
 from utils.logging import get_logger
 
+_markdown_local = threading.local()
+
 
 class AIAnalysisService:
     """Unified service for all AI-powered message analysis."""
@@ -321,9 +324,13 @@ class AIAnalysisService:
         try:
             # Try to import markdown library
             import markdown
-            # Configure markdown with useful extensions
-            md = markdown.Markdown(extensions=['tables', 'fenced_code', 'nl2br'])
-            return md.convert(text)
+            # Reuse one configured instance per thread; building it is the expensive part
+            md = getattr(_markdown_local, 'md', None)
+            if md is None:
+                # Configure markdown with useful extensions
+                md = markdown.Markdown(extensions=['tables', 'fenced_code', 'nl2br'])
+                _markdown_local.md = md
+            return md.reset().convert(text)
         except ImportError:
             # Fallback to basic conversion if markdown library not available
             self.logger.warning("Markdown library not available, using basic conversion")
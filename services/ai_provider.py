@@ -15,6 +15,7 @@ import logging
 import requests
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from config.constants import TIMEOUTS, NETWORK
 from utils.logging import get_logger
@@ -551,8 +552,14 @@ class AIProviderManager:
             'configuration': {}
         }
 
-        for provider in self.providers:
-            provider_info = provider.get_provider_info()
+        # Probe providers concurrently so the slowest one bounds latency, not their sum
+        if self.providers:
+            with ThreadPoolExecutor(max_workers=len(self.providers)) as executor:
+                provider_infos = list(executor.map(lambda p: p.get_provider_info(), self.providers))
+        else:
+            provider_infos = []
+
+        for provider_info in provider_infos:
             status['providers'].append(provider_info)
 
             if provider_info['available'] and status['active_provider'] is None:
@@ -15,6 +15,11 @@ from ..shared.filters import GlobalFilterSystem
 class AIAnalysisPage(BasePage):
     """Unified AI Analysis page."""
 
+    # Analysis types, groups and senders all come from the database; the "today" filter
+    # reads the clock, so cached copies also expire each minute like the messages page
+    etag_from_data = True
+    etag_ttl = 60
+
     def __init__(self, db_manager, setup_service=None, ai_provider=None):
         super().__init__(db_manager, setup_service, ai_provider)
         self.db = db_manager
@@ -194,16 +199,9 @@ class AIAnalysisPage(BasePage):
     def _get_senders_for_group(self, group_id: str) -> List[Dict[str, Any]]:
         """Get senders for a specific group."""
         try:
-            members = self.db.get_group_members(group_id)
-            senders = []
-            for member in members:
-                user = self.db.get_user(member['uuid'])
-                if user:
-                    senders.append({
-                        'uuid': user.uuid,
-                        'friendly_name': user.friendly_name or user.phone_number
-                    })
-            return senders
+            # Members come back as full users already; no per-member lookup needed
+            return [{'uuid': user.uuid, 'friendly_name': user.friendly_name or user.phone_number}
+                    for user in self.db.get_group_members(group_id) if user]
         except Exception as e:
             self.logger.error(f"Error getting senders: {e}")
             return []
@@ -2,7 +2,7 @@
 AI Configuration page for Signal Bot web interface.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from ..shared.base_page import BasePage
 
 
@@ -19,127 +19,9 @@ class AIConfigPage(BasePage):
     def subtitle(self) -> str:
         return "Manage local and external AI providers"
 
-    def get_custom_js(self) -> str:
-        return """
-                function loadConfig() {
-                    fetch('/api/ai-config')
-                        .then(response => response.json())
-                        .then(data => {
-                            document.getElementById('provider').value = data.provider || '';
-                            document.getElementById('model').value = data.model || '';
-                            document.getElementById('api-key').value = data.api_key || '';
-                            document.getElementById('temperature').value = data.temperature || '0.7';
-                            document.getElementById('max-tokens').value = data.max_tokens || '150';
-                            document.getElementById('system-prompt').value = data.system_prompt || '';
-
-                            document.getElementById('sentiment-enabled').checked = data.sentiment_enabled || false;
-                            document.getElementById('summary-enabled').checked = data.summary_enabled || false;
-                            document.getElementById('auto-reactions').checked = data.auto_reactions_enabled || false;
-                        })
-                        .catch(error => {
-                            console.error('Error loading AI config:', error);
-                        });
-                }
-
-                function saveConfig() {
-                    const btn = document.getElementById('save-btn');
-                    const originalText = btn.textContent;
-                    btn.disabled = true;
-                    btn.textContent = 'Saving...';
-
-                    const config = {
-                        provider: document.getElementById('provider').value,
-                        model: document.getElementById('model').value,
-                        api_key: document.getElementById('api-key').value,
-                        temperature: parseFloat(document.getElementById('temperature').value),
-                        max_tokens: parseInt(document.getElementById('max-tokens').value),
-                        system_prompt: document.getElementById('system-prompt').value,
-                        sentiment_enabled: document.getElementById('sentiment-enabled').checked,
-                        summary_enabled: document.getElementById('summary-enabled').checked,
-                        auto_reactions_enabled: document.getElementById('auto-reactions').checked
-                    };
-
-                    fetch('/api/ai-config', {
-                        method: 'POST',
-                        headers: {'Content-Type': 'application/json'},
-                        body: JSON.stringify(config)
-                    })
-                    .then(response => response.json())
-                    .then(data => {
-                        if (data.success) {
-                            showMessage('Configuration saved successfully!', 'success');
-                        } else {
-                            showMessage('Error saving configuration: ' + data.message, 'error');
-                        }
-                    })
-                    .catch(error => {
-                        showMessage('Error saving configuration: ' + error.message, 'error');
-                    })
-                    .finally(() => {
-                        btn.disabled = false;
-                        btn.textContent = originalText;
-                    });
-                }
-
-                function testConnection() {
-                    const btn = document.getElementById('test-btn');
-                    const originalText = btn.textContent;
-                    btn.disabled = true;
-                    btn.textContent = 'Testing...';
-
-                    fetch('/api/ai-config/test', {method: 'POST'})
-                        .then(response => response.json())
-                        .then(data => {
-                            if (data.success) {
-                                showMessage('AI connection test successful!', 'success');
-                            } else {
-                                showMessage('Connection test failed: ' + data.message, 'error');
-                            }
-                        })
-                        .catch(error => {
-                            showMessage('Connection test failed: ' + error.message, 'error');
-                        })
-                        .finally(() => {
-                            btn.disabled = false;
-                            btn.textContent = originalText;
-                        });
-                }
-
-                function showMessage(message, type) {
-                    const messageDiv = document.getElementById('message-area');
-                    messageDiv.innerHTML = `<div class="message ${type}">${message}</div>`;
-                    setTimeout(() => {
-                        messageDiv.innerHTML = '';
-                    }, 5000);
-                }
-
-                function updateModelOptions() {
-                    const provider = document.getElementById('provider').value;
-                    const modelSelect = document.getElementById('model');
-
-                    modelSelect.innerHTML = '<option value="">Select model...</option>';
-
-                    if (provider === 'openai') {
-                        const models = ['gpt-4', 'gpt-4-turbo', 'gpt-3.5-turbo'];
-                        models.forEach(model => {
-                            modelSelect.innerHTML += `<option value="${model}">${model}</option>`;
-                        });
-                    } else if (provider === 'anthropic') {
-                        const models = ['claude-3-opus', 'claude-3-sonnet', 'claude-3-haiku'];
-                        models.forEach(model => {
-                            modelSelect.innerHTML += `<option value="${model}">${model}</option>`;
-                        });
-                    } else if (provider === 'ollama') {
-                        const models = ['llama2', 'mixtral', 'codellama', 'mistral'];
-                        models.forEach(model => {
-                            modelSelect.innerHTML += `<option value="${model}">${model}</option>`;
-                        });
-                    }
-                }
-
-                // Load config when page loads
-                document.addEventListener('DOMContentLoaded', loadConfig);
-        """
+    def get_page_scripts(self) -> List[str]:
+        """Get page-specific JavaScript files."""
+        return ['/static/js/ai-config.js']
 
     def get_custom_css(self) -> str:
         """No custom CSS - using shared styling."""
@@ -15,366 +15,27 @@ from pathlib import Path
 from ..shared.base_page import BasePage
 
 
-class ComprehensiveDashboard(BasePage):
-    """Enhanced dashboard with comprehensive monitoring and statistics."""
-
-    @property
-    def title(self) -> str:
-        return "📊 Dashboard"
-
-    @property
-    def nav_key(self) -> str:
-        return "dashboard"
-
-    @property
-    def subtitle(self) -> str:
-        return "Real-time monitoring, analytics, and control"
-
-    def get_custom_css(self) -> str:
-        """Dashboard-specific CSS for grid and charts."""
-        return """
-        .dashboard-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin: 20px 0;
-        }
-
-        .status-indicator {
-            display: inline-block;
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }
-
-        .status-online { background: #4CAF50; }
-        .status-offline { background: #f44336; }
-        .status-warning { background: #FF9800; }
-
-        .metric {
-            display: flex;
-            justify-content: space-between;
-            margin: 10px 0;
-            padding: 8px 0;
-            border-bottom: 1px solid #f5f5f5;
-        }
-
-        .metric-label {
-            color: #666;
-            font-size: 0.9em;
-        }
-
-        .metric-value {
-            font-weight: bold;
-            color: #333;
-        }
-
-        .metric-value.large {
-            font-size: 1.8em;
-            color: #2196F3;
-        }
-
-        .quick-stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }
-
-        .stat-box {
-            background: #f8f9fa;
-            border: 1px solid #dee2e6;
-            color: #333;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            transition: transform 0.2s;
-        }
-
-        .stat-box:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-
-        .stat-value {
-            font-size: 2.5em;
-            font-weight: bold;
-            margin-bottom: 5px;
-            display: block;
-        }
-
-        .stat-label {
-            font-size: 0.9em;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            opacity: 0.8;
-        }
-
-        .activity-list {
-            max-height: 300px;
-            overflow-y: auto;
-        }
-
-        .activity-item {
-            padding: 10px;
-            border-left: 3px solid #2196F3;
-            margin: 10px 0;
-            background: #f9f9f9;
-        }
-
-        .activity-time {
-            font-size: 0.8em;
-            color: #999;
-        }
-
-        .chart-container {
-            height: 200px;
-            margin: 15px 0;
-        }
-
-        .action-button {
-            background: #2196F3;
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            border-radius: 4px;
-            cursor: pointer;
-            margin: 5px;
-            transition: background 0.3s;
-        }
-
-        .action-button:hover {
-            background: #1976D2;
-        }
-
-        .action-button.danger {
-            background: #f44336;
-        }
-
-        .alert-banner {
-            background: #FFF3E0;
-            border-left: 4px solid #FF9800;
-            padding: 15px;
-            margin: 20px 0;
-            border-radius: 4px;
-        }
-
-        .progress-bar {
-            width: 100%;
-            height: 8px;
-            background: #f0f0f0;
-            border-radius: 4px;
-            overflow: hidden;
-            margin: 10px 0;
-        }
-
-        .progress-fill {
-            height: 100%;
-            background: #4CAF50;
-            transition: width 0.3s;
-        }
-        """
-
-    def get_custom_js(self) -> str:
-        """Enhanced dashboard JavaScript with real-time updates."""
-        return """
-        // Auto-refresh every 30 seconds
-        let refreshInterval;
-
-        function initDashboard() {
-            loadDashboardData();
-            refreshInterval = setInterval(loadDashboardData, 30000);
-            initCharts();
-        }
-
-        function loadDashboardData() {
-            // Get user timezone
-            const timezone = Intl.DateTimeFormat().resolvedOptions().timeZone || 'Asia/Tokyo';
-
-            // Fetch all dashboard data with timezone
-            fetch(`/api/dashboard/comprehensive?timezone=${encodeURIComponent(timezone)}`)
-                .then(response => response.json())
-                .then(data => {
-                    updateSystemStatus(data.system);
-                    updateStatistics(data.statistics);
-                    updateActivity(data.activity);
-                    updateAIStatus(data.ai);
-                    updateBackupStatus(data.backup);
-                    updateAlerts(data.alerts);
-                })
-                .catch(error => {
-                    console.error('Dashboard update failed:', error);
-                });
-        }
-
-        function updateSystemStatus(system) {
-            // Update service statuses
-            document.getElementById('signal-status').className =
-                'status-indicator status-' + (system.signal_service ? 'online' : 'offline');
-            document.getElementById('web-status').className =
-                'status-indicator status-' + (system.web_service ? 'online' : 'offline');
-
-            // Update metrics
-            document.getElementById('uptime').textContent = system.uptime || 'N/A';
-            document.getElementById('cpu-usage').textContent = system.cpu + '%';
-            document.getElementById('memory-usage').textContent = system.memory + ' MB';
-            document.getElementById('db-size').textContent = system.db_size;
-
-            // Update progress bars (cap CPU at 100% for display)
-            document.getElementById('cpu-bar').style.width = Math.min(100, system.cpu) + '%';
-            document.getElementById('memory-bar').style.width = system.memory_percent + '%';
-        }
-
-        function updateStatistics(stats) {
-            // Update stat boxes
-            document.getElementById('total-messages').textContent = stats.total_messages || '0';
-            document.getElementById('active-groups').textContent = stats.active_groups || '0';
-            document.getElementById('total-users').textContent = stats.total_users || '0';
-            document.getElementById('messages-today').textContent = stats.messages_today || '0';
-
-            // Update activity chart
-            if (stats.hourly_activity) {
-                updateActivityChart(stats.hourly_activity);
-            }
-        }
-
-        function updateActivity(activity) {
-            const container = document.getElementById('recent-activity');
-            if (activity && activity.length > 0) {
-                container.innerHTML = activity.map(item => `
-                    <div class="activity-item">
-                        <strong>${item.type}</strong>: ${item.description}
-                        <div class="activity-time">${item.time}</div>
-                    </div>
-                `).join('');
-            }
-        }
-
-        function updateAIStatus(ai) {
-            // Update AI provider status
-            document.getElementById('ai-provider').textContent = ai.provider || 'None';
-            document.getElementById('ai-model').textContent = ai.model || 'N/A';
-            document.getElementById('ai-status').className =
-                'status-indicator status-' + (ai.available ? 'online' : 'offline');
-        }
-
-        function updateBackupStatus(backup) {
-            document.getElementById('last-backup').textContent = backup.last || 'Never';
-            document.getElementById('backup-size').textContent = backup.size || 'N/A';
-            document.getElementById('next-backup').textContent = backup.next || 'Not scheduled';
-        }
-
-        function updateAlerts(alerts) {
-            const container = document.getElementById('alerts-container');
-            if (alerts && alerts.length > 0) {
-                container.innerHTML = alerts.map(alert => `
-                    <div class="alert-banner">
-                        <strong>${alert.title}</strong>: ${alert.message}
-                    </div>
-                `).join('');
-            } else {
-                container.innerHTML = '';
-            }
-        }
-
-        function initCharts() {
-            // Initialize activity chart using simple canvas
-            const canvas = document.getElementById('activity-chart');
-            if (canvas) {
-                // Simple bar chart implementation
-            }
-        }
-
-        // Quick action functions
-        function syncUsers() {
-            executeAction('/api/users/sync', 'Syncing users...');
-        }
-
-        function syncGroups() {
-            executeAction('/api/groups/sync', 'Syncing groups...');
-        }
-
-        function runBackup() {
-            executeAction('/api/backup/quick', 'Creating backup...');
-        }
-
-        function clearCache() {
-            executeAction('/api/cache/clear', 'Clearing cache...');
-        }
-
-        function executeAction(url, message) {
-            const btn = event.target;
-            const originalText = btn.textContent;
-            btn.disabled = true;
-            btn.textContent = message;
-
-            fetch(url, { method: 'POST' })
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success) {
-                        showNotification('Success', data.message || 'Operation completed');
-                        loadDashboardData(); // Refresh
-                    } else {
-                        showNotification('Error', data.error || 'Operation failed');
-                    }
-                })
-                .catch(error => {
-                    showNotification('Error', 'Request failed: ' + error);
-                })
-                .finally(() => {
-                    btn.disabled = false;
-                    btn.textContent = originalText;
-                });
-        }
-
-        function showNotification(title, message) {
-            // Simple notification
-            const notification = document.createElement('div');
-            notification.className = 'alert-banner';
-            notification.innerHTML = `<strong>${title}:</strong> ${message}`;
-            document.getElementById('alerts-container').appendChild(notification);
-
-            setTimeout(() => notification.remove(), 5000);
-        }
-
-        // Initialize on load
-        document.addEventListener('DOMContentLoaded', initDashboard);
-
-        // Cleanup on page unload
-        window.addEventListener('beforeunload', () => {
-            if (refreshInterval) clearInterval(refreshInterval);
-        });
-        """
-
-    def render_content(self, query: Dict[str, Any]) -> str:
-        """Render comprehensive dashboard content."""
-        # Get user timezone
-        user_timezone = self.get_user_timezone(query)
-
-        # Get initial data with timezone
-        data = self.get_dashboard_data(user_timezone)
-
-        return f"""
+# Dashboard body, parsed once at import and filled per request with format_map
+_DASHBOARD_TEMPLATE = """
         <!-- Alerts Section -->
         <div id="alerts-container"></div>
 
         <!-- Quick Stats -->
         <div class="quick-stats">
             <div class="stat-box">
-                <div class="stat-value" id="total-messages">{data['statistics']['total_messages']:,}</div>
+                <div class="stat-value" id="total-messages">{total_messages:,}</div>
                 <div class="stat-label">Total Messages</div>
             </div>
             <div class="stat-box">
-                <div class="stat-value" id="active-groups">{data['statistics']['active_groups']}</div>
+                <div class="stat-value" id="active-groups">{active_groups}</div>
                 <div class="stat-label">Active Groups</div>
             </div>
             <div class="stat-box">
-                <div class="stat-value" id="total-users">{data['statistics']['total_users']}</div>
+                <div class="stat-value" id="total-users">{total_users}</div>
                 <div class="stat-label">Total Users</div>
             </div>
             <div class="stat-box">
-                <div class="stat-value" id="messages-today">{data['statistics']['messages_today']}</div>
+                <div class="stat-value" id="messages-today">{messages_today}</div>
                 <div class="stat-label">Messages Today</div>
             </div>
         </div>
@@ -388,38 +49,38 @@ class ComprehensiveDashboard(BasePage):
                 <div class="metric">
                     <span class="metric-label">Signal Service</span>
                     <span>
-                        <span id="signal-status" class="status-indicator status-{'online' if data['system']['signal_service'] else 'offline'}"></span>
-                        {'Running' if data['system']['signal_service'] else 'Stopped'}
+                        <span id="signal-status" class="status-indicator status-{signal_status}"></span>
+                        {signal_label}
                     </span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Web Server</span>
                     <span>
-                        <span id="web-status" class="status-indicator status-{'online' if data['system']['web_service'] else 'offline'}"></span>
-                        {'Running' if data['system']['web_service'] else 'Stopped'}
+                        <span id="web-status" class="status-indicator status-{web_status}"></span>
+                        {web_label}
                     </span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Uptime</span>
-                    <span class="metric-value" id="uptime">{data['system']['uptime']}</span>
+                    <span class="metric-value" id="uptime">{uptime}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Bot CPU Usage</span>
-                    <span class="metric-value" id="cpu-usage">{data['system']['cpu']}%</span>
+                    <span class="metric-value" id="cpu-usage">{cpu}%</span>
                 </div>
                 <div class="progress-bar">
-                    <div class="progress-fill" id="cpu-bar" style="width: {min(100, data['system']['cpu'])}%"></div>
+                    <div class="progress-fill" id="cpu-bar" style="width: {cpu_bar}%"></div>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Bot Memory</span>
-                    <span class="metric-value" id="memory-usage">{data['system']['memory']} MB</span>
+                    <span class="metric-value" id="memory-usage">{memory} MB</span>
                 </div>
                 <div class="progress-bar">
-                    <div class="progress-fill" id="memory-bar" style="width: {data['system']['memory_percent']}%"></div>
+                    <div class="progress-fill" id="memory-bar" style="width: {memory_percent}%"></div>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Database Size</span>
-                    <span class="metric-value" id="db-size">{data['system']['db_size']}</span>
+                    <span class="metric-value" id="db-size">{db_size}</span>
                 </div>
             </div>
 
@@ -428,36 +89,36 @@ class ComprehensiveDashboard(BasePage):
                 <h3>🤖 AI Integration</h3>
                 <div class="metric">
                     <span class="metric-label">Provider</span>
-                    <span class="metric-value" id="ai-provider">{data['ai']['provider']}</span>
+                    <span class="metric-value" id="ai-provider">{ai_provider}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Model</span>
-                    <span class="metric-value" id="ai-model">{data['ai']['model']}</span>
+                    <span class="metric-value" id="ai-model">{ai_model}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Status</span>
                     <span>
-                        <span id="ai-status" class="status-indicator status-{'online' if data['ai']['available'] else 'offline'}"></span>
-                        {'Available' if data['ai']['available'] else 'Unavailable'}
+                        <span id="ai-status" class="status-indicator status-{ai_status}"></span>
+                        {ai_label}
                     </span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Host</span>
-                    <span class="metric-value" id="ai-host">{data['ai'].get('host', 'N/A')}</span>
+                    <span class="metric-value" id="ai-host">{ai_host}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Response Time</span>
-                    <span class="metric-value" id="ai-response">{data['ai'].get('response_time', 'N/A')}</span>
+                    <span class="metric-value" id="ai-response">{ai_response_time}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Analyses Today</span>
-                    <span class="metric-value" id="ai-analyses">{data['ai'].get('analyses_today', 0)}</span>
+                    <span class="metric-value" id="ai-analyses">{ai_analyses_today}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Model Loaded</span>
                     <span>
-                        <span class="status-indicator status-{'online' if data['ai'].get('model_loaded', False) else 'offline'}"></span>
-                        {'Yes' if data['ai'].get('model_loaded', False) else 'No'}
+                        <span class="status-indicator status-{model_loaded_status}"></span>
+                        {model_loaded_label}
                     </span>
                 </div>
             </div>
@@ -467,19 +128,19 @@ class ComprehensiveDashboard(BasePage):
                 <h3>💾 Database & Backup</h3>
                 <div class="metric">
                     <span class="metric-label">Last Backup</span>
-                    <span class="metric-value" id="last-backup">{data['backup']['last']}</span>
+                    <span class="metric-value" id="last-backup">{backup_last}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Backup Size</span>
-                    <span class="metric-value" id="backup-size">{data['backup']['size']}</span>
+                    <span class="metric-value" id="backup-size">{backup_size}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Next Scheduled</span>
-                    <span class="metric-value" id="next-backup">{data['backup']['next']}</span>
+                    <span class="metric-value" id="next-backup">{backup_next}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Total Backups</span>
-                    <span class="metric-value">{data['backup']['count']}</span>
+                    <span class="metric-value">{backup_count}</span>
                 </div>
             </div>
 
@@ -488,19 +149,19 @@ class ComprehensiveDashboard(BasePage):
                 <h3>📈 Message Statistics</h3>
                 <div class="metric">
                     <span class="metric-label">Last 24 Hours</span>
-                    <span class="metric-value">{data['statistics']['messages_24h']}</span>
+                    <span class="metric-value">{messages_24h}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Last 7 Days</span>
-                    <span class="metric-value">{data['statistics']['messages_7d']}</span>
+                    <span class="metric-value">{messages_7d}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">Average per Day</span>
-                    <span class="metric-value">{data['statistics']['avg_per_day']}</span>
+                    <span class="metric-value">{avg_per_day}</span>
                 </div>
                 <div class="metric">
                     <span class="metric-label">With Attachments</span>
-                    <span class="metric-value">{data['statistics']['with_attachments']}</span>
+                    <span class="metric-value">{with_attachments}</span>
                 </div>
             </div>
 
@@ -508,6 +169,80 @@ class ComprehensiveDashboard(BasePage):
         """
 
 
+class ComprehensiveDashboard(BasePage):
+    """Enhanced dashboard with comprehensive monitoring and statistics."""
+
+    @property
+    def title(self) -> str:
+        return "📊 Dashboard"
+
+    @property
+    def nav_key(self) -> str:
+        return "dashboard"
+
+    @property
+    def subtitle(self) -> str:
+        return "Real-time monitoring, analytics, and control"
+
+    def get_page_stylesheets(self) -> List[str]:
+        """Dashboard-specific CSS for grid and charts."""
+        return ['/static/css/dashboard.css']
+
+    def get_page_scripts(self) -> List[str]:
+        """Get page-specific JavaScript files."""
+        return ['/static/js/dashboard.js']
+
+    def render_content(self, query: Dict[str, Any]) -> str:
+        """Render comprehensive dashboard content."""
+        # Get user timezone
+        user_timezone = self.get_user_timezone(query)
+
+        # Get initial data with timezone
+        data = self.get_dashboard_data(user_timezone)
+
+        return _DASHBOARD_TEMPLATE.format_map(self._template_fields(data))
+
+    def _template_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten dashboard data into the placeholders used by the dashboard template."""
+        stats = data['statistics']
+        system = data['system']
+        ai = data['ai']
+        backup = data['backup']
+        return {
+            'total_messages': stats['total_messages'],
+            'active_groups': stats['active_groups'],
+            'total_users': stats['total_users'],
+            'messages_today': stats['messages_today'],
+            'messages_24h': stats['messages_24h'],
+            'messages_7d': stats['messages_7d'],
+            'avg_per_day': stats['avg_per_day'],
+            'with_attachments': stats['with_attachments'],
+            'signal_status': 'online' if system['signal_service'] else 'offline',
+            'signal_label': 'Running' if system['signal_service'] else 'Stopped',
+            'web_status': 'online' if system['web_service'] else 'offline',
+            'web_label': 'Running' if system['web_service'] else 'Stopped',
+            'uptime': system['uptime'],
+            'cpu': system['cpu'],
+            'cpu_bar': min(100, system['cpu']),
+            'memory': system['memory'],
+            'memory_percent': system['memory_percent'],
+            'db_size': system['db_size'],
+            'ai_provider': ai['provider'],
+            'ai_model': ai['model'],
+            'ai_status': 'online' if ai['available'] else 'offline',
+            'ai_label': 'Available' if ai['available'] else 'Unavailable',
+            'ai_host': ai.get('host', 'N/A'),
+            'ai_response_time': ai.get('response_time', 'N/A'),
+            'ai_analyses_today': ai.get('analyses_today', 0),
+            'model_loaded_status': 'online' if ai.get('model_loaded', False) else 'offline',
+            'model_loaded_label': 'Yes' if ai.get('model_loaded', False) else 'No',
+            'backup_last': backup['last'],
+            'backup_size': backup['size'],
+            'backup_next': backup['next'],
+            'backup_count': backup['count'],
+        }
+
+
     def get_dashboard_data(self, user_timezone: str = 'Asia/Tokyo') -> Dict[str, Any]:
         """Get comprehensive dashboard data."""
         data = {
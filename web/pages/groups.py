@@ -2,11 +2,32 @@
 Groups page for Signal Bot web interface.
 """
 
-from typing import Dict, Any
+import html
+import json
+from typing import Dict, Any, Iterator, List
 from ..shared.base_page import BasePage
 
+# One table row per group; filled with str.format_map so the markup lives in one place
+_GROUP_ROW_TEMPLATE = """
+            <tr>
+                <td><strong>{name_h}</strong></td>
+                <td>{gid_h}</td>
+                <td>{member_count}</td>
+                <td style="max-width: 300px; word-wrap: break-word;">{members_html}</td>
+                <td style="white-space: nowrap;">
+                    <button class="btn" onclick="toggleGroupMonitoring({gid_js}, {monitor_action})">
+                        {monitor_btn}
+                    </button>
+                    {view_messages_btn}
+                </td>
+            </tr>
+            """
+
 
 class GroupsPage(BasePage):
+    # Rendered purely from the users/groups tables
+    etag_from_data = True
+
     @property
     def title(self) -> str:
         return "👥 Groups Management"
@@ -23,142 +44,79 @@ class GroupsPage(BasePage):
         """No custom CSS - using shared styling."""
         return ""
 
-    def get_custom_js(self) -> str:
-        return """
-            function switchTab(tab) {
-                // Navigate to the tab URL like Messages page does
-                window.location.href = '/groups?tab=' + tab;
-            }
-
-            async function toggleGroupMonitoring(groupId, monitor) {
-                try {
-                    const payload = {group_id: groupId, is_monitored: monitor};
-
-                    const response = await fetch('/api/groups/monitor', {
-                        method: 'POST',
-                        headers: {'Content-Type': 'application/json'},
-                        body: JSON.stringify(payload)
-                    });
-
-                    if (response.ok) {
-                        location.reload();
-                    } else {
-                        const errorText = await response.text();
-                        alert('Failed to update group monitoring: ' + errorText);
-                    }
-                } catch (error) {
-                    alert('Error: ' + error.message);
-                }
-            }
-        """
+    def get_page_scripts(self) -> List[str]:
+        """Get page-specific JavaScript files."""
+        return ['/static/js/groups.js']
 
     def render_content(self, query: Dict[str, Any]) -> str:
+        return "".join(self.render_content_chunks(query))
+
+    def render_content_chunks(self, query: Dict[str, Any]) -> Iterator[str]:
+        """Yield the page content, streaming one table row per group."""
         tab = query.get('tab', ['monitored'])[0]
 
         # Get stats for tab labels - filter out groups with 0 members and test groups
         all_groups = self.db.get_all_groups()
         # Filter out groups with 0 members and test groups
         all_groups = [g for g in all_groups if g.member_count > 0 and not (g.group_name and 'test' in g.group_name.lower())]
-        monitored_count = len([g for g in all_groups if g.is_monitored])
-        unmonitored_count = len([g for g in all_groups if not g.is_monitored])
+        monitored_groups = [g for g in all_groups if g.is_monitored]
+        unmonitored_groups = [g for g in all_groups if not g.is_monitored]
 
-        return f"""
+        yield f"""
             <div class="user-tabs">
-                <button class="tab-btn {'active' if tab == 'monitored' else ''}" onclick="switchTab('monitored')">Monitored Groups ({monitored_count})</button>
-                <button class="tab-btn {'active' if tab == 'unmonitored' else ''}" onclick="switchTab('unmonitored')">Unmonitored Groups ({unmonitored_count})</button>
+                <button class="tab-btn {'active' if tab == 'monitored' else ''}" onclick="switchTab('monitored')">Monitored Groups ({len(monitored_groups)})</button>
+                <button class="tab-btn {'active' if tab == 'unmonitored' else ''}" onclick="switchTab('unmonitored')">Unmonitored Groups ({len(unmonitored_groups)})</button>
             </div>
 
             <div id="{tab}-tab" class="tab-content active">
-                {self._render_monitored_tab() if tab == 'monitored' else self._render_unmonitored_tab()}
-            </div>
-        """
-
-    def _render_monitored_tab(self) -> str:
-        """Render the monitored groups tab content."""
-        groups = [g for g in self.db.get_all_groups() if g.is_monitored and g.member_count > 0 and not (g.group_name and 'test' in g.group_name.lower())]
-
-        if not groups:
-            return """
-                <div class="card">
-                    <h3>Monitored Groups</h3>
-                    <p class="text-muted">Groups that the bot is actively monitoring</p>
-                    <div class="no-groups">No monitored groups found. Use the "Unmonitored Groups" tab to enable monitoring.</div>
-                </div>
-            """
-
-        return f"""
-            <div class="card">
-                <h3>Monitored Groups</h3>
-                <p class="text-muted">Groups that the bot is actively monitoring</p>
-                {self._render_groups_table(groups, True)}
+                """
+        if tab == 'monitored':
+            yield from self._iter_groups_tab(monitored_groups, True)
+        else:
+            yield from self._iter_groups_tab(unmonitored_groups, False)
+        yield """
             </div>
         """
 
-    def _render_unmonitored_tab(self) -> str:
-        """Render the unmonitored groups tab content."""
-        groups = [g for g in self.db.get_all_groups() if not g.is_monitored and g.member_count > 0 and not (g.group_name and 'test' in g.group_name.lower())]
-
-        if not groups:
-            return """
-                <div class="card">
-                    <h3>Unmonitored Groups</h3>
-                    <p class="text-muted">Groups that are not being monitored by the bot</p>
-                    <div class="no-groups">No unmonitored groups found. All discovered groups are being monitored.</div>
-                </div>
-            """
-
-        return f"""
+    def _iter_groups_tab(self, groups, is_monitored: bool) -> Iterator[str]:
+        """Yield the monitored or unmonitored groups tab content."""
+        if is_monitored:
+            heading = "Monitored Groups"
+            description = "Groups that the bot is actively monitoring"
+            empty_text = 'No monitored groups found. Use the "Unmonitored Groups" tab to enable monitoring.'
+        else:
+            heading = "Unmonitored Groups"
+            description = "Groups that are not being monitored by the bot"
+            empty_text = "No unmonitored groups found. All discovered groups are being monitored."
+
+        yield f"""
             <div class="card">
-                <h3>Unmonitored Groups</h3>
-                <p class="text-muted">Groups that are not being monitored by the bot</p>
-                {self._render_groups_table(groups, False)}
+                <h3>{heading}</h3>
+                <p class="text-muted">{description}</p>
+                """
+        if groups:
+            yield from self._iter_groups_table(groups, is_monitored)
+        else:
+            yield f'<div class="no-groups">{empty_text}</div>'
+        yield """
             </div>
         """
 
-    def _render_groups_table(self, groups, is_monitored: bool) -> str:
-        """Render a table of groups."""
+    def _iter_groups_table(self, groups, is_monitored: bool) -> Iterator[str]:
+        """Yield a table of groups, one chunk per row."""
         from urllib.parse import quote
 
-        rows_html = ""
-        for group in groups:
-            monitor_btn = "Unmonitor" if is_monitored else "Monitor"
-            monitor_action = "false" if is_monitored else "true"
-
-            # Get members for this group
-            members = self.db.get_group_members(group.group_id)
-            members_html = ""
-            if members:
-                member_details = []
-                for member in members:
-                    detail = self.format_user_display(member)
-                    member_details.append(detail)
-                members_html = "<br>".join(member_details)
-            else:
-                members_html = "No members"
-
-            view_messages_btn = ""
-            if is_monitored:
-                view_messages_btn = f'<a href="/messages?tab=all&group_id={quote(group.group_id)}" class="btn">View Messages</a>'
-
-            # Escape the group ID for JavaScript
-            escaped_group_id = group.group_id.replace("'", "\\'").replace('"', '\\"')
+        # One query for all groups' members instead of one per group
+        members_by_group = self.db.get_members_for_groups([g.group_id for g in groups])
 
-            rows_html += f"""
-            <tr>
-                <td><strong>{group.group_name or 'Unnamed Group'}</strong></td>
-                <td>{group.group_id}</td>
-                <td>{group.member_count}</td>
-                <td style="max-width: 300px; word-wrap: break-word;">{members_html}</td>
-                <td style="white-space: nowrap;">
-                    <button class="btn" onclick="toggleGroupMonitoring('{escaped_group_id}', {monitor_action})">
-                        {monitor_btn}
-                    </button>
-                    {view_messages_btn}
-                </td>
-            </tr>
-            """
+        # The whole table shares one monitoring state, so these row fields are loop-invariant
+        row = {
+            'monitor_btn': "Unmonitor" if is_monitored else "Monitor",
+            'monitor_action': "false" if is_monitored else "true",
+        }
+        view_messages_tpl = '<a href="/messages?tab=all&group_id={}" class="btn">View Messages</a>' if is_monitored else ''
 
-        return f"""
+        yield """
             <table>
                 <thead>
                     <tr>
@@ -170,7 +128,27 @@ class GroupsPage(BasePage):
                     </tr>
                 </thead>
                 <tbody>
-                    {rows_html if rows_html else '<tr><td colspan="5" class="text-center text-muted">No groups found</td></tr>'}
+                    """
+
+        for group in groups:
+            # Get members for this group
+            members = members_by_group.get(group.group_id, [])
+            if members:
+                members_html = "<br>".join([self.format_user_display(member) for member in members])
+            else:
+                members_html = "No members"
+
+            # Escape once per value: HTML text, and a JS string literal inside an attribute
+            row['name_h'] = html.escape(group.group_name or 'Unnamed Group')
+            row['gid_h'] = html.escape(group.group_id)
+            row['gid_js'] = html.escape(json.dumps(group.group_id))
+            row['member_count'] = group.member_count
+            row['members_html'] = members_html
+            row['view_messages_btn'] = view_messages_tpl.format(quote(group.group_id)) if is_monitored else ''
+
+            yield _GROUP_ROW_TEMPLATE.format_map(row)
+
+        yield """
                 </tbody>
             </table>
-        """
\ No newline at end of file
+        """
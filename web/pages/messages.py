@@ -2,8 +2,9 @@
 Messages page for Signal Bot web interface.
 """
 
+import html
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from urllib.parse import quote
 from ..shared.base_page import BasePage
 from ..shared.filters import GlobalFilterSystem
@@ -11,7 +12,136 @@ from ..shared.filters import GlobalFilterSystem
 from models.user_display_utils import get_user_display_sql
 
 
+def _parse_cursor(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse a "<timestamp>_<id>" pagination cursor; None if absent or malformed."""
+    if not value:
+        return None
+    timestamp, _, message_id = value.partition('_')
+    try:
+        return int(timestamp), int(message_id)
+    except ValueError:
+        return None
+
+
+def _parse_page(value: Optional[str], default: int = 1) -> int:
+    """Parse a ?page= number; the default if absent, malformed or below 1."""
+    try:
+        page = int(value)
+    except (TypeError, ValueError):
+        return default
+    return page if page >= 1 else default
+
+
+# Page shell around the active tab; scripts are emitted by the page suffix (get_page_scripts).
+# Split around the tab content so the shell can be sent before the tab is rendered.
+_MESSAGES_PAGE_TEMPLATE = """
+            <!-- Configuration for JavaScript -->
+            <div id="page-config" style="display: none;"
+                 data-timezone="{user_timezone}"
+                 data-group-id="{selected_group_id}"
+                 data-sender-id="{selected_sender_id}"
+                 data-date="{selected_date}"
+                 data-hours="{selected_hours}">
+            </div>
+
+            {global_filters}
+
+            <div class="tabs">
+                <a href="javascript:void(0)" onclick="switchTab('groups')" class="tab-btn {groups_active}">By Group</a>
+                <a href="javascript:void(0)" onclick="switchTab('senders')" class="tab-btn {senders_active}">By Sender</a>
+                <a href="javascript:void(0)" onclick="switchTab('all')" class="tab-btn {all_active}">All Messages</a>
+                <a href="javascript:void(0)" onclick="switchTab('ai-analysis')" class="tab-btn {ai_analysis_active}">AI Analysis</a>
+            </div>
+
+            <div id="{tab}-tab" class="tab-content active">
+                {content}
+            </div>
+        """
+_MESSAGES_PAGE_HEAD, _MESSAGES_PAGE_TAIL = _MESSAGES_PAGE_TEMPLATE.split('{content}')
+
+# By Group / By Sender cards; filled with str.format_map so the markup is parsed once at import
+_GROUP_CARD_TEMPLATE = """
+                <div class="group-card" style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
+                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
+                        <div>
+                            <h4 style="margin: 0 0 5px 0;">{name}</h4>
+                            <p style="margin: 0; color: #666;">{message_count} messages • {member_count} members</p>
+                        </div>
+                        <div style="display: flex; gap: 10px;">
+                            <a href="/messages?{view_params}" class="btn btn-secondary">View Messages</a>
+                        </div>
+                    </div>
+                    {activity_chart}
+                </div>
+                """
+
+_SENDER_CARD_TEMPLATE = """
+                <div class="sender-card" style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
+                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
+                        <div>
+                            <h4 style="margin: 0 0 5px 0;">{name}</h4>
+                            <p style="margin: 0; color: #666;">{message_count} messages • {group_count} groups</p>
+                            <p style="margin: 5px 0 0 0; color: #888; font-size: 0.9em;">{subtitle}</p>
+                            <p style="margin: 5px 0 0 0; color: #888; font-size: 0.85em;">
+                                First: {first_msg} • Last: {last_msg}
+                            </p>
+                        </div>
+                        <div style="display: flex; gap: 10px;">
+                            <a href="/messages?{view_params}" class="btn btn-secondary">View Messages</a>
+                        </div>
+                    </div>
+                    {activity_chart}
+                </div>
+                """
+
+# Hour-of-day chart shared by both tabs: one bar per hour inside the chart container
+_ACTIVITY_BAR_TEMPLATE = """
+                <div class="bar-container" title="{hour:02d}:00 - {count} messages">
+                    <div class="bar" style="height: {height_percent}%; background-color: #007bff; position: relative;">
+                        {count_label}
+                    </div>
+                    <div class="bar-label">{hour:02d}</div>
+                </div>
+                """
+
+_ACTIVITY_CHART_TEMPLATE = """
+            <div class="chart-container">
+                <div class="chart-title">Activity Pattern - {total_count} messages</div>
+                <div class="bar-chart">
+                    {bars}
+                </div>
+            </div>
+            """
+
+_ACTIVITY_COUNT_LABEL = '<span class="bar-count" style="position: absolute; top: -20px; left: 50%; transform: translateX(-50%); font-size: 11px; color: #666; white-space: nowrap;">{}</span>'
+_NO_ACTIVITY_HTML = '<div class="activity-chart" style="padding: 10px; text-align: center; color: #666; font-style: italic;">No activity data available</div>'
+_ACTIVITY_ERROR_HTML = '<div class="activity-chart" style="padding: 10px; text-align: center; color: #666; font-style: italic;">Error loading activity data</div>'
+
+
+def _render_activity_chart(activity_data: List[int]) -> str:
+    """Render 24 hour-of-day message counts as a bar chart."""
+    if not any(activity_data):
+        return _NO_ACTIVITY_HTML
+
+    # Calculate max count for scaling and total count
+    max_count = max(activity_data)
+    bars = []
+    for hour, count in enumerate(activity_data):
+        bars.append(_ACTIVITY_BAR_TEMPLATE.format_map({
+            'hour': hour,
+            'count': count,
+            'height_percent': count / max_count * 100,
+            'count_label': _ACTIVITY_COUNT_LABEL.format(count) if count > 0 else '',
+        }))
+    return _ACTIVITY_CHART_TEMPLATE.format_map({'total_count': sum(activity_data), 'bars': ''.join(bars)})
+
+
 class MessagesPage(BasePage):
+    # Rendered from the database and the query, but "today" filters read the clock,
+    # so cached copies also expire on minute boundaries (which every hour and day start falls on)
+    etag_from_data = True
+    etag_ttl = 60
+
     @property
     def title(self) -> str:
         return "💬 Messages"
@@ -28,82 +158,19 @@ class MessagesPage(BasePage):
         """No custom CSS - using shared styling."""
         return ""
 
-    def get_custom_js(self) -> str:
-        # Include the global filter JavaScript
-        js_code = GlobalFilterSystem.get_javascript()
-
-        # Add page-specific JavaScript
-        js_code += """
-                function showTab(tabName) {
-                    const tabs = document.querySelectorAll('.tab-content');
-                    tabs.forEach(tab => tab.classList.remove('active'));
-
-                    const tabButtons = document.querySelectorAll('.tab-btn');
-                    tabButtons.forEach(btn => btn.classList.remove('active'));
-
-                    document.getElementById(tabName + '-tab').classList.add('active');
-                    event.target.classList.add('active');
-                }
-
-                function switchTab(newTab) {
-                    // Keep current filters when switching tabs
-                    const filters = GlobalFilters.getValues();
-                    const newUrl = new URL('/messages', window.location.origin);
-                    newUrl.searchParams.set('tab', newTab);
-
-                    if (filters.groupId) newUrl.searchParams.set('group_id', filters.groupId);
-                    if (filters.senderId) newUrl.searchParams.set('sender_id', filters.senderId);
-                    if (filters.hours) newUrl.searchParams.set('hours', filters.hours);
-                    if (filters.attachmentsOnly) newUrl.searchParams.set('attachments_only', 'true');
-
-                    // Handle date based on mode
-                    if (filters.dateMode === 'today') {
-                        const today = new Date().toISOString().split('T')[0];
-                        newUrl.searchParams.set('date', today);
-                        newUrl.searchParams.set('date_mode', 'today');
-                    } else if (filters.dateMode === 'specific' && filters.date) {
-                        newUrl.searchParams.set('date', filters.date);
-                        newUrl.searchParams.set('date_mode', 'specific');
-                    } else {
-                        newUrl.searchParams.set('date_mode', 'all');
-                    }
-
-                    window.location.href = newUrl.toString();
-                }
-
-
-                // Initialize default tab
-                document.addEventListener('DOMContentLoaded', function() {
-                    const urlParams = new URLSearchParams(window.location.search);
-                    const tab = urlParams.get('tab') || 'groups';
-
-                    const tabButton = document.querySelector(`[onclick="showTab('${tab}')"]`);
-                    if (tabButton) {
-                        tabButton.classList.add('active');
-                    }
-
-                    const tabContent = document.getElementById(tab + '-tab');
-                    if (tabContent) {
-                        tabContent.classList.add('active');
-                    }
-
-                    // Show/hide member filter based on group selection
-                    const groupFilter = document.getElementById('group-filter');
-                    if (groupFilter) {
-                        groupFilter.addEventListener('change', function() {
-                            const memberContainer = document.getElementById('member-filter-container');
-                            if (memberContainer) {
-                                if (this.value) {
-                                    memberContainer.style.display = 'block';
-                                } else {
-                                    memberContainer.style.display = 'none';
-                                }
-                            }
-                        });
-                    }
-                });
-        """
-        return js_code
+    def get_page_scripts(self) -> List[str]:
+        """Tab scripts, the shared filter module, then this page's wiring - the order they always ran in."""
+        return [
+            '/static/js/messages-common.js',
+            '/static/js/filter-manager.js',
+            '/static/js/groups-tab.js',
+            '/static/js/senders-tab.js',
+            '/static/js/all-tab.js',
+            '/static/js/ai-analysis-messages.js',
+            '/static/js/activity-tab.js',
+            GlobalFilterSystem.SCRIPT,
+            '/static/js/messages-page.js',
+        ]
 
     def _render_global_filters(self, query: Dict[str, Any]) -> str:
         """Render global filter controls using the centralized GlobalFilterSystem."""
@@ -128,10 +195,11 @@ class MessagesPage(BasePage):
         # Format senders for the filter system
         if users:
             senders = []
+            # One grouped count for every sender instead of a COUNT(*) per user
+            message_counts = self.db.get_message_counts_by_sender_filtered()
             for user in users:
                 # Only include users with messages
-                message_count = self.db.get_message_count_filtered(sender_uuid=user.uuid)
-                if message_count > 0:
+                if message_counts.get(user.uuid, 0) > 0:
                     senders.append({
                         'uuid': user.uuid,
                         'friendly_name': user.friendly_name,
@@ -151,19 +219,11 @@ class MessagesPage(BasePage):
         )
 
     def render_content(self, query: Dict[str, Any]) -> str:
-        tab = query.get('tab', ['groups'])[0]
+        return "".join(self.render_content_chunks(query))
 
-        # Render different tab contents based on tab parameter
-        if tab == 'groups':
-            content = self._render_groups_tab(query)
-        elif tab == 'senders':
-            content = self._render_senders_tab(query)
-        elif tab == 'all':
-            content = self._render_all_tab(query)
-        elif tab == 'ai-analysis':
-            content = self._render_ai_analysis_tab(query)
-        else:
-            content = self._render_groups_tab(query)
+    def render_content_chunks(self, query: Dict[str, Any]) -> Iterator[str]:
+        """Yield the page shell, then the active tab; the All and By Sender tabs stream one card at a time."""
+        tab = query.get('tab', ['groups'])[0]
 
         # Generate global filters
         global_filters = self._render_global_filters(query)
@@ -175,38 +235,32 @@ class MessagesPage(BasePage):
         selected_hours = query.get('hours', ['24'])[0]
         user_timezone = self.get_user_timezone(query)
 
-        return f"""
-            <!-- Configuration for JavaScript -->
-            <div id="page-config" style="display: none;"
-                 data-timezone="{user_timezone}"
-                 data-group-id="{selected_group_id}"
-                 data-sender-id="{selected_sender_id}"
-                 data-date="{selected_date}"
-                 data-hours="{selected_hours}">
-            </div>
-
-            {global_filters}
+        # These come straight from the query string, so escape them into the attributes
+        yield _MESSAGES_PAGE_HEAD.format_map({
+            'user_timezone': html.escape(user_timezone),
+            'selected_group_id': html.escape(selected_group_id),
+            'selected_sender_id': html.escape(selected_sender_id),
+            'selected_date': html.escape(selected_date),
+            'selected_hours': html.escape(selected_hours),
+            'global_filters': global_filters,
+            'groups_active': 'active' if tab == 'groups' else '',
+            'senders_active': 'active' if tab == 'senders' else '',
+            'all_active': 'active' if tab == 'all' else '',
+            'ai_analysis_active': 'active' if tab == 'ai-analysis' else '',
+            'tab': tab,
+        })
 
-            <div class="tabs">
-                <a href="javascript:void(0)" onclick="switchTab('groups')" class="tab-btn {'active' if tab == 'groups' else ''}">By Group</a>
-                <a href="javascript:void(0)" onclick="switchTab('senders')" class="tab-btn {'active' if tab == 'senders' else ''}">By Sender</a>
-                <a href="javascript:void(0)" onclick="switchTab('all')" class="tab-btn {'active' if tab == 'all' else ''}">All Messages</a>
-                <a href="javascript:void(0)" onclick="switchTab('ai-analysis')" class="tab-btn {'active' if tab == 'ai-analysis' else ''}">AI Analysis</a>
-            </div>
-
-            <div id="{tab}-tab" class="tab-content active">
-                {content}
-            </div>
+        # Render different tab contents based on tab parameter
+        if tab == 'all':
+            yield from self._iter_all_tab(query)
+        elif tab == 'senders':
+            yield from self._iter_senders_tab(query)
+        elif tab == 'ai-analysis':
+            yield self._render_ai_analysis_tab(query)
+        else:
+            yield self._render_groups_tab(query)
 
-            <!-- External JavaScript Files -->
-            <script src="/static/js/messages-common.js"></script>
-            <script src="/static/js/filter-manager.js"></script>
-            <script src="/static/js/groups-tab.js"></script>
-            <script src="/static/js/senders-tab.js"></script>
-            <script src="/static/js/all-tab.js"></script>
-            <script src="/static/js/ai-analysis-messages.js"></script>
-            <script src="/static/js/activity-tab.js"></script>
-        """
+        yield _MESSAGES_PAGE_TAIL
 
     def _render_groups_tab(self, query: Dict[str, Any]) -> str:
         """Render the By Group tab content."""
@@ -244,7 +298,7 @@ class MessagesPage(BasePage):
         if group_filter:
             monitored_groups = [g for g in monitored_groups if g.group_id == group_filter]
 
-        groups_html = ""
+        group_cards = []
         groups_with_messages = []
 
         # Get date range from filters using centralized logic
@@ -272,25 +326,25 @@ class MessagesPage(BasePage):
             start_date = None
             end_date = None
 
-        for group in monitored_groups:
-            try:
-                # Get message count using the EXISTING database method with proper date handling
-                message_count = self.db.get_message_count_filtered(
-                    group_id=group.group_id,
-                    sender_uuid=sender_filter,
-                    attachments_only=attachments_only,
-                    start_date=start_date,
-                    end_date=end_date,
-                    user_timezone=user_timezone
-                )
-
-                # Only show groups that have messages matching the current filters
-                if message_count > 0:
-                    groups_with_messages.append((group, message_count))
+        # Counts for every monitored group from one grouped query, same filters as get_message_count_filtered
+        try:
+            message_counts = self.db.get_message_counts_by_group_filtered(
+                group_id=group_filter,
+                sender_uuid=sender_filter,
+                attachments_only=attachments_only,
+                start_date=start_date,
+                end_date=end_date,
+                user_timezone=user_timezone
+            )
+        except Exception as e:
+            logging.error(f"Error getting group stats: {e}")
+            message_counts = {}
 
-            except Exception as e:
-                logging.error(f"Error getting group stats: {e}")
-                continue
+        for group in monitored_groups:
+            # Only show groups that have messages matching the current filters
+            message_count = message_counts.get(group.group_id, 0)
+            if message_count > 0:
+                groups_with_messages.append((group, message_count))
 
         # If no groups have matching messages, show appropriate message
         if not groups_with_messages:
@@ -307,167 +361,66 @@ class MessagesPage(BasePage):
                 </div>
                 """
 
+        # Activity charts for all shown groups from one grouped query, with same filters as message count
+        chart_start, chart_end = (date_param, date_param) if date_param else (start_date, end_date)
+        try:
+            activity_by_group = self.db.get_hourly_activity_by_group(
+                group_id=group_filter,
+                sender_uuid=sender_filter,
+                start_date=chart_start,
+                end_date=chart_end,
+                user_timezone=user_timezone,
+                attachments_only=attachments_only
+            )
+        except Exception as e:
+            logging.error(f"Error getting group activity: {e}")
+            activity_by_group = None
+
+        # Filter parameters shared by every View Messages link, built once for all cards
+        view_filters = ''
+        if date_param:
+            view_filters += f"&date={date_param}"
+        if sender_filter:
+            view_filters += f"&sender_uuid={quote(sender_filter)}"
+        if attachments_only:
+            view_filters += "&attachments_only=true"
+
         # Generate HTML for groups with messages
         for group, message_count in groups_with_messages:
             try:
-                # Generate activity chart for this group with same filters as message count
                 activity_chart = self._generate_activity_chart(
                     group.group_id,
-                    date_param,
-                    sender_filter,
-                    attachments_only,
-                    user_timezone,
-                    start_date,
-                    end_date
+                    None if activity_by_group is None else activity_by_group.get(group.group_id, [0] * 24)
                 )
 
-                # Build filter parameters for View Messages link
-                view_params = f"tab=all&group_id={quote(group.group_id)}"
-                if date_param:
-                    view_params += f"&date={date_param}"
-                if sender_filter:
-                    view_params += f"&sender_uuid={quote(sender_filter)}"
-                if attachments_only:
-                    view_params += "&attachments_only=true"
+                view_params = f"tab=all&group_id={quote(group.group_id)}{view_filters}"
 
-                groups_html += f"""
-                <div class="group-card" style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
-                        <div>
-                            <h4 style="margin: 0 0 5px 0;">{group.group_name or 'Unnamed Group'}</h4>
-                            <p style="margin: 0; color: #666;">{message_count} messages • {group.member_count or 0} members</p>
-                        </div>
-                        <div style="display: flex; gap: 10px;">
-                            <a href="/messages?{view_params}" class="btn btn-secondary">View Messages</a>
-                        </div>
-                    </div>
-                    {activity_chart}
-                </div>
-                """
+                group_cards.append(_GROUP_CARD_TEMPLATE.format_map({
+                    'name': html.escape(group.group_name or 'Unnamed Group'),
+                    'message_count': message_count,
+                    'member_count': group.member_count or 0,
+                    'view_params': view_params,
+                    'activity_chart': activity_chart,
+                }))
             except Exception as e:
                 logging.error(f"Error generating group card for {group.group_id}: {e}")
                 continue
 
-        return groups_html
-
-    def _generate_activity_chart(self, group_id: str, date_param: str, sender_filter: str,
-                                attachments_only: bool, user_timezone: str,
-                                start_date: Optional[str] = None, end_date: Optional[str] = None) -> str:
-        """Generate activity chart HTML for a specific group using the same filters as message counts."""
-        try:
-            if date_param:
-                # For specific date, use the hourly counts method
-                from datetime import datetime
-                target_date = datetime.strptime(date_param, '%Y-%m-%d').date()
-                hourly_data = self.db.get_hourly_message_counts(target_date, user_timezone)
-
-                # Filter for this specific group
-                group_data = [d for d in hourly_data if d['group_id'] == group_id]
-
-                # Convert to hour -> count mapping
-                activity_data = {}
-                for entry in group_data:
-                    activity_data[entry['hour']] = entry['message_count']
-            else:
-                # For all dates or date ranges, use filtered message count for each hour
-                # Use the same filter builder as get_message_count_filtered for consistency
-                with self.db._get_connection() as conn:
-                    cursor = conn.cursor()
-
-                    # Use the centralized filter builder for consistency
-                    where_conditions, params = self.db._build_message_query_filters(
-                        group_id=group_id,
-                        sender_uuid=sender_filter,
-                        start_date=start_date,
-                        end_date=end_date,
-                        user_timezone=user_timezone,
-                        attachments_only=attachments_only,
-                        monitored_only=not group_id  # If no specific group, show only monitored
-                    )
-
-                    where_clause = ""
-                    if where_conditions:
-                        where_clause = "WHERE " + " AND ".join(where_conditions)
-
-                    # Get hourly counts across all days with timezone conversion
-                    try:
-                        from zoneinfo import ZoneInfo
-                        from datetime import datetime
-
-                        # Calculate timezone offset for SQL query
-                        tz = ZoneInfo(user_timezone)
-                        now = datetime.now(tz)
-                        offset_seconds = tz.utcoffset(now).total_seconds()
-
-                        cursor.execute(f"""
-                            SELECT
-                                CAST((m.timestamp / 1000 + ?) / 3600 % 24 AS INTEGER) as hour,
-                                COUNT(*) as message_count
-                            FROM messages m
-                            {where_clause}
-                            GROUP BY hour
-                            ORDER BY hour
-                        """, [offset_seconds] + params)
-                    except ImportError:
-                        # Fallback to UTC if zoneinfo not available
-                        cursor.execute(f"""
-                            SELECT
-                                CAST(strftime('%H', datetime(m.timestamp/1000, 'unixepoch')) AS INTEGER) as hour,
-                                COUNT(*) as message_count
-                            FROM messages m
-                            {where_clause}
-                            GROUP BY hour
-                            ORDER BY hour
-                        """, params)
-
-                    activity_data = {}
-                    for row in cursor.fetchall():
-                        activity_data[row['hour']] = row['message_count']
-
-            if not activity_data:
-                return '<div class="activity-chart" style="padding: 10px; text-align: center; color: #666; font-style: italic;">No activity data available</div>'
-
-            # Calculate max count for scaling and total count
-            max_count = max(activity_data.values()) if activity_data else 1
-            total_count = sum(activity_data.values())
-
-            # Generate chart HTML
-            bars_html = ""
-            for hour in range(24):
-                count = activity_data.get(hour, 0)
-                height_percent = (count / max_count * 100) if max_count > 0 else 0
-
-                bars_html += f"""
-                <div class="bar-container" title="{hour:02d}:00 - {count} messages">
-                    <div class="bar" style="height: {height_percent}%; background-color: #007bff; position: relative;">
-                        {'<span class="bar-count" style="position: absolute; top: -20px; left: 50%; transform: translateX(-50%); font-size: 11px; color: #666; white-space: nowrap;">' + str(count) + '</span>' if count > 0 else ''}
-                    </div>
-                    <div class="bar-label">{hour:02d}</div>
-                </div>
-                """
-
-            # Handle multi-day data (if date_param is empty, show stacked view)
-            chart_title = "Activity Pattern"
-            if date_param:
-                chart_title += f" ({date_param}) - {total_count} total messages"
-            elif max_count > 0:
-                chart_title += f" (All Days) - {total_count} total messages"
+        return "".join(group_cards)
 
-            return f"""
-            <div class="chart-container">
-                <div class="chart-title">Activity Pattern - {total_count} messages</div>
-                <div class="bar-chart">
-                    {bars_html}
-                </div>
-            </div>
-            """
+    def _generate_activity_chart(self, group_id: str, activity_data: Optional[List[int]]) -> str:
+        """Generate activity chart HTML for a group from its 24 hour-of-day counts; None if they failed to load."""
+        if activity_data is None:
+            return _ACTIVITY_ERROR_HTML
 
+        try:
+            return _render_activity_chart(activity_data)
         except Exception as e:
             logging.error(f"Error generating activity chart for group {group_id}: {e}")
-            return '<div class="activity-chart" style="padding: 10px; text-align: center; color: #666; font-style: italic;">Error loading activity data</div>'
+            return _ACTIVITY_ERROR_HTML
 
-    def _render_senders_tab(self, query: Dict[str, Any]) -> str:
-        """Render the By Sender tab content."""
+    def _iter_senders_tab(self, query: Dict[str, Any]) -> Iterator[str]:
+        """Yield the By Sender tab one sender card at a time, as each card's activity chart is queried."""
         # Parse filter parameters using GlobalFilterSystem
         filters = GlobalFilterSystem.parse_query_filters(query)
 
@@ -556,24 +509,34 @@ class MessagesPage(BasePage):
 
         except Exception as e:
             logging.error(f"Error getting sender statistics: {e}")
-            return f'<div class="error">Error loading sender statistics: {e}</div>'
+            yield f'<div class="error">Error loading sender statistics: {e}</div>'
+            return
 
         if not sender_stats:
             if sender_filter or group_filter or attachments_only or date_param:
-                return """
+                yield """
                 <div class="no-messages">
                     No senders found matching the current filters. Try adjusting your filters or clearing them to see all senders.
                 </div>
                 """
             else:
-                return """
+                yield """
                 <div class="no-messages">
                     No senders found in monitored groups. Make sure groups are being monitored and have messages.
                 </div>
                 """
+            return
+
+        # Filter parameters shared by every View Messages link, built once for all cards
+        view_filters = ''
+        if date_param:
+            view_filters += f"&date={date_param}"
+        if group_filter:
+            view_filters += f"&group_id={quote(group_filter)}"
+        if attachments_only:
+            view_filters += "&attachments_only=true"
 
         # Generate HTML for each sender
-        senders_html = ""
         for sender in sender_stats:
             try:
                 sender_uuid = sender['sender_uuid']
@@ -606,38 +569,22 @@ class MessagesPage(BasePage):
                     end_date
                 )
 
-                # Build filter parameters for View Messages link
-                view_params = f"tab=all&sender_uuid={quote(sender_uuid)}"
-                if date_param:
-                    view_params += f"&date={date_param}"
-                if group_filter:
-                    view_params += f"&group_id={quote(group_filter)}"
-                if attachments_only:
-                    view_params += "&attachments_only=true"
-
-                senders_html += f"""
-                <div class="sender-card" style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px;">
-                        <div>
-                            <h4 style="margin: 0 0 5px 0;">{sender_name}</h4>
-                            <p style="margin: 0; color: #666;">{message_count} messages • {group_count} groups</p>
-                            <p style="margin: 5px 0 0 0; color: #888; font-size: 0.9em;">{sender_subtitle}</p>
-                            <p style="margin: 5px 0 0 0; color: #888; font-size: 0.85em;">
-                                First: {first_msg} • Last: {last_msg}
-                            </p>
-                        </div>
-                        <div style="display: flex; gap: 10px;">
-                            <a href="/messages?{view_params}" class="btn btn-secondary">View Messages</a>
-                        </div>
-                    </div>
-                    {activity_chart}
-                </div>
-                """
+                view_params = f"tab=all&sender_uuid={quote(sender_uuid)}{view_filters}"
+
+                card = _SENDER_CARD_TEMPLATE.format_map({
+                    'name': html.escape(sender_name or ''),
+                    'message_count': message_count,
+                    'group_count': group_count,
+                    'subtitle': html.escape(sender_subtitle),
+                    'first_msg': first_msg,
+                    'last_msg': last_msg,
+                    'view_params': view_params,
+                    'activity_chart': activity_chart,
+                })
             except Exception as e:
                 logging.error(f"Error generating sender card for {sender_uuid}: {e}")
                 continue
-
-        return senders_html
+            yield card
 
     def _generate_sender_activity_chart(self, sender_uuid: str, date_param: str, group_filter: str,
                                        attachments_only: bool, user_timezone: str,
@@ -645,171 +592,36 @@ class MessagesPage(BasePage):
         """Generate activity chart HTML for a specific sender using the same filters as message counts."""
         try:
             if date_param:
-                # For specific date, get hourly counts for this sender
-                with self.db._get_connection() as conn:
-                    cursor = conn.cursor()
-
-                    # Build conditions for the specific date
-                    conditions = ["m.sender_uuid = ?"]
-                    params = [sender_uuid]
-
-                    if group_filter:
-                        conditions.append("m.group_id = ?")
-                        params.append(group_filter)
-
-                    if attachments_only:
-                        conditions.append("EXISTS (SELECT 1 FROM attachments a WHERE a.message_id = m.id)")
-
-                    # Add date filter with timezone support
-                    conditions.append("DATE(datetime(m.timestamp/1000, 'unixepoch', ?)) = ?")
-                    try:
-                        from zoneinfo import ZoneInfo
-                        from datetime import datetime
-                        tz = ZoneInfo(user_timezone)
-                        now = datetime.now(tz)
-                        offset_hours = int(tz.utcoffset(now).total_seconds() / 3600)
-                        offset_str = f"{'+' if offset_hours >= 0 else ''}{offset_hours} hours"
-                        params.extend([offset_str, date_param])
-                    except:
-                        params.extend(['0 hours', date_param])
-
-                    where_clause = "WHERE " + " AND ".join(conditions)
-
-                    # Get hourly counts with timezone conversion
-                    try:
-                        from zoneinfo import ZoneInfo
-                        from datetime import datetime
-                        tz = ZoneInfo(user_timezone)
-                        now = datetime.now(tz)
-                        offset_seconds = tz.utcoffset(now).total_seconds()
-
-                        cursor.execute(f"""
-                            SELECT
-                                CAST((m.timestamp / 1000 + ?) / 3600 % 24 AS INTEGER) as hour,
-                                COUNT(*) as message_count
-                            FROM messages m
-                            {where_clause}
-                            GROUP BY hour
-                            ORDER BY hour
-                        """, [offset_seconds] + params)
-                    except ImportError:
-                        # Fallback to UTC
-                        cursor.execute(f"""
-                            SELECT
-                                CAST(strftime('%H', datetime(m.timestamp/1000, 'unixepoch')) AS INTEGER) as hour,
-                                COUNT(*) as message_count
-                            FROM messages m
-                            {where_clause}
-                            GROUP BY hour
-                            ORDER BY hour
-                        """, params)
-
-                    activity_data = {}
-                    for row in cursor.fetchall():
-                        activity_data[row['hour']] = row['message_count']
+                # Specific date: bucket that day only, across all groups the sender posts in
+                start_date = end_date = date_param
+                monitored_only = False
             else:
-                # For all dates or date ranges, use the same logic as groups but for sender
-                # Use the same filter builder as get_message_count_filtered for consistency
-                with self.db._get_connection() as conn:
-                    cursor = conn.cursor()
-
-                    # Use the centralized filter builder for consistency
-                    where_conditions, params = self.db._build_message_query_filters(
-                        group_id=group_filter,
-                        sender_uuid=sender_uuid,
-                        start_date=start_date,
-                        end_date=end_date,
-                        user_timezone=user_timezone,
-                        attachments_only=attachments_only,
-                        monitored_only=not group_filter  # If no specific group, show only monitored
-                    )
-
-                    where_clause = ""
-                    if where_conditions:
-                        where_clause = "WHERE " + " AND ".join(where_conditions)
-
-                    # Get hourly counts across all days with timezone conversion
-                    try:
-                        from zoneinfo import ZoneInfo
-                        from datetime import datetime
-
-                        # Calculate timezone offset for SQL query
-                        tz = ZoneInfo(user_timezone)
-                        now = datetime.now(tz)
-                        offset_seconds = tz.utcoffset(now).total_seconds()
-
-                        cursor.execute(f"""
-                            SELECT
-                                CAST((m.timestamp / 1000 + ?) / 3600 % 24 AS INTEGER) as hour,
-                                COUNT(*) as message_count
-                            FROM messages m
-                            {where_clause}
-                            GROUP BY hour
-                            ORDER BY hour
-                        """, [offset_seconds] + params)
-                    except ImportError:
-                        # Fallback to UTC if zoneinfo not available
-                        cursor.execute(f"""
-                            SELECT
-                                CAST(strftime('%H', datetime(m.timestamp/1000, 'unixepoch')) AS INTEGER) as hour,
-                                COUNT(*) as message_count
-                            FROM messages m
-                            {where_clause}
-                            GROUP BY hour
-                            ORDER BY hour
-                        """, params)
-
-                    activity_data = {}
-                    for row in cursor.fetchall():
-                        activity_data[row['hour']] = row['message_count']
-
-            if not activity_data:
-                return '<div class="activity-chart" style="padding: 10px; text-align: center; color: #666; font-style: italic;">No activity data available</div>'
-
-            # Calculate max count for scaling and total count
-            max_count = max(activity_data.values()) if activity_data else 1
-            total_count = sum(activity_data.values())
-
-            # Generate chart HTML using same structure as groups
-            bars_html = ""
-            for hour in range(24):
-                count = activity_data.get(hour, 0)
-                height_percent = (count / max_count * 100) if max_count > 0 else 0
-
-                bars_html += f"""
-                <div class="bar-container" title="{hour:02d}:00 - {count} messages">
-                    <div class="bar" style="height: {height_percent}%; background-color: #007bff; position: relative;">
-                        {'<span class="bar-count" style="position: absolute; top: -20px; left: 50%; transform: translateX(-50%); font-size: 11px; color: #666; white-space: nowrap;">' + str(count) + '</span>' if count > 0 else ''}
-                    </div>
-                    <div class="bar-label">{hour:02d}</div>
-                </div>
-                """
+                monitored_only = not group_filter  # If no specific group, show only monitored
 
-            # Handle multi-day data (if date_param is empty, show stacked view)
-            chart_title = "Activity Pattern"
-            if date_param:
-                chart_title += f" ({date_param}) - {total_count} total messages"
-            elif max_count > 0:
-                chart_title += f" (All Days) - {total_count} total messages"
+            # Hour-of-day buckets from a single GROUP BY query
+            activity_data = self.db.get_hourly_activity(
+                group_id=group_filter,
+                sender_uuid=sender_uuid,
+                start_date=start_date,
+                end_date=end_date,
+                user_timezone=user_timezone,
+                attachments_only=attachments_only,
+                monitored_only=monitored_only
+            )
 
-            return f"""
-            <div class="chart-container">
-                <div class="chart-title">Activity Pattern - {total_count} messages</div>
-                <div class="bar-chart">
-                    {bars_html}
-                </div>
-            </div>
-            """
+            return _render_activity_chart(activity_data)
 
         except Exception as e:
             logging.error(f"Error generating sender activity chart for {sender_uuid}: {e}")
-            return '<div class="activity-chart" style="padding: 10px; text-align: center; color: #666; font-style: italic;">Error loading activity data</div>'
+            return _ACTIVITY_ERROR_HTML
 
-    def _render_all_tab(self, query: Dict[str, Any]) -> str:
-        """Render the All Messages tab content."""
-        page = int(query.get('page', [1])[0])
+    def _iter_all_tab(self, query: Dict[str, Any]) -> Iterator[str]:
+        """Yield the All Messages tab content, one chunk per message card."""
+        page = _parse_page(query.get('page', [None])[0])
         per_page = 50
-        offset = (page - 1) * per_page
+        # Keyset cursors from Previous/Next links; bare ?page=N links still fall back to OFFSET
+        before = _parse_cursor(query.get('before', [None])[0])
+        after = None if before else _parse_cursor(query.get('after', [None])[0])
 
         # Parse filters using GlobalFilterSystem for consistency
         filters = GlobalFilterSystem.parse_query_filters(query)
@@ -848,43 +660,93 @@ class MessagesPage(BasePage):
         # Get messages using database filtering
         user_timezone = self.get_user_timezone(query)
         try:
-            messages = self.db.get_messages_by_group_with_names_filtered(
+            total_messages = self.db.get_message_count_filtered(
                 group_id=group_filter,
                 sender_uuid=sender_filter,  # Database still uses sender_uuid
                 attachments_only=attachments_only,
                 start_date=start_date,
                 end_date=end_date,
                 user_timezone=user_timezone,
-                limit=per_page,
-                offset=offset
+                displayable_only=True  # Count only what the cards below will show
             )
-            total_messages = self.db.get_message_count_filtered(
+            # Clamp before computing OFFSET so a huge ?page= cannot make SQLite skip millions of rows
+            total_pages = max(1, (total_messages + per_page - 1) // per_page)
+            page = min(page, total_pages)
+            offset = 0 if before or after else (page - 1) * per_page
+
+            messages = self.db.get_messages_by_group_with_names_filtered(
                 group_id=group_filter,
                 sender_uuid=sender_filter,  # Database still uses sender_uuid
                 attachments_only=attachments_only,
                 start_date=start_date,
                 end_date=end_date,
-                user_timezone=user_timezone
+                user_timezone=user_timezone,
+                limit=per_page + 1,  # One extra row tells us whether another page exists
+                offset=offset,
+                before=before,
+                after=after,
+                displayable_only=True  # Blank messages are filtered here so every page is full
             )
         except Exception as e:
-            return f'<div class="error">Database error: {e}</div>'
+            yield f'<div class="error">Database error: {e}</div>'
+            return
+
+        more = len(messages) > per_page
+        if after:
+            # Rows come back newest first, so the extra one is the newest
+            messages = messages[-per_page:]
+            has_newer, has_older = more, True
+            if not has_newer:
+                page = 1
+        else:
+            messages = messages[:per_page]
+            has_newer, has_older = page > 1 or before is not None, more
+
+        # Pagination
+        filter_param = ""
+        if group_filter:
+            filter_param += f"&group_id={quote(group_filter)}"
+        if sender_filter:
+            filter_param += f"&sender_uuid={quote(sender_filter)}"
+        if attachments_only:
+            filter_param += "&attachments_only=true"
+        if start_date:
+            filter_param += f"&start_date={quote(start_date)}"
+        if end_date:
+            filter_param += f"&end_date={quote(end_date)}"
 
-        total_pages = max(1, (total_messages + per_page - 1) // per_page)
+        pagination_html = ""
+        if messages and (has_newer or has_older):
+            # Cursors point at the first/last row shown, so each page is one index seek
+            first, last = messages[0], messages[-1]
+            pagination_parts = ['<div class="pagination">']
+            if has_newer:
+                pagination_parts.append(f'<a href="/messages?tab=all&page={max(1, page-1)}&after={first["timestamp"]}_{first["id"]}{filter_param}" class="page-btn">← Previous</a>')
+            pagination_parts.append(f'<span class="page-btn current">{page}</span>')
+            if has_older:
+                pagination_parts.append(f'<a href="/messages?tab=all&page={page+1}&before={last["timestamp"]}_{last["id"]}{filter_param}" class="page-btn">Next →</a>')
+            pagination_parts.append('</div>')
+            pagination_html = "".join(pagination_parts)
+
+        # Stats and pagination only need the page bounds, so they go out before the cards
+        yield f"""
+            <div class="stats">
+                <div><strong>Total Messages:</strong> {total_messages}</div>
+                <div><strong>Page:</strong> {page} of {total_pages}</div>
+            </div>
 
-        # Get monitored groups for filter dropdown
-        monitored_groups = self.db.get_monitored_groups()
+
+            <div class="messages-container">
+                """
 
         # Build messages HTML
-        messages_html = ""
         if not messages:
-            messages_html = '<div class="no-messages">No messages found</div>'
+            yield '<div class="no-messages">No messages found</div>'
         else:
             for msg in messages:
-                message_text = msg.get('message_text', '')
-                # Don't skip messages with attachments even if text is empty
-                attachments = msg.get('attachments', [])
-                if (not message_text or message_text.strip() == '') and not attachments:
-                    continue
+                # Rows always carry every column, so read each field once by key
+                message_text = msg['message_text'] or ''
+                attachments = msg['attachments']
 
                 # Handle empty message text for attachment-only messages
                 if not message_text and attachments:
@@ -893,48 +755,46 @@ class MessagesPage(BasePage):
                     message_text = message_text[:200] + '...'
 
                 # Process mentions in message text
-                message_id = msg.get('id')
-                message_text = self._process_mentions(message_text, message_id)
+                message_text = self._process_mentions(message_text, msg['id'])
 
                 # Format timestamp using server-side formatting with user timezone
-                timestamp_ms = msg.get('timestamp')
-                timestamp_display = self.format_timestamp(timestamp_ms, user_timezone)
+                timestamp_display = self.format_timestamp(msg['timestamp'], user_timezone)
 
                 # Get attachments and build attachment HTML
                 attachments_html = ""
-                attachments = msg.get('attachments', [])
                 if attachments:
-                    attachments_html = '<div class="attachments">'
+                    attachment_parts = ['<div class="attachments">']
                     for attachment in attachments:
-                        attachment_id = attachment.get('attachment_id', '')
-                        file_name = attachment.get('file_name', attachment.get('filename', 'Unknown'))
-                        content_type = attachment.get('content_type', '')
-                        sticker_id = attachment.get('sticker_id', '')
+                        attachment_id = html.escape(attachment['attachment_id'] or '')
+                        file_name = html.escape(attachment['filename'] or '')
+                        content_type = attachment['content_type'] or ''
+                        sticker_id = html.escape(attachment['sticker_id'] or '')
                         # Check if it's a sticker
-                        is_sticker = content_type == 'sticker' or attachment.get('pack_id') or sticker_id
+                        is_sticker = content_type == 'sticker' or attachment['pack_id'] or sticker_id
                         if is_sticker:
                             # Display sticker (stickers are usually WebP images)
                             # Use sticker_id if attachment_id is not available
                             display_id = attachment_id or sticker_id
                             if display_id:
                                 # Try to display as image - the server will check if file_data exists
-                                attachments_html += f'<img src="/attachment/{display_id}" alt="Sticker" class="attachment-sticker" style="max-width: 150px; max-height: 150px; margin: 5px;" onerror="this.style.display=\'none\'; this.nextElementSibling.style.display=\'inline-block\';">'
+                                attachment_parts.append(f'<img src="/attachment/{display_id}?w=150" srcset="/attachment/{display_id}?w=150 1x, /attachment/{display_id}?w=300 2x" loading="lazy" alt="Sticker" class="attachment-sticker" style="max-width: 150px; max-height: 150px; margin: 5px;" onerror="this.style.display=\'none\'; this.nextElementSibling.style.display=\'inline-block\';">')
                                 # Fallback display if image fails to load
-                                attachments_html += f'<div class="attachment-sticker" style="padding: 10px; background: #f0f0f0; border-radius: 8px; margin: 5px; display: none;">🎭 Sticker</div>'
+                                attachment_parts.append(f'<div class="attachment-sticker" style="padding: 10px; background: #f0f0f0; border-radius: 8px; margin: 5px; display: none;">🎭 Sticker</div>')
                             else:
-                                attachments_html += f'<div class="attachment-sticker" style="padding: 10px; background: #f0f0f0; border-radius: 8px; margin: 5px; display: inline-block;">🎭 Sticker</div>'
+                                attachment_parts.append(f'<div class="attachment-sticker" style="padding: 10px; background: #f0f0f0; border-radius: 8px; margin: 5px; display: inline-block;">🎭 Sticker</div>')
                         elif attachment_id and content_type and content_type.startswith('image/'):
-                            attachments_html += f'<img src="/attachment/{attachment_id}" alt="{file_name}" class="attachment-image" style="max-width: 300px; max-height: 300px; margin: 5px; border-radius: 8px;">'
+                            attachment_parts.append(f'<img src="/attachment/{attachment_id}?w=300" srcset="/attachment/{attachment_id}?w=300 1x, /attachment/{attachment_id}?w=600 2x" loading="lazy" alt="{file_name}" class="attachment-image" style="max-width: 300px; max-height: 300px; margin: 5px; border-radius: 8px;">')
                         elif attachment_id and content_type and content_type.startswith('video/'):
-                            attachments_html += f'<video src="/attachment/{attachment_id}" controls class="attachment-video" title="{file_name}" style="max-width: 300px; max-height: 300px;"></video>'
+                            attachment_parts.append(f'<video src="/attachment/{attachment_id}" controls class="attachment-video" title="{file_name}" style="max-width: 300px; max-height: 300px;"></video>')
                         elif attachment_id:
-                            attachments_html += f'<div class="attachment-file">📎 {file_name}</div>'
-                    attachments_html += '</div>'
+                            attachment_parts.append(f'<div class="attachment-file">📎 {file_name}</div>')
+                    attachment_parts.append('</div>')
+                    attachments_html = "".join(attachment_parts)
 
-                sender_display = msg.get('sender_display', f"User {msg.get('sender', 'Unknown')}")
-                group_display = msg.get('group_display', 'Unnamed Group')
+                sender_display = html.escape(msg['sender_display'] or f"User {msg['sender'] or 'Unknown'}")
+                group_display = html.escape(msg['group_display'] or 'Unnamed Group')
 
-                messages_html += f"""
+                yield f"""
                 <div class="message-item">
                     <div class="message-header">
                         <div class="message-sender">
@@ -949,83 +809,25 @@ class MessagesPage(BasePage):
                 </div>
                 """
 
-        # Pagination
-        filter_param = ""
-        if group_filter:
-            filter_param += f"&group_id={quote(group_filter)}"
-        if sender_filter:
-            filter_param += f"&sender_uuid={quote(sender_filter)}"
-        if attachments_only:
-            filter_param += "&attachments_only=true"
-        if start_date:
-            filter_param += f"&start_date={quote(start_date)}"
-        if end_date:
-            filter_param += f"&end_date={quote(end_date)}"
-
-        pagination_html = ""
-        if total_pages > 1:
-            pagination_html = '<div class="pagination">'
-            if page > 1:
-                pagination_html += f'<a href="/messages?tab=all&page={page-1}{filter_param}" class="page-btn">← Previous</a>'
-
-            start_page = max(1, page - 2)
-            end_page = min(total_pages, page + 2)
-
-            for p in range(start_page, end_page + 1):
-                if p == page:
-                    pagination_html += f'<span class="page-btn current">{p}</span>'
-                else:
-                    pagination_html += f'<a href="/messages?tab=all&page={p}{filter_param}" class="page-btn">{p}</a>'
-
-            if page < total_pages:
-                pagination_html += f'<a href="/messages?tab=all&page={page+1}{filter_param}" class="page-btn">Next →</a>'
-            pagination_html += '</div>'
-
-        # Build group dropdown options
-        group_options = '<option value="">All Groups</option>'
-        for group in monitored_groups:
-            selected = 'selected' if group.group_id == group_filter else ''
-            group_options += f'<option value="{group.group_id}" {selected}>{group.group_name or "Unnamed Group"}</option>'
-
-        # Get group members for sender dropdown if group is selected
-        member_options = '<option value="">All Members</option>'
-        if group_filter:
-            try:
-                members = self.db.get_group_members(group_filter)
-                for member in members:
-                    selected = 'selected' if member.uuid == sender_filter else ''
-                    member_name = member.friendly_name or member.phone_number or member.uuid
-                    member_options += f'<option value="{member.uuid}" {selected}>{member_name}</option>'
-            except Exception as e:
-                pass
-
-        return f"""
-            <div class="stats">
-                <div><strong>Total Messages:</strong> {total_messages}</div>
-                <div><strong>Page:</strong> {page} of {total_pages}</div>
-            </div>
-
-
-            <div class="messages-container">
-                {messages_html}
+        yield f"""
             </div>
 
             {pagination_html}
         """
 
     def _process_mentions(self, message_text: str, message_id: int = None) -> str:
-        """Process mention placeholders in message text with actual user names."""
+        """Escape message text for HTML and replace mention placeholders with actual user names."""
         if not message_text:
             return message_text
 
         # Check for mention placeholder first
         mention_placeholder = '\ufffc'  # Unicode object replacement character
         if mention_placeholder not in message_text:
-            return message_text
+            return html.escape(message_text)
 
         if not message_id:
             # No message ID, use fallback replacement
-            return message_text.replace(
+            return html.escape(message_text).replace(
                 mention_placeholder,
                 '<span class="mention">@mention</span>'
             )
@@ -1034,15 +836,11 @@ class MessagesPage(BasePage):
         mentions = self.db.get_message_mentions(message_id)
         if not mentions:
             # Fallback to generic replacement
-            return message_text.replace(
+            return html.escape(message_text).replace(
                 mention_placeholder,
                 '<span class="mention">@mention</span>'
             )
 
-        # Process text with placeholder replacement approach
-        # Since mentions use the object replacement character, we'll replace them in order
-        processed_text = message_text
-
         # Create a mapping of positions to user names
         mention_replacements = []
         for mention in mentions:
@@ -1062,22 +860,22 @@ class MessagesPage(BasePage):
                 'name': user_name
             })
 
-        # Sort by position (reverse to maintain positions)
-        mention_replacements.sort(key=lambda m: m['start'], reverse=True)
-
-        # Replace each mention
+        # Walk the raw text in position order, escaping the text between mentions;
+        # positions refer to the unescaped text, so escaping must happen piecewise
+        mention_replacements.sort(key=lambda m: m['start'])
+        pieces = []
+        pos = 0
         for replacement in mention_replacements:
             start = replacement['start']
             length = replacement['length']
 
-            # Ensure we're within bounds
-            if start < len(processed_text) and start + length <= len(processed_text):
-                # Check if there's a placeholder at this position
-                if processed_text[start:start + length] == mention_placeholder:
-                    before = processed_text[:start]
-                    after = processed_text[start + length:]
-                    mention_html = f'<span class="mention">@{replacement["name"]}</span>'
-                    processed_text = before + mention_html + after
+            # Only replace where the placeholder actually is (slicing past the end never matches)
+            if start >= pos and message_text[start:start + length] == mention_placeholder:
+                pieces.append(html.escape(message_text[pos:start]))
+                pieces.append(f'<span class="mention">@{html.escape(replacement["name"])}</span>')
+                pos = start + length
+        pieces.append(html.escape(message_text[pos:]))
+        processed_text = ''.join(pieces)
 
         # Final fallback - replace any remaining placeholders
         if mention_placeholder in processed_text:
@@ -1358,7 +1156,8 @@ class MessagesPage(BasePage):
                         const contentDiv = document.getElementById('sentiment-analysis-content');
 
                         function checkSentimentStatus() {{
-                            fetch(`/api/sentiment?job_id=${{jobId}}`)
+                            // The server holds the request until the job changes, so re-check right away
+                            fetch(`/api/sentiment?job_id=${{jobId}}&wait=25`)
                                 .then(response => response.json())
                                 .then(data => {{
                                     if (data.status === 'completed') {{
@@ -1372,8 +1171,7 @@ class MessagesPage(BasePage):
                                             loadingMessage += ' - This may take a few minutes';
                                         }}
                                         contentDiv.innerHTML = `<div style="text-align: center; padding: 40px; color: #666;">${{loadingMessage}}... (${{elapsed}}s)</div>`;
-                                        // Poll again in 2 seconds
-                                        setTimeout(checkSentimentStatus, 2000);
+                                        checkSentimentStatus();
                                     }}
                                 }})
                                 .catch(error => {{
@@ -4,13 +4,40 @@ Users page for Signal Bot web interface.
 Manages user emoji reaction configurations.
 """
 
-from typing import Dict, Any
+import html
+import json
+from typing import Dict, Any, Iterator, List
 from ..shared.base_page import BasePage
 from ..shared.templates import get_emoji_picker_for_reactions
 
+# One table row per user; the UUID and emoji cells are empty strings when the tab omits them
+_USER_ROW_TEMPLATE = """
+            <tr>
+                <td><strong>{display_name}</strong></td>
+                {uuid_cell}
+                <td>{phone_display}</td>
+                <td>{message_count}</td>
+                <td style="max-width: 300px; word-wrap: break-word;">{groups_text}</td>
+                {emoji_cell}
+                <td>{actions}</td>
+            </tr>
+        """
+
+_CONFIGURED_ACTIONS_TEMPLATE = """
+                <button class="btn" {picker_data} onclick="editUserReactions(this)">Edit</button>
+                <button class="btn btn-danger" onclick="removeReactions({uuid_js})">Remove</button>
+            """
+
+_DISCOVERED_ACTIONS_TEMPLATE = """
+                <button class="btn" {picker_data} onclick="editUserReactions(this)">Configure</button>
+            """
+
 
 class UsersPage(BasePage):
     """Users page implementation."""
+    # Rendered purely from the users/groups tables
+    etag_from_data = True
+
 
     @property
     def title(self) -> str:
@@ -28,170 +55,60 @@ class UsersPage(BasePage):
         """No custom CSS - using shared styling."""
         return ""
 
-    def get_custom_js(self) -> str:
-        """JavaScript for user management functionality."""
-        return """
-            function switchTab(tab) {
-                // Navigate to the tab URL like Messages page does
-                window.location.href = '/users?tab=' + tab;
-            }
-
-            function saveReactions(userId) {
-                const selectedEmojis = Array.from(document.querySelectorAll('#emoji-' + userId + ' .emoji-item.selected'))
-                    .map(item => item.dataset.emoji);
-                const mode = document.getElementById('mode-' + userId).value;
-
-                fetch('/api/save-user-reactions', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ user_id: userId, emojis: selectedEmojis, mode: mode })
-                })
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success) {
-                        alert('Reactions saved successfully!');
-                        location.reload();
-                    } else {
-                        alert('Error saving reactions');
-                    }
-                });
-            }
-
-            function removeReactions(userId) {
-                if (confirm('Remove all emoji reactions for this user?')) {
-                    fetch('/api/remove-user-reactions', {
-                        method: 'POST',
-                        headers: { 'Content-Type': 'application/json' },
-                        body: JSON.stringify({ user_id: userId })
-                    })
-                    .then(response => response.json())
-                    .then(data => {
-                        if (data.success) {
-                            alert('Reactions removed successfully!');
-                            location.reload();
-                        } else {
-                            alert('Error removing reactions');
-                        }
-                    });
-                }
-            }
-
-            function toggleEmoji(element) {
-                element.classList.toggle('selected');
-            }
-
-            function openEmojiPicker(userId) {
-                fetch('/api/user-reactions?user_id=' + userId)
-                    .then(response => response.json())
-                    .then(data => {
-                        document.getElementById('selectedEmojis').innerHTML = '';
-                        document.getElementById('reactionMode').value = data.mode || 'random';
-
-                        if (data.emojis) {
-                            data.emojis.forEach(emoji => {
-                                const span = document.createElement('span');
-                                span.className = 'emoji-badge';
-                                span.textContent = emoji;
-                                span.onclick = function() { this.remove(); };
-                                document.getElementById('selectedEmojis').appendChild(span);
-                            });
-                        }
-
-                        document.getElementById('currentUserId').value = userId;
-                        document.getElementById('emojiModal').style.display = 'block';
-                    });
-            }
-
-            function closeEmojiPicker() {
-                document.getElementById('emojiModal').style.display = 'none';
-            }
-
-            function addEmoji(emoji) {
-                const selectedDiv = document.getElementById('selectedEmojis');
-                const span = document.createElement('span');
-                span.className = 'emoji-badge';
-                span.textContent = emoji;
-                span.onclick = function() { this.remove(); };
-                selectedDiv.appendChild(span);
-            }
-
-            function saveFromModal() {
-                const userId = document.getElementById('currentUserId').value;
-                const emojis = Array.from(document.querySelectorAll('#selectedEmojis .emoji-badge'))
-                    .map(span => span.textContent);
-                const mode = document.getElementById('reactionMode').value;
-
-                fetch('/api/save-user-reactions', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ user_id: userId, emojis: emojis, mode: mode })
-                })
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success) {
-                        alert('Reactions saved successfully!');
-                        location.reload();
-                    } else {
-                        alert('Error saving reactions');
-                    }
-                });
-                closeEmojiPicker();
-            }
-        """
+    def get_page_scripts(self) -> List[str]:
+        """Get page-specific JavaScript files."""
+        return ['/static/js/user-reactions.js']
 
     def render_content(self, query: Dict[str, Any]) -> str:
         """Render the users page content."""
+        return "".join(self.render_content_chunks(query))
+
+    def render_content_chunks(self, query: Dict[str, Any]) -> Iterator[str]:
+        """Yield the users page content, streaming one table row per user."""
         # Get the active tab from query params
         tab = query.get('tab', ['configured'])[0]
 
-        # Get users from database
-        configured_users = self.db.get_configured_users()
-        discovered_users = self.db.get_discovered_users()
+        # Get users from database in one round trip, then split by status
+        rows = self.db.get_all_users_with_status()
+        configured_users = [user for user, configured in rows if configured]
+        discovered_users = [user for user, configured in rows if not configured]
 
         # Calculate stats
-        total_users = len(configured_users) + len(discovered_users)
         total_configured = len(configured_users)
         total_discovered = len(discovered_users)
 
         # Render only the active tab content
         if tab == 'discovered':
-            tab_content = f"""
-                <div id="{tab}-tab" class="tab-content active">
-                    <div class="content-card">
-                        <h3>Discovered Users</h3>
-                        <p class="text-muted">Users found in groups but not yet configured</p>
-                        {self.render_user_list(discovered_users, False)}
-                    </div>
-                </div>
-            """
+            heading = "Discovered Users"
+            description = "Users found in groups but not yet configured"
+            users, is_configured = discovered_users, False
         else:  # configured (default)
-            tab_content = f"""
-                <div id="{tab}-tab" class="tab-content active">
-                    <div class="content-card">
-                        <h3>Configured Users</h3>
-                        <p class="text-muted">Users with custom emoji reactions configured</p>
-                        {self.render_user_list(configured_users, True)}
-                    </div>
-                </div>
-            """
+            heading = "Configured Users"
+            description = "Users with custom emoji reactions configured"
+            users, is_configured = configured_users, True
 
-        content = f"""
+        yield f"""
             <div class="user-tabs">
                 <button class="tab-btn {'active' if tab == 'configured' else ''}" onclick="switchTab('configured')">Configured Users ({total_configured})</button>
                 <button class="tab-btn {'active' if tab == 'discovered' else ''}" onclick="switchTab('discovered')">Discovered Users ({total_discovered})</button>
             </div>
 
-            {tab_content}
+            <div id="{tab}-tab" class="tab-content active">
+                <div class="content-card">
+                    <h3>{heading}</h3>
+                    <p class="text-muted">{description}</p>
+                    """
+        yield from self.iter_user_list(users, is_configured)
+        yield f"""
+                </div>
+            </div>
 
             {self.render_emoji_modal()}
         """
 
-        return content
-
-    def render_user_list(self, users, is_configured: bool) -> str:
-        """Render a list of users in table format."""
-        if not users:
-            return f"""
+    def iter_user_list(self, users, is_configured: bool) -> Iterator[str]:
+        """Yield a list of users in table format, one chunk per row."""
+        yield f"""
                 <table>
                     <thead>
                         <tr>
@@ -205,84 +122,74 @@ class UsersPage(BasePage):
                         </tr>
                     </thead>
                     <tbody>
-                        <tr><td colspan="{'6' if is_configured else '6'}" class="text-center text-muted">No {'configured' if is_configured else 'discovered'} users found</td></tr>
+                    """
+
+        if not users:
+            yield f"""
+                        <tr><td colspan="6" class="text-center text-muted">No {'configured' if is_configured else 'discovered'} users found</td></tr>
+                    """
+        else:
+            # Prefetch groups and reactions for the whole list instead of per row
+            uuids = [user.uuid for user in users]
+            groups_map = self.db.get_groups_for_uuids(uuids)
+            # Reactions also seed the emoji picker, so load them for both lists
+            reactions_map = self.db.get_reactions_for_uuids(uuids)
+            # One grouped count for every sender instead of a COUNT(*) per row
+            message_counts = self.db.get_message_counts_by_sender_filtered()
+
+            for user in users:
+                yield self.render_user_row(user, is_configured, reactions_map, groups_map, message_counts)
+
+        yield """
                     </tbody>
                 </table>
             """
 
-        rows_html = ""
-        for user in users:
-            rows_html += self.render_user_row(user, is_configured)
-
-        return f"""
-            <table>
-                <thead>
-                    <tr>
-                        <th>Name</th>
-                        {'<th>UUID</th>' if not is_configured else ''}
-                        <th>Phone</th>
-                        <th>Messages</th>
-                        <th>Groups</th>
-                        {'<th>Reactions</th>' if is_configured else ''}
-                        <th>Actions</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {rows_html}
-                </tbody>
-            </table>
-        """
-
-    def render_user_row(self, user, is_configured: bool) -> str:
-        """Render a single user as a table row."""
-        # Get user display info - prefer phone number, fall back to UUID if empty
-        display_name = user.friendly_name or user.phone_number or f"User {user.uuid}"
-        phone_display = user.phone_number or "Not available"
+    def render_user_row(self, user, is_configured: bool, reactions_map: Dict[str, Any],
+                        groups_map: Dict[str, Any], message_counts: Dict[str, int]) -> str:
+        """Render a single user as a table row from prefetched reactions, groups and message counts."""
+        uuid_h = html.escape(user.uuid)
 
         # Get user groups - don't truncate, show all groups
-        groups = self.db.get_user_groups(user.uuid)
-        groups_text = ", ".join([g.group_name or "Unnamed Group" for g in groups]) or "None"
+        groups = groups_map.get(user.uuid, [])
 
-        # Get message count
-        message_count = self.db.get_message_count_filtered(sender_uuid=user.uuid)
+        row = {
+            # Get user display info - prefer phone number, fall back to UUID if empty
+            'display_name': html.escape(user.friendly_name or user.phone_number or f"User {user.uuid}"),
+            'phone_display': html.escape(user.phone_number or "Not available"),
+            'groups_text': html.escape(", ".join([g.group_name or "Unnamed Group" for g in groups]) or "None"),
+            'message_count': message_counts.get(user.uuid, 0),
+            # Add UUID column for discovered users
+            'uuid_cell': f'<td><small>{uuid_h}</small></td>' if not is_configured else '',
+        }
 
-        # Add UUID column for discovered users
-        uuid_cell = f'<td><small>{user.uuid}</small></td>' if not is_configured else ''
+        reactions = reactions_map.get(user.uuid)
 
         # Render emoji column for configured users
         emoji_cell = ""
         if is_configured:
-            reactions = self.db.get_user_reactions(user.uuid)
             if reactions and reactions.emojis:
                 emojis = reactions.emojis
-                emoji_badges = ''.join([f'<span class="emoji-badge">{emoji}</span>' for emoji in emojis])
-                mode_text = reactions.reaction_mode or 'random'
+                emoji_badges = ''.join([f'<span class="emoji-badge">{html.escape(emoji)}</span>' for emoji in emojis])
+                mode_text = html.escape(reactions.reaction_mode or 'random')
                 emoji_cell = f'<td>{emoji_badges}<br><small class="text-muted">{mode_text}</small></td>'
             else:
                 emoji_cell = '<td class="text-muted">None</td>'
+        row['emoji_cell'] = emoji_cell
+
+        # Current reactions ride along on the edit button so the picker opens without a fetch
+        picker_data = (f'data-uuid="{uuid_h}" '
+                       f'data-emojis="{html.escape(json.dumps(reactions.emojis if reactions else [], ensure_ascii=False))}" '
+                       f'data-mode="{html.escape((reactions.reaction_mode if reactions else None) or "random")}"')
 
         # Action buttons
         if is_configured:
-            actions = f"""
-                <button class="btn" onclick="openEmojiPicker('{user.uuid}')">Edit</button>
-                <button class="btn btn-danger" onclick="removeReactions('{user.uuid}')">Remove</button>
-            """
+            row['actions'] = _CONFIGURED_ACTIONS_TEMPLATE.format(
+                picker_data=picker_data, uuid_js=html.escape(json.dumps(user.uuid)))
         else:
-            actions = f"""
-                <button class="btn" onclick="openEmojiPicker('{user.uuid}')">Configure</button>
-            """
+            row['actions'] = _DISCOVERED_ACTIONS_TEMPLATE.format(picker_data=picker_data)
 
-        return f"""
-            <tr>
-                <td><strong>{display_name}</strong></td>
-                {uuid_cell}
-                <td>{phone_display}</td>
-                <td>{message_count}</td>
-                <td style="max-width: 300px; word-wrap: break-word;">{groups_text}</td>
-                {emoji_cell}
-                <td>{actions}</td>
-            </tr>
-        """
+        return _USER_ROW_TEMPLATE.format_map(row)
 
     def render_emoji_modal(self) -> str:
         """Render the emoji picker modal using shared component."""
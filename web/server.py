@@ -5,15 +5,22 @@ Demonstrates the new modular architecture with shared templates and individual p
 This serves as a proof-of-concept showing how to refactor the monolithic server.py.
 """
 
+import gzip
+import hashlib
+import io
 import json
 import logging
+import re
 from datetime import datetime, date
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from functools import lru_cache
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs, quote
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 import threading
 import uuid
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import markdown library, fallback if not available
 try:
@@ -21,13 +28,19 @@ try:
     MARKDOWN_AVAILABLE = True
 except ImportError:
     MARKDOWN_AVAILABLE = False
+
+# Try to import orjson for faster JSON encoding, fallback to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 import os
 import mimetypes
 
+from config.settings import Config
 from models.database import DatabaseManager
 from services.setup import SetupService
-# Sentiment and summarization now integrated into AI analysis service
-from services.ai_analysis import AIAnalysisService
 
 # Import modular page components
 from .pages.dashboard import ComprehensiveDashboard
@@ -38,6 +51,38 @@ from .pages.settings import SettingsPage
 from .pages.setup import SetupPage
 from .pages.ai_config import AIConfigPage
 from .pages.ai_analysis import AIAnalysisPage
+from .shared.content_encoding import accepts_encoding
+from .shared.job_store import JobStore
+from .shared.page_cache import PageCache
+from .shared.stats_batcher import StatsBatcher
+from .shared.thumbnails import ThumbnailCache
+
+
+# Responses smaller than this are sent uncompressed; gzip overhead outweighs the savings
+GZIP_MIN_SIZE = 512
+
+# Static types worth compressing; images and fonts are already compressed
+COMPRESSIBLE_STATIC_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+# Job event streams send a comment this often so proxies keep them open, and give up
+# after the same time the browser's status polling does
+JOB_STREAM_KEEPALIVE = 25
+JOB_STREAM_MAX_DURATION = 180
+
+# Longest a job status request may be held waiting for the job to change (?wait=<seconds>)
+JOB_STATUS_MAX_WAIT = 25
+
+# Most messages a summary or AI analysis reads; previews report counts capped to match
+ANALYSIS_MESSAGE_LIMIT = 1000
+
+# Markdown instances are expensive to build and not thread-safe, so keep one per thread
+_markdown_local = threading.local()
+
+
+# Characters and line starts that can change how markdown renders a block of text
+_MARKDOWN_CHARS_RE = re.compile(r'[*_`#\[\]|>~<&\\\t\r]')
+_MARKDOWN_LINE_START_RE = re.compile(r'^ ?(?:[-+=]|\d+[.)])|^ $', re.MULTILINE)
+_PARAGRAPH_BREAK_RE = re.compile(r'\n{2,}')
 
 
 def convert_markdown_to_html(text: str) -> str:
@@ -45,21 +90,50 @@ def convert_markdown_to_html(text: str) -> str:
     if not MARKDOWN_AVAILABLE or not text:
         return text
 
+    if not (_MARKDOWN_CHARS_RE.search(text) or '  ' in text or _MARKDOWN_LINE_START_RE.search(text)):
+        # Plain text: same paragraphs markdown would produce, without running the parser
+        paragraphs = (p.lstrip() for p in _PARAGRAPH_BREAK_RE.split(text.strip('\n')))
+        return '\n'.join(f'<p>{p}</p>' for p in paragraphs if p)
+
     try:
-        # Configure markdown with table extension
-        md = markdown.Markdown(extensions=['tables', 'fenced_code'])
-        return md.convert(text)
+        md = getattr(_markdown_local, 'md', None)
+        if md is None:
+            # Configure markdown with table extension
+            md = markdown.Markdown(extensions=['tables', 'fenced_code'])
+            _markdown_local.md = md
+        return md.reset().convert(text)
     except Exception:
         # Fallback to original text if conversion fails
         return text
 
 
+def encode_json(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode('utf-8')
+
+
+@lru_cache(maxsize=64)
+def _gzip_static_file(file_path: str, etag: str) -> bytes:
+    """Gzip a static file once at maximum compression; keying on the ETag drops edited versions."""
+    with open(file_path, 'rb') as f:
+        return gzip.compress(f.read(), compresslevel=9)
+
+
+def decode_json(body: bytes) -> Any:
+    """Parse a UTF-8 JSON request body, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 class ModularWebServer:
     """Modular web server that demonstrates the new architecture."""
 
     def __init__(self, db: DatabaseManager, setup_service: SetupService, ai_provider=None,
                  port: int = None, host: str = None, logger=None):
-        from config.constants import NETWORK
+        from config.constants import NETWORK, PATHS
         self.db = db
         self.setup_service = setup_service
         self.ai_provider = ai_provider
@@ -83,13 +157,47 @@ class ModularWebServer:
         # For backward compatibility, keep some old methods temporarily
         # Sentiment and summarization now handled by ai_analysis_service
 
-        # Initialize unified AI analysis service
-        self.ai_analysis_service = AIAnalysisService(db)
+        # Unified AI analysis service (sentiment, summaries); created on first use
+        self._ai_analysis_service = None
+        self._ai_analysis_lock = threading.Lock()
+        # The legacy /api/sentiment* endpoints check this; sentiment now runs through the
+        # AI analysis service, so they report the analyzer as unavailable
+        self.sentiment_analyzer = None
+
+        # Background analysis jobs polled by the browser; bounded and expiring. Finished jobs
+        # are left to expire rather than removed when read, so a client that retries still gets the result
+        self._analysis_jobs = JobStore(maxsize=1024, ttl=3600)
+        self._summary_jobs = JobStore(maxsize=1024, ttl=3600)
+
+        # Runs background AI jobs; bounded so a burst of requests queues instead of
+        # overloading the AI provider and slowing every job already running
+        self.analysis_executor = ThreadPoolExecutor(max_workers=Config.AI_ANALYSIS_WORKERS,
+                                                    thread_name_prefix='AIAnalysis')
+
+        # Coalesces concurrent /api/stats polls into one query
+        self.stats_batcher = StatsBatcher(db)
+
+        # Rendered data-versioned pages, reused until the database changes
+        self.page_cache = PageCache()
+
+        # Downscaled image attachments, built on first request and kept on disk
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.thumbnails = ThumbnailCache(os.path.join(project_root, PATHS['THUMBNAIL_CACHE_DIR']))
+
+    @property
+    def ai_analysis_service(self):
+        """Lazily import and create the AI analysis service, which pulls in the AI provider stack."""
+        if self._ai_analysis_service is None:
+            with self._ai_analysis_lock:
+                if self._ai_analysis_service is None:
+                    from services.ai_analysis import AIAnalysisService
+                    self._ai_analysis_service = AIAnalysisService(self.db)
+        return self._ai_analysis_service
 
     def start(self):
         """Start the web server in a separate thread."""
         handler = self._create_handler()
-        self.server = HTTPServer((self.host, self.port), handler)
+        self.server = ThreadingHTTPServer((self.host, self.port), handler)
 
         def run_server():
             logging.info(f"Web server starting on port {self.port}")
@@ -108,12 +216,87 @@ class ModularWebServer:
         if self.server:
             self.server.shutdown()
             self.server.server_close()
+        # Don't hold up shutdown for jobs still running or queued
+        self.analysis_executor.shutdown(wait=False)
 
     def _create_handler(self):
         """Create HTTP request handler with access to server instance."""
         web_server = self
 
         class RequestHandler(BaseHTTPRequestHandler):
+            # Keep connections alive between requests; every response sends Content-Length
+            protocol_version = 'HTTP/1.1'
+            # Buffer writes (flushed after each request) instead of one send per write
+            wbufsize = 65536
+            # Close idle keep-alive connections so they don't pin handler threads
+            timeout = 30
+            # Resolved once for the class; handler instances are created per connection
+            logger = web_server.logger
+
+            # Data-versioned pages may be stored but must be revalidated with the ETag on every use
+            HTML_CACHE_CONTROL = 'private, no-cache'
+            # API JSON without its own validators must never be served from a cache
+            NO_STORE_HEADERS = {'Cache-Control': 'no-store'}
+            # API JSON sent with a content ETag may be kept, but must be revalidated on every use
+            REVALIDATED_JSON_CACHE_CONTROL = 'private, no-cache'
+            # How long a request waits on an identical in-flight render before rendering itself
+            PAGE_FLIGHT_TIMEOUT = 10
+
+            # Page routes: path -> key into web_server.pages
+            PAGE_ROUTES = {
+                '/': 'dashboard',
+                '/users': 'users',
+                '/groups': 'groups',
+                '/messages': 'messages',
+                '/settings': 'settings',
+                '/setup': 'setup',
+                '/ai-config': 'ai-config',
+                '/ai-analysis': 'ai-analysis',
+            }
+
+            # API GET routes: path -> handler method name, each called with the parsed query
+            API_GET_ROUTES = {
+                '/api/user-reactions': '_handle_user_reactions',
+                '/api/setup/run': '_handle_setup_run',
+                '/api/ai-status': '_handle_ai_status',
+                '/api/ai-config': '_handle_ai_config',
+                '/api/stats': '_handle_stats',
+                '/api/system-status': '_handle_system_status',
+                '/api/backups': '_handle_backups',
+                '/api/ai-analysis/types': '_handle_ai_analysis_types',
+                '/api/ai-analysis/preview': '_handle_ai_analysis_preview',
+                '/api/ai-analysis/run': '_handle_ai_analysis_run',
+                '/api/ai-analysis/stream': '_handle_ai_analysis_stream',
+                '/api/activity/hourly': '_handle_activity_hourly',
+            }
+
+            # API GET prefix routes, checked in order after exact matches.
+            # More specific prefixes must come first (e.g. sentiment-cached before sentiment).
+            API_GET_PREFIX_ROUTES = (
+                ('/api/ollama-models', '_handle_ollama_models'),
+                ('/api/ollama-preload', '_handle_ollama_preload'),
+                ('/api/sentiment-cached', '_handle_sentiment_cached'),
+                ('/api/sentiment-preview', '_handle_sentiment_preview'),
+                ('/api/sentiment', '_handle_sentiment_analysis'),
+                ('/api/summary-cached', '_handle_summary_cached'),
+                ('/api/summary-preview', '_handle_summary_preview'),
+                ('/api/summary', '_handle_summary'),
+                ('/api/ai-analysis/status', '_handle_ai_analysis_status'),
+            )
+
+            # API POST routes: path -> handler method name, each called with the decoded JSON body
+            API_POST_ROUTES = {
+                '/api/save-user-reactions': '_handle_save_user_reactions',
+                '/api/remove-user-reactions': '_handle_remove_user_reactions',
+                '/api/setup/sync': '_handle_setup_sync',
+                '/api/setup/sync-users': '_handle_setup_sync_users',
+                '/api/setup/clean-import': '_handle_setup_clean_import',
+                '/api/groups/monitor': '_handle_group_monitor',
+                '/api/ai-config': '_handle_save_ai_config',
+                '/api/generate-summary': '_handle_generate_summary',
+                '/api/ai-analysis/type': '_handle_create_analysis_type',
+            }
+
             def log_message(self, format, *args):
                 # Log requests when in debug mode
                 if web_server.logger.level == logging.DEBUG:
@@ -142,101 +325,38 @@ class ModularWebServer:
                             return
 
                     # Route to appropriate handler - all pages now use modular system
-                    if path == '/':
-                        response = web_server.pages['dashboard'].render(query)
-                        self._send_html_response(response)
-
-                    elif path == '/users':
-                        response = web_server.pages['users'].render(query)
-                        self._send_html_response(response)
-
-                    elif path == '/groups':
-                        response = web_server.pages['groups'].render(query)
-                        self._send_html_response(response)
-
-                    elif path == '/messages':
-                        response = web_server.pages['messages'].render(query)
-                        self._send_html_response(response)
-
-                    elif path == '/settings':
-                        response = web_server.pages['settings'].render(query)
-                        self._send_html_response(response)
-
-                    elif path == '/setup':
-                        response = web_server.pages['setup'].render(query)
-                        self._send_html_response(response)
-
-                    elif path == '/ai-config':
-                        response = web_server.pages['ai-config'].render(query)
-                        self._send_html_response(response)
-
-                    elif path == '/ai-analysis':
-                        response = web_server.pages['ai-analysis'].render(query)
-                        self._send_html_response(response)
-
-                    elif path.startswith('/static/'):
-                        # Serve static files
-                        file_path = path[1:]  # Remove leading slash
-                        static_dir = os.path.join(os.path.dirname(__file__), file_path)
-
-                        if os.path.exists(static_dir) and os.path.isfile(static_dir):
-                            try:
-                                with open(static_dir, 'rb') as f:
-                                    content = f.read()
-
-                                # Determine content type
-                                content_type = mimetypes.guess_type(static_dir)[0] or 'application/octet-stream'
-
-                                self.send_response(200)
-                                self.send_header('Content-Type', content_type)
-                                self.send_header('Content-Length', str(len(content)))
-                                self.end_headers()
-                                self.wfile.write(content)
-                            except Exception as e:
-                                self._send_error_response(500, f"Error serving static file: {str(e)}")
-                        else:
-                            self._send_error_response(404, "File not found")
-
-                    elif path.startswith('/attachment/'):
-                        # Serve attachment by ID
-                        attachment_id = path.replace('/attachment/', '')
-                        if not attachment_id:
-                            self._send_error_response(404, "Attachment not found")
+                    page_key = self.PAGE_ROUTES.get(path)
+                    if page_key:
+                        page = web_server.pages[page_key]
+                        etag = page.get_etag(query)
+                        if not etag:
+                            self._send_html_stream(page.render_stream(query))
                             return
-
-                        # Get attachment data from database
-                        with web_server.db._get_connection() as conn:
-                            cursor = conn.cursor()
-                            # Try both attachment_id and sticker_id
-                            cursor.execute("""
-                                SELECT file_data, content_type, filename
-                                FROM attachments
-                                WHERE attachment_id = ? OR sticker_id = ?
-                            """, (attachment_id, attachment_id))
-                            attachment = cursor.fetchone()
-
-                        if not attachment or not attachment['file_data']:
-                            self._send_error_response(404, "Attachment not found")
+                        if self._etag_matches(etag):
+                            self._send_not_modified(etag, self.HTML_CACHE_CONTROL)
                             return
+                        if self._send_cached_page(etag):
+                            return
+                        # Concurrent misses for the same page share one render, then answer from the cache
+                        flight = web_server.page_cache.join(self.path, etag)
+                        if flight is None:
+                            self._send_html_stream(web_server.page_cache.record(self.path, etag, page.render_stream(query)), etag)
+                            return
+                        try:
+                            flight.result(timeout=self.PAGE_FLIGHT_TIMEOUT)
+                        except Exception:
+                            pass
+                        if not self._send_cached_page(etag):
+                            self._send_html_stream(page.render_stream(query), etag)
 
-                        # Send attachment
-                        content_type = attachment['content_type'] or 'application/octet-stream'
-                        self.send_response(200)
-                        self.send_header('Content-Type', content_type)
-                        self.send_header('Content-Length', str(len(attachment['file_data'])))
-                        if attachment['filename']:
-                            self.send_header('Content-Disposition', f'inline; filename="{attachment["filename"]}"')
-                        self.end_headers()
-                        self.wfile.write(attachment['file_data'])
-
-
-                    # API endpoints
                     elif path.startswith('/api/'):
                         self._handle_api_request(path, query)
 
-                    # Attachment serving
+                    elif path.startswith('/static/'):
+                        self._serve_static(path, query)
+
                     elif path.startswith('/attachment/'):
-                        self._serve_attachment(path)
+                        self._serve_attachment(path, query)
 
                     else:
                         self._send_error_response(404, "Page not found")
@@ -252,8 +372,7 @@ class ModularWebServer:
                     path = parsed_url.path
 
                     # Read POST data
-                    content_length = int(self.headers.get('Content-Length', 0))
-                    post_data = self.rfile.read(content_length).decode('utf-8')
+                    post_data = self._read_request_body()
 
                     if path.startswith('/api/'):
                         self._handle_api_post_request(path, post_data)
@@ -271,8 +390,7 @@ class ModularWebServer:
                     path = parsed_url.path
 
                     # Read PUT data
-                    content_length = int(self.headers.get('Content-Length', 0))
-                    put_data = self.rfile.read(content_length).decode('utf-8')
+                    put_data = self._read_request_body()
 
                     if path.startswith('/api/ai-analysis/type/'):
                         # Extract type ID from path
@@ -310,12 +428,124 @@ class ModularWebServer:
                     logging.error(f"DELETE request handling error: {e}")
                     self._send_error_response(500, "Internal server error")
 
-            def _send_html_response(self, html: str):
-                """Send HTML response."""
+            def _read_request_body(self) -> bytes:
+                """Read the raw request body, filling a preallocated buffer for larger bodies."""
+                content_length = int(self.headers.get('Content-Length', 0))
+                if content_length < 4096:
+                    return self.rfile.read(content_length)
+
+                buf = bytearray(content_length)
+                view = memoryview(buf)
+                received = 0
+                while received < content_length:
+                    nread = self.rfile.readinto(view[received:])
+                    if not nread:
+                        break
+                    received += nread
+                view.release()
+                # Both JSON decoders accept the buffer as is, so there is no separate str decode or copy
+                return buf[:received] if received < content_length else buf
+
+            def _etag_matches(self, etag: str) -> bool:
+                """Check If-None-Match against an ETag, using weak comparison as RFC 9110 requires."""
+                header = self.headers.get('If-None-Match')
+                if not header:
+                    return False
+                if header.strip() == '*':
+                    return True
+                bare = etag[2:] if etag.startswith('W/') else etag
+                for candidate in header.split(','):
+                    candidate = candidate.strip()
+                    if candidate.startswith('W/'):
+                        candidate = candidate[2:]
+                    if candidate == bare:
+                        return True
+                return False
+
+            def _send_cached_page(self, etag: str) -> bool:
+                """Send this path's cached page if it was rendered under the ETag; False on a miss."""
+                encoding = PageCache.pick_encoding(self.headers.get('Accept-Encoding', ''))
+                body = web_server.page_cache.get(self.path, etag, encoding)
+                if body is None:
+                    return False
+                self._send_body('text/html; charset=utf-8', body,
+                                {'ETag': etag, 'Cache-Control': self.HTML_CACHE_CONTROL},
+                                encoding=encoding)
+                return True
+
+            def _send_not_modified(self, etag: str, cache_control: str):
+                """Send a bodyless 304 carrying the validators the client should keep."""
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', cache_control)
+                self.end_headers()
+
+            def _send_body(self, content_type: str, body: bytes, headers: Optional[Dict[str, str]] = None,
+                           encoding: Optional[str] = None):
+                """Send a 200 response body, gzip-compressed when the client accepts it.
+
+                Pass encoding when the body is already compressed, e.g. from the page cache.
+                """
+                self.send_response(200)
+                self.send_header('Content-type', content_type)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if encoding:
+                    self.send_header('Content-Encoding', encoding)
+                elif len(body) >= GZIP_MIN_SIZE and accepts_encoding(self.headers.get('Accept-Encoding', ''), 'gzip'):
+                    body = gzip.compress(body, compresslevel=1)
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Vary', 'Accept-Encoding')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_html_stream(self, chunks: Iterable[bytes], etag: Optional[str] = None):
+                """Stream HTML chunks with chunked transfer encoding, gzip-compressing on the fly when accepted."""
+                chunks = iter(chunks)
+                # Produce the first chunk before committing to a 200, so early render errors still become a 500
+                first = next(chunks, b'')
+                headers = {'ETag': etag, 'Cache-Control': self.HTML_CACHE_CONTROL} if etag else {}
+
+                if self.request_version == 'HTTP/1.0':
+                    # No chunked encoding before HTTP/1.1; send one sized body
+                    self._send_body('text/html; charset=utf-8', first + b''.join(chunks), headers)
+                    return
+
+                compressor = None
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html; charset=utf-8')
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if accepts_encoding(self.headers.get('Accept-Encoding', ''), 'gzip'):
+                    compressor = zlib.compressobj(1, zlib.DEFLATED, 31)  # 31: gzip container
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Vary', 'Accept-Encoding')
+                self.send_header('Transfer-Encoding', 'chunked')
                 self.end_headers()
-                self.wfile.write(html.encode('utf-8'))
+
+                try:
+                    # Push the head out now so the browser can fetch stylesheets and scripts while
+                    # the rest of the page waits on the database; later chunks go through the buffer
+                    if compressor:
+                        first = compressor.compress(first) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                    self._write_chunk(first)
+                    self.wfile.flush()
+                    for chunk in chunks:
+                        self._write_chunk(compressor.compress(chunk) if compressor else chunk)
+                    if compressor:
+                        self._write_chunk(compressor.flush())
+                    self.wfile.write(b'0\r\n\r\n')
+                except Exception as e:
+                    # Headers are already sent; drop the connection so the client sees a truncated response
+                    self.logger.error(f"Error while streaming response for {self.path}: {e}")
+                    self.close_connection = True
+
+            def _write_chunk(self, data: bytes):
+                """Write one chunk of a chunked response; empty data is skipped since it would end the body."""
+                if data:
+                    # Hand the pieces to the write buffer separately rather than formatting a copy of the body
+                    self.wfile.writelines((b'%X\r\n' % len(data), data, b'\r\n'))
 
             def _send_json_response(self, data: dict):
                 """Send JSON response."""
@@ -323,156 +553,54 @@ class ModularWebServer:
                 if web_server.logger.level == logging.DEBUG:
                     web_server.logger.debug(f"[API RESPONSE] {data}")
 
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps(data).encode('utf-8'))
+                # Live state such as a job still running; a cached copy would go stale
+                self._send_body('application/json', encode_json(data), self.NO_STORE_HEADERS)
+
+            def _send_json_revalidated(self, data: dict):
+                """Send JSON with an ETag of its content, answering a matching If-None-Match with a 304."""
+                body = encode_json(data)
+                etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+                if self._etag_matches(etag):
+                    self._send_not_modified(etag, self.REVALIDATED_JSON_CACHE_CONTROL)
+                    return
+                self._send_body('application/json', body, {'ETag': etag, 'Cache-Control': self.REVALIDATED_JSON_CACHE_CONTROL})
 
             def _send_error_response(self, code: int, message: str):
                 """Send error response."""
-                self.send_response(code)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
                 error_html = f"""
                 <!DOCTYPE html>
                 <html><head><title>Error {code}</title></head>
                 <body><h1>Error {code}</h1><p>{message}</p></body></html>
                 """
-                self.wfile.write(error_html.encode('utf-8'))
+                body = error_html.encode('utf-8')
+                self.send_response(code)
+                self.send_header('Content-type', 'text/html')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
 
             def _handle_api_request(self, path: str, query: Dict[str, Any]):
                 """Handle API GET requests."""
-                if path == '/api/user-reactions':
-                    user_id = query.get('user_id', [None])[0]
-                    if user_id:
-                        reactions = web_server.db.get_user_reactions(user_id)
-                        data = {
-                            'emojis': reactions.emojis if reactions else [],
-                            'mode': reactions.reaction_mode if reactions else 'random'
-                        }
-                        self._send_json_response(data)
-                    else:
-                        self._send_error_response(400, "Missing user_id parameter")
-                elif path == '/api/setup/run':
-                    result = web_server.setup_service.run_initial_setup()
-                    self._send_json_response(result)
-                elif path == '/api/ai-status':
-                    self._handle_ai_status()
-                elif path == '/api/ai-config':
-                    self._handle_ai_config()
-                elif path.startswith('/api/ollama-models'):
-                    self._handle_ollama_models(query)
-                elif path.startswith('/api/ollama-preload'):
-                    self._handle_ollama_preload(query)
-                elif path.startswith('/api/sentiment-cached'):
-                    self._handle_sentiment_cached(query)
-                elif path.startswith('/api/sentiment-preview'):
-                    self._handle_sentiment_preview(query)
-                elif path.startswith('/api/sentiment'):
-                    self._handle_sentiment_analysis(query)
-                elif path.startswith('/api/summary-cached'):
-                    self._handle_summary_cached(query)
-                elif path.startswith('/api/summary-preview'):
-                    self._handle_summary_preview(query)
-                elif path.startswith('/api/summary'):
-                    self._handle_summary(query)
-                elif path == '/api/stats':
-                    self._handle_stats(query)
-                elif path == '/api/system-status':
-                    self._handle_system_status()
-                elif path == '/api/backups':
-                    self._handle_backups()
-                elif path == '/api/ai-analysis/types':
-                    self._handle_ai_analysis_types()
-                elif path == '/api/ai-analysis/preview':
-                    self._handle_ai_analysis_preview(query)
-                elif path == '/api/ai-analysis/run':
-                    self._handle_ai_analysis_run(query)
-                elif path.startswith('/api/ai-analysis/status'):
-                    self._handle_ai_analysis_status(query)
+                handler_name = self.API_GET_ROUTES.get(path)
+                if handler_name is None:
+                    for prefix, name in self.API_GET_PREFIX_ROUTES:
+                        if path.startswith(prefix):
+                            handler_name = name
+                            break
+
+                if handler_name:
+                    getattr(self, handler_name)(query)
                 else:
                     self._send_error_response(404, "API endpoint not found")
 
-            def _handle_api_post_request(self, path: str, post_data: str):
+            def _handle_api_post_request(self, path: str, post_data: bytes):
                 """Handle API POST requests."""
                 try:
-                    data = json.loads(post_data) if post_data else {}
+                    data = decode_json(post_data) if post_data else {}
 
-                    if path == '/api/save-user-reactions':
-                        user_id = data.get('user_id')
-                        emojis = data.get('emojis', [])
-                        mode = data.get('mode', 'random')
-
-                        if user_id:
-                            web_server.db.set_user_reactions(user_id, emojis, mode)
-                            self._send_json_response({'success': True})
-                        else:
-                            self._send_error_response(400, "Missing user_id")
-
-                    elif path == '/api/remove-user-reactions':
-                        user_id = data.get('user_id')
-                        if user_id:
-                            web_server.db.remove_user_reactions(user_id)
-                            self._send_json_response({'success': True})
-                        else:
-                            self._send_error_response(400, "Missing user_id")
-
-                    elif path == '/api/setup/sync':
-                        # Get setup status to find bot phone
-                        status = web_server.setup_service.get_setup_status()
-                        bot_phone = status.get('bot_phone_number')
-
-                        if not bot_phone:
-                            self._send_json_response({
-                                'success': False,
-                                'message': 'Bot not configured'
-                            })
-                            return
-
-                        # Use the enhanced sync_groups_to_database method with JSON output
-                        synced_count = web_server.setup_service.sync_groups_to_database()
-
-                        self._send_json_response({
-                            'success': True,
-                            'synced_count': synced_count
-                        })
-                    elif path == '/api/setup/sync-users':
-                        # Use the new sync_users_to_database method that includes friendly name logic
-                        synced_count = web_server.setup_service.sync_users_to_database()
-
-                        # Get updated user counts
-                        user_stats = web_server.db.get_user_statistics()
-
-                        self._send_json_response({
-                            'success': synced_count > 0,
-                            'synced_count': synced_count,
-                            'total_users': user_stats['total'],
-                            'configured_users': user_stats['configured'],
-                            'discovered_users': user_stats['discovered']
-                        })
-                    elif path == '/api/setup/clean-import':
-                        # Use the new clean_import method that combines users and groups
-                        result = web_server.setup_service.clean_import()
-                        self._send_json_response(result)
-
-                    elif path == '/api/groups/monitor':
-                        group_id = data.get('group_id')
-                        is_monitored = data.get('is_monitored', False)
-
-                        if group_id:
-                            web_server.db.set_group_monitoring(group_id, is_monitored)
-                            self._send_json_response({'success': True})
-                        else:
-                            self._send_error_response(400, "Missing group_id")
-
-                    elif path == '/api/ai-config':
-                        self._handle_save_ai_config(post_data)
-
-                    elif path == '/api/generate-summary':
-                        self._handle_generate_summary(data)
-
-                    elif path == '/api/ai-analysis/type':
-                        self._handle_create_analysis_type(data)
+                    handler_name = self.API_POST_ROUTES.get(path)
+                    if handler_name:
+                        getattr(self, handler_name)(data)
 
                     elif path.startswith('/api/ai-analysis/type/'):
                         # Extract type ID from path
@@ -494,8 +622,156 @@ class ModularWebServer:
                 except json.JSONDecodeError:
                     self._send_error_response(400, "Invalid JSON data")
 
-            def _serve_attachment(self, path: str):
-                """Serve attachment files from the database."""
+            def _serve_static(self, path: str, query: Dict[str, Any]):
+                """Serve files from the static directory with ETag revalidation."""
+                file_path = path[1:]  # Remove leading slash
+                static_dir = os.path.join(os.path.dirname(__file__), file_path)
+
+                if os.path.exists(static_dir) and os.path.isfile(static_dir):
+                    try:
+                        with open(static_dir, 'rb') as f:
+                            stat = os.fstat(f.fileno())
+                            size = stat.st_size
+                            etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+
+                            # Versioned URLs (static_url) never change; bare ones must revalidate
+                            cache_control = 'public, max-age=31536000, immutable' if 'v' in query else 'no-cache'
+
+                            # Determine content type
+                            content_type = mimetypes.guess_type(static_dir)[0] or 'application/octet-stream'
+                            compressible = size >= GZIP_MIN_SIZE and content_type.startswith(COMPRESSIBLE_STATIC_TYPES)
+                            gzipped = compressible and accepts_encoding(self.headers.get('Accept-Encoding', ''), 'gzip')
+                            if gzipped:
+                                # Each encoding is a different representation, so it needs its own ETag
+                                etag = etag[:-1] + '-gz"'
+
+                            if self._etag_matches(etag):
+                                self._send_not_modified(etag, cache_control)
+                                return
+
+                            body = _gzip_static_file(static_dir, etag) if gzipped else None
+
+                            self.send_response(200)
+                            self.send_header('Content-Type', content_type)
+                            self.send_header('Content-Length', str(len(body) if gzipped else size))
+                            if gzipped:
+                                self.send_header('Content-Encoding', 'gzip')
+                            if compressible:
+                                self.send_header('Vary', 'Accept-Encoding')
+                            self.send_header('ETag', etag)
+                            self.send_header('Cache-Control', cache_control)
+                            self.end_headers()
+                            if gzipped:
+                                self.wfile.write(body)
+                            else:
+                                self._stream_file(f)
+                    except Exception as e:
+                        self._send_error_response(500, f"Error serving static file: {str(e)}")
+                else:
+                    self._send_error_response(404, "File not found")
+
+            def _stream_file(self, f):
+                """Stream an open file to the client, using sendfile where the platform allows."""
+                # Headers sit in the write buffer; they must go out before the socket is used directly.
+                # socket.sendfile() falls back to plain send() where os.sendfile is unavailable.
+                self.wfile.flush()
+                self.connection.sendfile(f)
+
+            def _handle_user_reactions(self, query: Dict[str, Any]):
+                """Handle user reactions GET API request."""
+                user_id = query.get('user_id', [None])[0]
+                if user_id:
+                    reactions = web_server.db.get_user_reactions(user_id)
+                    data = {
+                        'emojis': reactions.emojis if reactions else [],
+                        'mode': reactions.reaction_mode if reactions else 'random'
+                    }
+                    self._send_json_response(data)
+                else:
+                    self._send_error_response(400, "Missing user_id parameter")
+
+            def _handle_setup_run(self, query: Dict[str, Any]):
+                """Handle initial setup API request."""
+                result = web_server.setup_service.run_initial_setup()
+                self._send_json_response(result)
+
+            def _handle_save_user_reactions(self, data: Dict[str, Any]):
+                """Handle user reactions save API request."""
+                user_id = data.get('user_id')
+                emojis = data.get('emojis', [])
+                mode = data.get('mode', 'random')
+
+                if user_id:
+                    web_server.db.set_user_reactions(user_id, emojis, mode)
+                    self._send_json_response({'success': True})
+                else:
+                    self._send_error_response(400, "Missing user_id")
+
+            def _handle_remove_user_reactions(self, data: Dict[str, Any]):
+                """Handle user reactions removal API request."""
+                user_id = data.get('user_id')
+                if user_id:
+                    web_server.db.remove_user_reactions(user_id)
+                    self._send_json_response({'success': True})
+                else:
+                    self._send_error_response(400, "Missing user_id")
+
+            def _handle_setup_sync(self, data: Dict[str, Any]):
+                """Handle group sync API request."""
+                # Get setup status to find bot phone
+                status = web_server.setup_service.get_setup_status()
+                bot_phone = status.get('bot_phone_number')
+
+                if not bot_phone:
+                    self._send_json_response({
+                        'success': False,
+                        'message': 'Bot not configured'
+                    })
+                    return
+
+                # Use the enhanced sync_groups_to_database method with JSON output
+                synced_count = web_server.setup_service.sync_groups_to_database()
+
+                self._send_json_response({
+                    'success': True,
+                    'synced_count': synced_count
+                })
+
+            def _handle_setup_sync_users(self, data: Dict[str, Any]):
+                """Handle user sync API request."""
+                # Use the new sync_users_to_database method that includes friendly name logic
+                synced_count = web_server.setup_service.sync_users_to_database()
+
+                # Get updated user counts
+                user_stats = web_server.db.get_user_statistics()
+
+                self._send_json_response({
+                    'success': synced_count > 0,
+                    'synced_count': synced_count,
+                    'total_users': user_stats['total'],
+                    'configured_users': user_stats['configured'],
+                    'discovered_users': user_stats['discovered']
+                })
+
+            def _handle_setup_clean_import(self, data: Dict[str, Any]):
+                """Handle clean import API request."""
+                # Use the new clean_import method that combines users and groups
+                result = web_server.setup_service.clean_import()
+                self._send_json_response(result)
+
+            def _handle_group_monitor(self, data: Dict[str, Any]):
+                """Handle group monitoring toggle API request."""
+                group_id = data.get('group_id')
+                is_monitored = data.get('is_monitored', False)
+
+                if group_id:
+                    web_server.db.set_group_monitoring(group_id, is_monitored)
+                    self._send_json_response({'success': True})
+                else:
+                    self._send_error_response(400, "Missing group_id")
+
+            def _serve_attachment(self, path: str, query: Dict[str, Any]):
+                """Serve attachment files from the database, downscaled when an image width is requested."""
                 try:
                     # Extract attachment ID from path /attachment/{attachment_id}
                     attachment_id = path.split('/attachment/')[-1]
@@ -503,12 +779,15 @@ class ModularWebServer:
                         self._send_error_response(404, "Attachment not found")
                         return
 
-                    # Get attachment data from database using DatabaseManager's context manager
+                    # Look up attachment metadata first; the blob itself is only loaded if the
+                    # on-disk copy is unavailable
                     with web_server.db._get_connection() as conn:
                         cursor = conn.cursor()
                         # Try both attachment_id and sticker_id, prioritizing entries with file_data
                         cursor.execute("""
-                            SELECT file_data, content_type, filename
+                            SELECT id, content_type, filename, file_path,
+                                   length(file_data) as data_size,
+                                   substr(file_data, 1, 12) as magic
                             FROM attachments
                             WHERE (attachment_id = ? OR sticker_id = ?)
                             AND file_data IS NOT NULL
@@ -522,8 +801,8 @@ class ModularWebServer:
                         self._send_error_response(404, "Attachment not found")
                         return
 
-                    file_data = attachment['file_data'] if attachment else None
-                    if not file_data:
+                    data_size = attachment['data_size']
+                    if not data_size:
                         logging.warning(f"Attachment {attachment_id} has no file data stored")
                         self._send_error_response(404, "Attachment data not found")
                         return
@@ -532,18 +811,51 @@ class ModularWebServer:
                     content_type = attachment['content_type'] if attachment['content_type'] else 'application/octet-stream'
                     # For stickers, use image/webp or detect from file data
                     if content_type == 'sticker':
+                        magic = attachment['magic'] or b''
                         # Try to detect from file data magic bytes
-                        if file_data[:4] == b'\x89PNG':
+                        if magic[:4] == b'\x89PNG':
                             content_type = 'image/png'
-                        elif file_data[:4] == b'RIFF' and file_data[8:12] == b'WEBP':
+                        elif magic[:4] == b'RIFF' and magic[8:12] == b'WEBP':
                             content_type = 'image/webp'
                         else:
                             content_type = 'image/webp'  # Default for stickers
 
+                    # The stored file is a copy of the blob; stream it when it is still intact
+                    file_path = attachment['file_path']
+                    on_disk = False
+                    if file_path:
+                        try:
+                            on_disk = os.path.getsize(file_path) == data_size
+                        except OSError:
+                            on_disk = False
+
+                    def load_file_data():
+                        with web_server.db._get_connection() as conn:
+                            cursor = conn.cursor()
+                            cursor.execute("SELECT file_data FROM attachments WHERE id = ?", (attachment['id'],))
+                            return cursor.fetchone()['file_data']
+
+                    width = query.get('w', [''])[0]
+                    if width.isdigit() and content_type.startswith('image/'):
+                        thumbnail = web_server.thumbnails.get(
+                            str(attachment['id']), int(width),
+                            lambda: open(file_path, 'rb') if on_disk else io.BytesIO(load_file_data()))
+                        if thumbnail:
+                            thumb_path, thumb_type = thumbnail
+                            with open(thumb_path, 'rb') as f:
+                                self.send_response(200)
+                                self.send_header('Content-Type', thumb_type)
+                                self.send_header('Content-Length', str(os.fstat(f.fileno()).st_size))
+                                self.end_headers()
+                                self._stream_file(f)
+                            return
+
+                    file_data = None if on_disk else load_file_data()
+
                     # Send headers
                     self.send_response(200)
                     self.send_header('Content-Type', content_type)
-                    self.send_header('Content-Length', str(len(file_data)))
+                    self.send_header('Content-Length', str(data_size))
 
                     if attachment['filename']:
                         self.send_header('Content-Disposition', f'inline; filename="{attachment["filename"]}"')
@@ -551,15 +863,19 @@ class ModularWebServer:
                     self.end_headers()
 
                     # Send file data
-                    self.wfile.write(file_data)
-
-                    logging.debug(f"Served attachment {attachment_id} ({len(file_data)} bytes) from database")
+                    if on_disk:
+                        with open(file_path, 'rb') as f:
+                            self._stream_file(f)
+                        logging.debug(f"Served attachment {attachment_id} ({data_size} bytes) from {file_path}")
+                    else:
+                        self.wfile.write(file_data)
+                        logging.debug(f"Served attachment {attachment_id} ({data_size} bytes) from database")
 
                 except Exception as e:
                     logging.error(f"Error serving attachment {path}: {e}")
                     self._send_error_response(500, "Error serving attachment")
 
-            def _handle_ai_status(self):
+            def _handle_ai_status(self, query: Dict[str, Any] = None):
                 """Handle AI status API request."""
                 try:
                     from services.ai_provider import get_ai_status
@@ -573,7 +889,7 @@ class ModularWebServer:
                         'active_provider': None
                     })
 
-            def _handle_ai_config(self):
+            def _handle_ai_config(self, query: Dict[str, Any] = None):
                 """Handle AI config GET API request."""
                 try:
                     from services.ai_provider import get_ai_status
@@ -590,11 +906,9 @@ class ModularWebServer:
                         'error': str(e)
                     })
 
-            def _handle_save_ai_config(self, post_data: str):
+            def _handle_save_ai_config(self, data: Dict[str, Any]):
                 """Handle AI config save API request."""
                 try:
-                    data = json.loads(post_data) if post_data else {}
-
                     from services.ai_provider import save_ai_configuration
 
                     # Extract configuration from request
@@ -736,10 +1050,8 @@ class ModularWebServer:
                     user_date_str = query.get('date', [None])[0]
 
                     if user_date_str:
-                        from datetime import datetime
-                        user_date = datetime.strptime(user_date_str, '%Y-%m-%d').date()
+                        user_date = date.fromisoformat(user_date_str)
                     else:
-                        from datetime import date
                         user_date = date.today()
 
                     # Get group info
@@ -772,26 +1084,15 @@ class ModularWebServer:
 
                             filtered_messages.append(msg)
 
-                        # Check for cached sentiment analysis
-                        cached_result = web_server.db.get_sentiment_analysis(group_id, user_date)
+                        # Check for cached sentiment analysis, with its metadata in the same query
+                        record = web_server.db.get_sentiment_analysis_record(group_id, user_date)
                         cached_info = None
-                        if cached_result:
-                            # Get metadata about the cached analysis
-                            with web_server.db._get_connection() as conn:
-                                cursor = conn.cursor()
-                                cursor.execute("""
-                                    SELECT created_at, message_count FROM sentiment_analysis
-                                    WHERE group_id = ? AND analysis_date = ?
-                                """, (group_id, user_date.strftime('%Y-%m-%d')))
-                                row = cursor.fetchone()
-
-                                if row:
-                                    from datetime import datetime
-                                    cached_info = {
-                                        'has_cached': True,
-                                        'analyzed_at': row['created_at'],
-                                        'cached_message_count': row['message_count']
-                                    }
+                        if record and record['analysis_result']:
+                            cached_info = {
+                                'has_cached': True,
+                                'analyzed_at': record['created_at'],
+                                'cached_message_count': record['message_count']
+                            }
 
                         # Get AI status without preloading (faster for preview)
                         from services.ai_provider import get_ai_status
@@ -852,25 +1153,15 @@ class ModularWebServer:
                     user_timezone = query.get('timezone', [None])[0] or 'Asia/Tokyo'  # Default timezone
                     user_date_str = query.get('date', [None])[0]
                     if user_date_str:
-                        from datetime import datetime
-                        user_date = datetime.strptime(user_date_str, '%Y-%m-%d').date()
+                        user_date = date.fromisoformat(user_date_str)
                     else:
-                        from datetime import date
                         user_date = date.today()
 
-                    # Try to get cached result
-                    cached_result = web_server.db.get_sentiment_analysis(group_id, user_date)
+                    # Try to get cached result, with its metadata in the same query
+                    row = web_server.db.get_sentiment_analysis_record(group_id, user_date)
+                    cached_result = row['analysis_result'] if row else None
 
                     if cached_result:
-                        # Get additional metadata from database
-                        with web_server.db._get_connection() as conn:
-                            cursor = conn.cursor()
-                            cursor.execute("""
-                                SELECT created_at, message_count FROM sentiment_analysis
-                                WHERE group_id = ? AND analysis_date = ?
-                            """, (group_id, user_date.strftime('%Y-%m-%d')))
-                            row = cursor.fetchone()
-
                         # Split header from analysis in cached results
                         # Cached results have format: "Header info...\n\n<actual analysis>"
                         if '\n\n' in cached_result:
@@ -916,7 +1207,8 @@ class ModularWebServer:
                             # Fallback for results without header separation
                             combined_result = convert_markdown_to_html(cached_result)
 
-                        self._send_json_response({
+                        # A stored analysis only changes when it is regenerated, so let the browser revalidate it
+                        self._send_json_revalidated({
                             'status': 'success',
                             'cached': True,
                             'result': {
@@ -945,7 +1237,7 @@ class ModularWebServer:
                     # Check if this is a status check
                     job_id = query.get('job_id', [None])[0]
                     if job_id:
-                        return self._handle_sentiment_status(job_id)
+                        return self._handle_sentiment_status(job_id, query)
 
                     group_id = query.get('group_id', [None])[0]
                     if not group_id:
@@ -965,13 +1257,10 @@ class ModularWebServer:
                     # Parse user's date
                     if user_date_str:
                         try:
-                            from datetime import datetime
-                            user_date = datetime.strptime(user_date_str, '%Y-%m-%d').date()
+                            user_date = date.fromisoformat(user_date_str)
                         except ValueError:
-                            from datetime import date
                             user_date = date.today()
                     else:
-                        from datetime import date
                         user_date = date.today()
 
                     # Create a unique job ID
@@ -982,10 +1271,7 @@ class ModularWebServer:
                     group_name = group_info.group_name if group_info else 'Unknown Group'
 
                     # Store job info in the server instance
-                    if not hasattr(web_server, '_analysis_jobs'):
-                        web_server._analysis_jobs = {}
-
-                    web_server._analysis_jobs[job_id] = {
+                    web_server._analysis_jobs.create(job_id, {
                         'status': 'running',
                         'group_id': group_id,
                         'group_name': group_name,
@@ -993,7 +1279,7 @@ class ModularWebServer:
                         'result': None,
                         'error': None,
                         'current_step': 'Starting analysis'
-                    }
+                    })
 
                     # Start analysis in background thread
                     def run_analysis():
@@ -1003,16 +1289,16 @@ class ModularWebServer:
                                 ai_provider = web_server.sentiment_analyzer.ai_provider
                                 if hasattr(ai_provider, 'is_model_loaded') and hasattr(ai_provider, 'provider_name'):
                                     if ai_provider.provider_name == 'ollama':
-                                        web_server._analysis_jobs[job_id]['current_step'] = 'Checking AI model status'
+                                        web_server._analysis_jobs.update(job_id, current_step='Checking AI model status')
                                         import time
                                         time.sleep(0.5)  # Brief pause for status to be visible
 
                                         if not ai_provider.is_model_loaded():
-                                            web_server._analysis_jobs[job_id]['current_step'] = 'Loading AI model - this may take a moment'
+                                            web_server._analysis_jobs.update(job_id, current_step='Loading AI model - this may take a moment')
                                         else:
-                                            web_server._analysis_jobs[job_id]['current_step'] = 'AI model ready - analyzing messages'
+                                            web_server._analysis_jobs.update(job_id, current_step='AI model ready - analyzing messages')
 
-                            web_server._analysis_jobs[job_id]['current_step'] = 'Processing sentiment analysis'
+                            web_server._analysis_jobs.update(job_id, current_step='Processing sentiment analysis')
 
                             if web_server.sentiment_analyzer:
                                 analysis = web_server.sentiment_analyzer.analyze_group_daily_sentiment(
@@ -1023,22 +1309,17 @@ class ModularWebServer:
                                 )
 
                                 if analysis:
-                                    web_server._analysis_jobs[job_id]['status'] = 'completed'
-                                    web_server._analysis_jobs[job_id]['result'] = analysis
+                                    web_server._analysis_jobs.update(job_id, status='completed', result=analysis)
                                 else:
-                                    web_server._analysis_jobs[job_id]['status'] = 'error'
-                                    web_server._analysis_jobs[job_id]['error'] = 'Failed to generate sentiment analysis'
+                                    web_server._analysis_jobs.update(job_id, status='error', error='Failed to generate sentiment analysis')
                             else:
-                                web_server._analysis_jobs[job_id]['status'] = 'error'
-                                web_server._analysis_jobs[job_id]['error'] = 'Sentiment analyzer not available'
+                                web_server._analysis_jobs.update(job_id, status='error', error='Sentiment analyzer not available')
 
                         except Exception as e:
-                            web_server._analysis_jobs[job_id]['status'] = 'error'
-                            web_server._analysis_jobs[job_id]['error'] = str(e)
+                            web_server._analysis_jobs.update(job_id, status='error', error=str(e))
 
-                    # Start background thread
-                    thread = threading.Thread(target=run_analysis, daemon=True)
-                    thread.start()
+                    # Queue on the shared worker pool
+                    web_server.analysis_executor.submit(run_analysis)
 
                     # Return job ID immediately
                     self._send_json_response({
@@ -1054,18 +1335,17 @@ class ModularWebServer:
                         'error': str(e)
                     })
 
-            def _handle_sentiment_status(self, job_id: str):
+            def _handle_sentiment_status(self, job_id: str, query: Dict[str, Any]):
                 """Check status of sentiment analysis job."""
                 try:
-                    if not hasattr(web_server, '_analysis_jobs') or job_id not in web_server._analysis_jobs:
+                    job = self._wait_for_job(web_server._analysis_jobs, job_id, query)
+                    if job is None:
                         self._send_json_response({
                             'status': 'error',
                             'error': 'Job not found'
                         })
                         return
 
-                    job = web_server._analysis_jobs[job_id]
-
                     if job['status'] == 'completed':
                         # Job completed successfully - format result with markdown conversion
                         job_result = job['result']
@@ -1100,16 +1380,12 @@ class ModularWebServer:
                             'status': 'completed',
                             'result': combined_html
                         })
-                        # Clean up completed job
-                        del web_server._analysis_jobs[job_id]
                     elif job['status'] == 'error':
                         # Job failed
                         self._send_json_response({
                             'status': 'error',
                             'error': job['error']
                         })
-                        # Clean up failed job
-                        del web_server._analysis_jobs[job_id]
                     else:
                         # Job still running
                         self._send_json_response({
@@ -1157,8 +1433,7 @@ class ModularWebServer:
                     # For display purposes, use the end_date (or today if no date specified)
                     if end_date:
                         user_date_str = end_date
-                        from datetime import datetime
-                        user_date = datetime.strptime(user_date_str, '%Y-%m-%d').date()
+                        user_date = date.fromisoformat(user_date_str)
                     else:
                         # No date filter - use today in user's timezone
                         try:
@@ -1168,7 +1443,6 @@ class ModularWebServer:
                             user_date = datetime.now(tz).date()
                             user_date_str = user_date.isoformat()
                         except (ImportError, Exception):
-                            from datetime import date
                             user_date = date.today()
                             user_date_str = user_date.isoformat()
 
@@ -1185,20 +1459,15 @@ class ModularWebServer:
                             return
                         group_name = group.group_name or f"Group {group_id[:8]}"
 
-                    # Get REAL-TIME message count using the same shared database method
-                    messages = web_server.db.get_messages_by_group_with_names_filtered(
+                    # Get REAL-TIME message count using the same shared filters, without loading the rows
+                    message_count = min(web_server.db.get_message_count_filtered(
                         group_id=group_id,
                         sender_uuid=sender_id,
                         attachments_only=attachments_only,
                         start_date=start_date,
                         end_date=end_date,
-                        user_timezone=user_timezone,
-                        limit=1000,
-                        offset=0
-                    )
-
-                    # Count actual messages retrieved
-                    message_count = len(messages)
+                        user_timezone=user_timezone
+                    ), ANALYSIS_MESSAGE_LIMIT)
 
                     # Simple response matching sentiment preview style
                     self._send_json_response({
@@ -1235,10 +1504,8 @@ class ModularWebServer:
                     hours = int(query.get('hours', [24])[0])
 
                     if user_date_str:
-                        from datetime import datetime
-                        user_date = datetime.strptime(user_date_str, '%Y-%m-%d').date()
+                        user_date = date.fromisoformat(user_date_str)
                     else:
-                        from datetime import date
                         user_date = date.today()
 
                     # Try to get cached result
@@ -1297,7 +1564,7 @@ class ModularWebServer:
                     # Check if this is a status check for an existing job
                     job_id = query.get('job_id', [None])[0]
                     if job_id:
-                        return self._handle_summary_status(job_id)
+                        return self._handle_summary_status(job_id, query)
 
                     # Check if force refresh is requested
                     force_refresh = query.get('force', [False])[0] == 'true'
@@ -1321,15 +1588,12 @@ class ModularWebServer:
 
                     # Get the user date string for the summarizer
                     if filters['date_mode'] == 'today':
-                        from datetime import date
                         user_date = date.today()
                         user_date_str = user_date.isoformat()
                     elif filters['date']:
                         user_date_str = filters['date']
-                        from datetime import datetime
-                        user_date = datetime.strptime(user_date_str, '%Y-%m-%d').date()
+                        user_date = date.fromisoformat(user_date_str)
                     else:
-                        from datetime import date
                         user_date = date.today()
                         user_date_str = user_date.isoformat()
 
@@ -1387,11 +1651,7 @@ class ModularWebServer:
 
                         job_id = str(uuid.uuid4())
 
-                        # Initialize jobs dict if needed
-                        if not hasattr(web_server, '_summary_jobs'):
-                            web_server._summary_jobs = {}
-
-                        web_server._summary_jobs[job_id] = {
+                        web_server._summary_jobs.create(job_id, {
                             'status': 'running',
                             'group_id': group_id,
                             'group_name': group_name,
@@ -1399,17 +1659,17 @@ class ModularWebServer:
                             'result': None,
                             'error': None,
                             'current_step': 'Initializing'
-                        }
+                        })
 
                         def run_summary():
                             try:
-                                web_server._summary_jobs[job_id]['current_step'] = 'Preloading AI model'
+                                web_server._summary_jobs.update(job_id, current_step='Preloading AI model')
 
                                 # Preload AI model
                                 from services.ai_provider import get_ai_response
                                 get_ai_response("test", timeout=5)
 
-                                web_server._summary_jobs[job_id]['current_step'] = 'Fetching messages'
+                                web_server._summary_jobs.update(job_id, current_step='Fetching messages')
 
                                 # Get messages using the SAME logic as other tabs
                                 messages = web_server.db.get_messages_by_group_with_names_filtered(
@@ -1419,14 +1679,14 @@ class ModularWebServer:
                                     start_date=start_date,
                                     end_date=end_date,
                                     user_timezone=user_timezone,
-                                    limit=1000,
+                                    limit=ANALYSIS_MESSAGE_LIMIT,
                                     offset=0
                                 )
 
                                 # Count actual messages retrieved
                                 message_count = len(messages)
 
-                                web_server._summary_jobs[job_id]['current_step'] = 'Generating summary'
+                                web_server._summary_jobs.update(job_id, current_step='Generating summary')
 
                                 # Now pass the already-filtered messages to the summarizer
                                 # Now using AI analysis service for summarization
@@ -1453,19 +1713,15 @@ class ModularWebServer:
                                         is_local
                                     )
 
-                                    web_server._summary_jobs[job_id]['status'] = 'completed'
-                                    web_server._summary_jobs[job_id]['result'] = result
+                                    web_server._summary_jobs.update(job_id, status='completed', result=result)
                                 else:
-                                    web_server._summary_jobs[job_id]['status'] = 'error'
-                                    web_server._summary_jobs[job_id]['error'] = result.get('error', 'Failed to generate summary') if result else 'Failed to generate summary'
+                                    web_server._summary_jobs.update(job_id, status='error', error=result.get('error', 'Failed to generate summary') if result else 'Failed to generate summary')
 
                             except Exception as e:
-                                web_server._summary_jobs[job_id]['status'] = 'error'
-                                web_server._summary_jobs[job_id]['error'] = str(e)
+                                web_server._summary_jobs.update(job_id, status='error', error=str(e))
 
-                        # Start background thread
-                        thread = threading.Thread(target=run_summary, daemon=True)
-                        thread.start()
+                        # Queue on the shared worker pool
+                        web_server.analysis_executor.submit(run_summary)
 
                         # Return job ID immediately
                         self._send_json_response({
@@ -1484,7 +1740,7 @@ class ModularWebServer:
                             start_date=start_date,
                             end_date=end_date,
                             user_timezone=user_timezone,
-                            limit=1000,
+                            limit=ANALYSIS_MESSAGE_LIMIT,
                             offset=0
                         )
 
@@ -1579,31 +1835,26 @@ class ModularWebServer:
                         'error': str(e)
                     })
 
-            def _handle_summary_status(self, job_id: str):
+            def _handle_summary_status(self, job_id: str, query: Dict[str, Any]):
                 """Check status of summary generation job."""
                 try:
-                    if not hasattr(web_server, '_summary_jobs') or job_id not in web_server._summary_jobs:
+                    job = self._wait_for_job(web_server._summary_jobs, job_id, query)
+                    if job is None:
                         self._send_json_response({
                             'status': 'error',
                             'error': 'Job not found'
                         })
                         return
 
-                    job = web_server._summary_jobs[job_id]
-
                     if job['status'] == 'completed':
                         # Job completed successfully - return result
                         self._send_json_response(job['result'])
-                        # Clean up completed job
-                        del web_server._summary_jobs[job_id]
                     elif job['status'] == 'error':
                         # Job failed
                         self._send_json_response({
                             'status': 'error',
                             'error': job['error']
                         })
-                        # Clean up failed job
-                        del web_server._summary_jobs[job_id]
                     else:
                         # Job still running
                         self._send_json_response({
@@ -1622,8 +1873,6 @@ class ModularWebServer:
             def _handle_stats(self, query: dict = None):
                 """Handle statistics API request."""
                 try:
-                    stats = {}
-
                     # Get user timezone from query
                     user_timezone = 'Asia/Tokyo'
                     if query:
@@ -1631,54 +1880,22 @@ class ModularWebServer:
                         if timezone_param:
                             user_timezone = timezone_param
 
-                    # Get message statistics
-                    with web_server.db._get_connection() as conn:
-                        cursor = conn.cursor()
-
-                        # Total messages
-                        cursor.execute("SELECT COUNT(*) as count FROM messages")
-                        stats['total_messages'] = cursor.fetchone()['count']
-
-                        # Messages today - with timezone support
-                        try:
-                            import pytz
-                            from datetime import datetime
-
-                            tz = pytz.timezone(user_timezone)
-                            now_tz = datetime.now(tz)
-                            start_of_today = now_tz.replace(hour=0, minute=0, second=0, microsecond=0)
-                            start_timestamp_ms = int(start_of_today.timestamp() * 1000)
-
-                            cursor.execute("SELECT COUNT(*) as count FROM messages WHERE timestamp >= ?", (start_timestamp_ms,))
-                            stats['messages_today'] = cursor.fetchone()['count']
-                        except Exception:
-                            # Fallback to UTC if timezone fails
-                            cursor.execute("""
-                                SELECT COUNT(*) as count FROM messages
-                                WHERE date(timestamp/1000, 'unixepoch') = date('now')
-                            """)
-                            stats['messages_today'] = cursor.fetchone()['count']
-
-                        # Active groups
-                        cursor.execute("""
-                            SELECT COUNT(DISTINCT group_id) as count
-                            FROM messages
-                            WHERE timestamp > (strftime('%s', 'now') - 86400) * 1000
-                        """)
-                        stats['active_groups'] = cursor.fetchone()['count']
-
-                        # Total users
-                        cursor.execute("SELECT COUNT(*) as count FROM users")
-                        stats['total_users'] = cursor.fetchone()['count']
-
-                        # Total groups
-                        cursor.execute("SELECT COUNT(*) as count FROM groups")
-                        stats['total_groups'] = cursor.fetchone()['count']
-
-                        # Database size
-                        cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
-                        db_size = cursor.fetchone()['size']
-                        stats['database_size'] = f"{db_size / (1024*1024):.1f} MB"
+                    # Start of today in the user's timezone
+                    try:
+                        import pytz
+                        tz = pytz.timezone(user_timezone)
+                    except Exception:
+                        # Fallback to UTC if timezone fails
+                        from datetime import timezone
+                        tz = timezone.utc
+                    now_tz = datetime.now(tz)
+                    start_of_today = now_tz.replace(hour=0, minute=0, second=0, microsecond=0)
+                    start_timestamp_ms = int(start_of_today.timestamp() * 1000)
+
+                    # Concurrent requests are coalesced into a single combined query
+                    stats = web_server.stats_batcher.submit(start_timestamp_ms).result(timeout=10)
+                    db_size = stats['database_size'] or 0
+                    stats['database_size'] = f"{db_size / (1024*1024):.1f} MB"
 
                     self._send_json_response(stats)
 
@@ -1686,7 +1903,7 @@ class ModularWebServer:
                     logging.error(f"Error getting stats: {e}")
                     self._send_json_response({'error': str(e)})
 
-            def _handle_system_status(self):
+            def _handle_system_status(self, query: Dict[str, Any] = None):
                 """Handle system status API request."""
                 try:
                     import psutil
@@ -1729,7 +1946,7 @@ class ModularWebServer:
                     logging.error(f"Error getting system status: {e}")
                     self._send_json_response({'error': str(e)})
 
-            def _handle_backups(self):
+            def _handle_backups(self, query: Dict[str, Any] = None):
                 """Handle backups API request."""
                 try:
                     import os
@@ -1777,7 +1994,40 @@ class ModularWebServer:
                     logging.error(f"Error getting backups: {e}")
                     self._send_json_response({'error': str(e)})
 
-            def _handle_ai_analysis_types(self):
+            def _handle_activity_hourly(self, query: Dict[str, Any]):
+                """Get hour-of-day message counts for every matching group from one grouped query."""
+                try:
+                    from .shared.filters import GlobalFilterSystem
+
+                    user_timezone = query.get('timezone', ['UTC'])[0]
+                    filters = GlobalFilterSystem.parse_query_filters(query)
+                    start_date, end_date = GlobalFilterSystem.get_date_range_from_filters(filters, user_timezone)
+
+                    counts_by_group = web_server.db.get_hourly_activity_by_group(
+                        group_id=filters.get('group_id'),
+                        sender_uuid=filters.get('sender_id'),
+                        start_date=start_date.strftime('%Y-%m-%d') if start_date else None,
+                        end_date=end_date.strftime('%Y-%m-%d') if end_date else None,
+                        user_timezone=user_timezone,
+                        attachments_only=filters.get('attachments_only', False)
+                    )
+
+                    # Names come from the cached group lookups, not one query per group
+                    hourly_data = {}
+                    for group_id, counts in counts_by_group.items():
+                        group = web_server.db.get_group(group_id)
+                        hourly_data[group_id] = {
+                            'name': group.group_name if group and group.group_name else group_id,
+                            'counts': counts
+                        }
+
+                    self._send_json_response({'hourly_data': hourly_data})
+
+                except Exception as e:
+                    logging.error(f"Error getting hourly activity: {e}")
+                    self._send_json_response({'error': str(e), 'hourly_data': {}})
+
+            def _handle_ai_analysis_types(self, query: Dict[str, Any] = None):
                 """Get list of available AI analysis types."""
                 try:
                     types = web_server.ai_analysis_service.get_analysis_types(active_only=False)
@@ -1852,16 +2102,15 @@ class ModularWebServer:
                     else:
                         end_date_str = None
 
-                    messages = web_server.db.get_messages_by_group_with_names_filtered(
+                    # Count with the same filters the analysis will use, without loading the rows
+                    message_count = min(web_server.db.get_message_count_filtered(
                         group_id=group_id,
                         sender_uuid=sender_id,
                         attachments_only=attachments_only,
                         start_date=start_date_str,
                         end_date=end_date_str,
-                        user_timezone=user_timezone,
-                        limit=1000,
-                        offset=0
-                    )
+                        user_timezone=user_timezone
+                    ), ANALYSIS_MESSAGE_LIMIT)
 
                     # Get group name
                     group = web_server.db.get_group(group_id) if group_id else None
@@ -1870,7 +2119,7 @@ class ModularWebServer:
                     # Return preview info
                     self._send_json_response({
                         'status': 'success',
-                        'message_count': len(messages),
+                        'message_count': message_count,
                         'group_name': group_name,
                         'hours': hours,
                         'display_name': config['display_name'],
@@ -1939,7 +2188,7 @@ class ModularWebServer:
                         start_date=start_date_str,
                         end_date=end_date_str,
                         user_timezone=user_timezone,
-                        limit=1000,
+                        limit=ANALYSIS_MESSAGE_LIMIT,
                         offset=0
                     )
 
@@ -1952,14 +2201,11 @@ class ModularWebServer:
                         job_id = str(uuid.uuid4())
 
                         # Initialize job tracking
-                        if not hasattr(web_server, '_analysis_jobs'):
-                            web_server._analysis_jobs = {}
-
-                        web_server._analysis_jobs[job_id] = {
+                        web_server._analysis_jobs.create(job_id, {
                             'status': 'running',
                             'step': 'Analyzing messages...',
                             'created': time.time()
-                        }
+                        })
 
                         def run_analysis():
                             try:
@@ -1972,19 +2218,15 @@ class ModularWebServer:
                                 )
 
                                 if result and result.get('status') == 'success':
-                                    web_server._analysis_jobs[job_id]['status'] = 'completed'
-                                    web_server._analysis_jobs[job_id]['result'] = result
+                                    web_server._analysis_jobs.update(job_id, status='completed', result=result)
                                 else:
-                                    web_server._analysis_jobs[job_id]['status'] = 'error'
-                                    web_server._analysis_jobs[job_id]['error'] = result.get('error', 'Analysis failed')
+                                    web_server._analysis_jobs.update(job_id, status='error', error=result.get('error', 'Analysis failed'))
 
                             except Exception as e:
-                                web_server._analysis_jobs[job_id]['status'] = 'error'
-                                web_server._analysis_jobs[job_id]['error'] = str(e)
+                                web_server._analysis_jobs.update(job_id, status='error', error=str(e))
 
-                        # Start background thread
-                        thread = threading.Thread(target=run_analysis, daemon=True)
-                        thread.start()
+                        # Queue on the shared worker pool
+                        web_server.analysis_executor.submit(run_analysis)
 
                         # Return job ID immediately
                         self._send_json_response({
@@ -2019,14 +2261,7 @@ class ModularWebServer:
                         })
                         return
 
-                    if not hasattr(web_server, '_analysis_jobs'):
-                        self._send_json_response({
-                            'status': 'error',
-                            'error': 'No jobs found'
-                        })
-                        return
-
-                    job = web_server._analysis_jobs.get(job_id)
+                    job = self._wait_for_job(web_server._analysis_jobs, job_id, query)
                     if not job:
                         self._send_json_response({
                             'status': 'error',
@@ -2034,12 +2269,6 @@ class ModularWebServer:
                         })
                         return
 
-                    # Clean up old completed jobs (older than 5 minutes)
-                    current_time = time.time()
-                    for old_job_id, old_job in list(web_server._analysis_jobs.items()):
-                        if old_job['status'] in ['completed', 'error'] and current_time - old_job['created'] > 300:
-                            del web_server._analysis_jobs[old_job_id]
-
                     self._send_json_response(job)
 
                 except Exception as e:
@@ -2048,6 +2277,49 @@ class ModularWebServer:
                         'error': str(e)
                     })
 
+            def _wait_for_job(self, jobs: JobStore, job_id: str, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                """Get a job for a status request; with ?wait=<seconds>, hold a running job until it changes."""
+                job = jobs.get(job_id)
+                try:
+                    wait = min(float(query.get('wait', ['0'])[0]), JOB_STATUS_MAX_WAIT)
+                except ValueError:
+                    wait = 0
+                if job is not None and wait > 0 and job.get('status') in ('running', 'processing'):
+                    job = jobs.wait_for_change(job_id, job, wait)
+                return job
+
+            def _handle_ai_analysis_stream(self, query: Dict[str, Any]):
+                """Stream AI analysis job status as server-sent events, one per change, until it finishes."""
+                job_id = query.get('job_id', [None])[0]
+                job = web_server._analysis_jobs.get(job_id) if job_id else None
+                if not job:
+                    self._send_error_response(404, "Job not found")
+                    return
+
+                # No Content-Length, so the end of the stream is marked by closing the connection
+                self.close_connection = True
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('X-Accel-Buffering', 'no')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+
+                deadline = time.monotonic() + JOB_STREAM_MAX_DURATION
+                try:
+                    self.wfile.write(b'data: ' + encode_json(job) + b'\n\n')
+                    self.wfile.flush()
+                    while job.get('status') in ('running', 'processing') and time.monotonic() < deadline:
+                        update = web_server._analysis_jobs.wait_for_change(job_id, job, JOB_STREAM_KEEPALIVE)
+                        if update is None:
+                            break
+                        self.wfile.write(b': keepalive\n\n' if update == job else b'data: ' + encode_json(update) + b'\n\n')
+                        self.wfile.flush()
+                        job = update
+                except (BrokenPipeError, ConnectionResetError):
+                    # The page was closed or navigated away; the job carries on regardless
+                    pass
+
             def _handle_create_analysis_type(self, config: Dict[str, Any]):
                 """Create new AI analysis type."""
                 try:
@@ -2184,10 +2456,10 @@ class ModularWebServer:
                         'error': str(e)
                     })
 
-            def _handle_update_analysis_type(self, type_id: str, data_str: str):
+            def _handle_update_analysis_type(self, type_id: str, data_str: bytes):
                 """Update an AI analysis type."""
                 try:
-                    data = json.loads(data_str) if data_str else {}
+                    data = decode_json(data_str) if data_str else {}
 
                     # Extract update fields from the request
                     update_fields = {}
@@ -4,18 +4,74 @@ Base page class for Signal Bot web interface.
 Provides consistent structure and functionality for all pages.
 """
 
+import html
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
 from urllib.parse import parse_qs
 
 from models.database import DatabaseManager
 from services.setup import SetupService
-from .templates import render_page, get_standard_date_selector
+from .templates import render_page, render_page_stream, get_standard_date_selector
+
+# Changes on restart so a deploy with new templates invalidates ETags issued by the old process
+_PROCESS_TOKEN = f"{time.time_ns():x}"
+
+
+@lru_cache(maxsize=64)
+def _resolve_timezone(name: Optional[str]) -> tzinfo:
+    """Look up a timezone by name once per process, falling back to UTC if it is unknown."""
+    if not name:
+        return timezone.utc
+    try:
+        import pytz
+        return pytz.timezone(name)
+    except Exception:
+        return timezone.utc
+
+
+@lru_cache(maxsize=4096)
+def _format_user_display(uuid: str, friendly_name: Optional[str], phone_number: Optional[str],
+                         display_name: Optional[str]) -> str:
+    """Build the user display HTML; cached on every field it reads, so user edits are never stale."""
+    # Names and numbers come from Signal profiles; escape them once here rather than per render
+    uuid_h = html.escape(uuid or '')
+    phone_h = html.escape(phone_number or '')
+
+    # Check if friendly name exists and is not the generic fallback
+    if (friendly_name and
+        friendly_name != f"User {phone_number}" and
+        friendly_name != f"User {uuid}"):
+        # Real friendly name exists - use it with phone/UUID in parentheses
+        if phone_number:
+            return f'<strong>{html.escape(friendly_name)}</strong><br><small class="text-muted">{phone_h}</small>'
+        else:
+            return f'<strong>{html.escape(friendly_name)}</strong><br><small class="text-muted">UUID: {uuid_h}</small>'
+    elif phone_number:
+        # No real friendly name, show phone number
+        return f'<strong>{phone_h}</strong><br><small class="text-muted">UUID: {uuid_h}</small>'
+    elif display_name:
+        # No friendly name or phone, show display name with UUID
+        return f'<strong>{html.escape(display_name)}</strong><br><small class="text-muted">UUID: {uuid_h}</small>'
+    else:
+        # Only UUID available
+        return f'<strong>UUID: {uuid_h}</strong><br><small class="text-muted">No phone number</small>'
 
 
 class BasePage(ABC):
     """Base class for all web pages."""
 
+    # Shared class-level logger; pages may override it with their own
+    logger = logging.getLogger(__name__)
+
+    # Pages whose output depends only on database state can opt into ETag revalidation
+    etag_from_data = False
+    # Seconds an ETag stays valid for pages that also read the clock (e.g. "today" filters)
+    etag_ttl: Optional[int] = None
+
     def __init__(self, db: DatabaseManager, setup_service: SetupService, ai_provider=None):
         self.db = db
         self.setup_service = setup_service
@@ -47,6 +103,10 @@ class BasePage(ABC):
         """Render the main content of the page."""
         pass
 
+    def render_content_chunks(self, query: Dict[str, Any]) -> Iterator[str]:
+        """Override to stream the main content in pieces; defaults to render_content in one piece."""
+        yield self.render_content(query)
+
     def get_custom_css(self) -> str:
         """Override to provide page-specific CSS."""
         return ""
@@ -55,6 +115,22 @@ class BasePage(ABC):
         """Override to provide page-specific JavaScript."""
         return ""
 
+    def get_page_scripts(self) -> List[str]:
+        """Override to provide page-specific JavaScript files under /static/."""
+        return []
+
+    def get_page_stylesheets(self) -> List[str]:
+        """Override to provide page-specific CSS files under /static/."""
+        return []
+
+    def get_etag(self, query: Dict[str, Any]) -> Optional[str]:
+        """Weak ETag tied to the database version, or None if the page must always be rendered."""
+        if not self.etag_from_data:
+            return None
+        if self.etag_ttl:
+            return f'W/"{_PROCESS_TOKEN}-{self.db.get_data_version()}-{int(time.time()) // self.etag_ttl:x}"'
+        return f'W/"{_PROCESS_TOKEN}-{self.db.get_data_version()}"'
+
     def render(self, query: Dict[str, Any]) -> str:
         """Render the complete page."""
         content = self.render_content(query)
@@ -64,7 +140,22 @@ class BasePage(ABC):
             content=content,
             active_page=self.nav_key,
             extra_css=self.get_custom_css(),
-            extra_js=self.get_custom_js()
+            extra_js=self.get_custom_js(),
+            scripts=self.get_page_scripts(),
+            stylesheets=self.get_page_stylesheets()
+        )
+
+    def render_stream(self, query: Dict[str, Any]) -> Iterator[bytes]:
+        """Render the complete page as encoded chunks, written to the client as they are produced."""
+        return render_page_stream(
+            title=self.title,
+            subtitle=self.subtitle,
+            content_chunks=self.render_content_chunks(query),
+            active_page=self.nav_key,
+            extra_css=self.get_custom_css(),
+            extra_js=self.get_custom_js(),
+            scripts=self.get_page_scripts(),
+            stylesheets=self.get_page_stylesheets()
         )
 
     def parse_query_string(self, query_string: str) -> Dict[str, Any]:
@@ -84,24 +175,12 @@ class BasePage(ABC):
         if user is None:
             return '<strong>Unknown User</strong><br><small class="text-muted">User not found</small>'
 
-        # Check if friendly name exists and is not the generic fallback
-        if (user.friendly_name and
-            user.friendly_name != f"User {user.phone_number}" and
-            user.friendly_name != f"User {user.uuid}"):
-            # Real friendly name exists - use it with phone/UUID in parentheses
-            if user.phone_number:
-                return f'<strong>{user.friendly_name}</strong><br><small class="text-muted">{user.phone_number}</small>'
-            else:
-                return f'<strong>{user.friendly_name}</strong><br><small class="text-muted">UUID: {user.uuid}</small>'
-        elif user.phone_number:
-            # No real friendly name, show phone number
-            return f'<strong>{user.phone_number}</strong><br><small class="text-muted">UUID: {user.uuid}</small>'
-        elif hasattr(user, 'display_name') and user.display_name:
-            # No friendly name or phone, show display name with UUID
-            return f'<strong>{user.display_name}</strong><br><small class="text-muted">UUID: {user.uuid}</small>'
-        else:
-            # Only UUID available
-            return f'<strong>UUID: {user.uuid}</strong><br><small class="text-muted">No phone number</small>'
+        return _format_user_display(
+            user.uuid,
+            user.friendly_name,
+            user.phone_number,
+            getattr(user, 'display_name', None)
+        )
 
     def get_standard_date_selector(self, input_id: str = "date-input", **kwargs) -> str:
         """Get standardized date selector."""
@@ -113,19 +192,8 @@ class BasePage(ABC):
             return "Unknown time"
 
         try:
-            from datetime import datetime, timezone
-            import pytz
-
-            # Convert milliseconds to datetime
-            dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-
-            # Convert to user timezone
-            if user_timezone:
-                try:
-                    user_tz = pytz.timezone(user_timezone)
-                    dt = dt.astimezone(user_tz)
-                except Exception:
-                    pass  # Fall back to UTC if timezone is invalid
+            # Convert milliseconds straight into the user's zone; the zone lookup is cached
+            dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=_resolve_timezone(user_timezone))
 
             # Format as readable string
             return dt.strftime('%Y-%m-%d %H:%M:%S')
@@ -0,0 +1,37 @@
+"""
+Content-Encoding negotiation for Signal Bot web interface.
+
+Reads Accept-Encoding headers with their q-values, so a coding the client
+refuses with q=0 is never sent.
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+
+@lru_cache(maxsize=64)
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value; malformed q-values count as refusals."""
+    codings = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        codings[coding] = q
+    return codings
+
+
+def accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """Check whether an Accept-Encoding header allows coding, falling back to its '*' entry when unlisted."""
+    codings = _parse_accept_encoding(accept_encoding)
+    q = codings.get(coding, codings.get('*', 0.0))
+    return q > 0
@@ -5,13 +5,27 @@ Provides reusable filter components and JavaScript functions
 that work consistently across all pages.
 """
 
-from typing import List, Dict, Any, Optional
+import html
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from config.constants import DEFAULTS
 
 
+@lru_cache(maxsize=64)
+def _render_options(all_label: str, options: Tuple[Tuple[str, str], ...], selected: Optional[str]) -> str:
+    """Render <option> tags for (value, label) pairs, cached since the lists rarely change between requests."""
+    parts = [f'<option value="">{all_label}</option>']
+    for value, label in options:
+        parts.append(f'<option value="{html.escape(value)}" {"selected" if value == selected else ""}>{html.escape(label)}</option>')
+    return ''.join(parts)
+
+
 class GlobalFilterSystem:
     """Manages global filters across all pages."""
 
+    # Client-side GlobalFilters module; include once on any page that uses render_filters
+    SCRIPT = '/static/js/global-filters.js'
+
     @staticmethod
     def render_filters(groups: List[Dict[str, Any]],
                       selected_group: Optional[str] = None,
@@ -37,24 +51,16 @@ class GlobalFilterSystem:
         Returns:
             HTML string for the filter bar
         """
-        # Build group options
-        group_options = ['<option value="">All Groups</option>']
-        for group in groups:
-            selected = 'selected' if group.get('group_id') == selected_group else ''
-            name = group.get('name', 'Unnamed Group')[:50]
-            group_options.append(
-                f'<option value="{group.get("group_id")}" {selected}>{name}</option>'
-            )
-
-        # Build sender options
-        sender_options = ['<option value="">All Senders</option>']
-        if senders:
-            for sender in senders:
-                selected = 'selected' if sender.get('uuid') == selected_sender else ''
-                name = sender.get('friendly_name') or sender.get('phone_number', 'Unknown')[:50]
-                sender_options.append(
-                    f'<option value="{sender.get("uuid")}" {selected}>{name}</option>'
-                )
+        # Build group and sender options; escaping and formatting are cached per list and selection
+        group_options = _render_options('All Groups', tuple(
+            (group.get('group_id') or '', group.get('name', 'Unnamed Group')[:50])
+            for group in groups
+        ), selected_group)
+
+        sender_options = _render_options('All Senders', tuple(
+            (sender.get('uuid') or '', sender.get('friendly_name') or sender.get('phone_number', 'Unknown')[:50])
+            for sender in senders or ()
+        ), selected_sender)
 
         # Build hours options
         hours_options = [
@@ -92,7 +98,7 @@ class GlobalFilterSystem:
                     </label>
                     <select id="global-group-filter" onchange="GlobalFilters.apply()"
                             style="padding: 6px; border: 1px solid #ddd; border-radius: 4px; font-size: 0.9em; width: 100%;">
-                        {''.join(group_options)}
+                        {group_options}
                     </select>
                 </div>
 
@@ -103,7 +109,7 @@ class GlobalFilterSystem:
                     </label>
                     <select id="global-sender-filter" onchange="GlobalFilters.apply()"
                             style="padding: 6px; border: 1px solid #ddd; border-radius: 4px; font-size: 0.9em; width: 100%;">
-                        {''.join(sender_options)}
+                        {sender_options}
                     </select>
                 </div>
 
@@ -131,7 +137,7 @@ class GlobalFilterSystem:
                                    style="margin-right: 3px;">
                             Pick Date
                         </label>
-                        <input type="date" id="global-date" value="{selected_date or ''}" onchange="GlobalFilters.apply()"
+                        <input type="date" id="global-date" value="{html.escape(selected_date or '')}" onchange="GlobalFilters.apply()"
                                style="padding: 5px; border: 1px solid #ddd; border-radius: 4px; font-size: 0.9em; display: {date_display};">
                     </div>
                 </div>
@@ -169,201 +175,6 @@ class GlobalFilterSystem:
         </div>
         """
 
-    @staticmethod
-    def get_javascript() -> str:
-        """
-        Get the JavaScript code for handling global filters.
-        This should be included once per page.
-        """
-        return """
-        // Global Filters JavaScript Module
-        const GlobalFilters = {
-            // Get all current filter values
-            getValues: function() {
-                const dateRadio = document.querySelector('input[name="date-mode"]:checked');
-                return {
-                    groupId: document.getElementById('global-group-filter') ? document.getElementById('global-group-filter').value : '',
-                    senderId: document.getElementById('global-sender-filter') ? document.getElementById('global-sender-filter').value : '',
-                    dateMode: dateRadio ? dateRadio.value : 'all',
-                    date: document.getElementById('global-date') ? document.getElementById('global-date').value : '',
-                    hours: document.getElementById('global-hours-filter') ? parseInt(document.getElementById('global-hours-filter').value) : 0,
-                    attachmentsOnly: document.getElementById('global-attachments-only') ? document.getElementById('global-attachments-only').checked : false
-                };
-            },
-
-            // Get filter values for API calls
-            getApiParams: function() {
-                const filters = this.getValues();
-                const params = new URLSearchParams();
-
-                if (filters.groupId) params.append('group_id', filters.groupId);
-                if (filters.senderId) params.append('sender_id', filters.senderId);
-                if (filters.hours) params.append('hours', filters.hours);
-                if (filters.attachmentsOnly) params.append('attachments_only', 'true');
-
-                // Handle date based on mode
-                if (filters.dateMode === 'today') {
-                    const today = new Date().toISOString().split('T')[0];
-                    params.append('date', today);
-                } else if (filters.dateMode === 'specific' && filters.date) {
-                    params.append('date', filters.date);
-                }
-
-                // Add timezone
-                const timezone = Intl.DateTimeFormat().resolvedOptions().timeZone;
-                params.append('timezone', timezone);
-
-                return params;
-            },
-
-            // Apply filters (navigate with parameters)
-            apply: function() {
-                console.log('GlobalFilters.apply() called');
-                const filters = this.getValues();
-                console.log('Current filters:', filters);
-
-                const currentUrl = new URL(window.location);
-                const params = currentUrl.searchParams;
-
-                // Keep the current tab if it exists
-                const currentTab = params.get('tab');
-
-                // Clear all filter params first
-                const keysToDelete = ['group_id', 'sender_id', 'date', 'date_mode', 'hours', 'attachments_only'];
-                keysToDelete.forEach(key => params.delete(key));
-
-                // Restore tab if it existed
-                if (currentTab) {
-                    params.set('tab', currentTab);
-                }
-
-                // Set new filter parameters
-                if (filters.groupId) {
-                    params.set('group_id', filters.groupId);
-                }
-
-                if (filters.senderId) {
-                    params.set('sender_id', filters.senderId);
-                }
-
-                params.set('date_mode', filters.dateMode);
-
-                if (filters.dateMode === 'specific' && filters.date) {
-                    params.set('date', filters.date);
-                } else if (filters.dateMode === 'today') {
-                    params.set('date', new Date().toISOString().split('T')[0]);
-                }
-
-                // Only set hours if not "All Time" (0)
-                if (filters.hours && filters.hours !== 0) {
-                    params.set('hours', filters.hours);
-                }
-
-                if (filters.attachmentsOnly) {
-                    params.set('attachments_only', 'true');
-                }
-
-                // Navigate to new URL
-                console.log('Navigating to:', currentUrl.toString());
-                window.location.href = currentUrl.toString();
-            },
-
-            // Reset all filters
-            reset: function() {
-                // Clear session storage to prevent filter persistence
-                if (typeof sessionStorage !== 'undefined') {
-                    sessionStorage.removeItem('signalbot_filters');
-                }
-
-                const currentUrl = new URL(window.location);
-                const tab = currentUrl.searchParams.get('tab');
-
-                // Keep only the tab parameter
-                const newUrl = new URL(window.location.pathname, window.location.origin);
-                if (tab) {
-                    newUrl.searchParams.set('tab', tab);
-                }
-
-                window.location.href = newUrl.toString();
-            },
-
-            // Handle group change (update sender options)
-            onGroupChange: function() {
-                const groupId = document.getElementById('global-group-filter').value;
-
-                // For now, just mark that we need to update senders
-                // This would typically make an API call to get group members
-                if (typeof updateSenderOptions === 'function') {
-                    updateSenderOptions();
-                }
-            },
-
-            // Handle date mode change
-            onDateModeChange: function() {
-                const dateMode = document.querySelector('input[name="date-mode"]:checked');
-                const dateInput = document.getElementById('global-date');
-
-                if (!dateMode || !dateInput) {
-                    console.error('Date mode elements not found:', {dateMode, dateInput});
-                    return;
-                }
-
-                const mode = dateMode.value;
-                console.log('Date mode changed to:', mode);
-
-                if (mode === 'specific') {
-                    dateInput.style.display = 'inline-block';
-                    // Set to today if no date selected
-                    if (!dateInput.value) {
-                        dateInput.value = new Date().toISOString().split('T')[0];
-                    }
-                } else {
-                    dateInput.style.display = 'none';
-                    if (mode === 'all') {
-                        dateInput.value = ''; // Clear date for "all dates"
-                    } else if (mode === 'today') {
-                        dateInput.value = new Date().toISOString().split('T')[0];
-                    }
-                }
-            },
-
-            // Initialize on page load
-            init: function() {
-                // Set initial state based on URL parameters
-                const params = new URLSearchParams(window.location.search);
-
-                // Restore filter values from URL if they exist
-                if (params.has('hours')) {
-                    const hoursSelect = document.getElementById('global-hours-filter');
-                    if (hoursSelect) {
-                        hoursSelect.value = params.get('hours');
-                    }
-                }
-
-                // Initialize date mode display
-                this.onDateModeChange();
-            }
-        };
-
-        // Initialize when DOM is ready
-        document.addEventListener('DOMContentLoaded', function() {
-            try {
-                GlobalFilters.init();
-                console.log('GlobalFilters initialized successfully');
-            } catch (e) {
-                console.error('Failed to initialize GlobalFilters:', e);
-            }
-        });
-
-        // Also try to initialize after a short delay as fallback
-        setTimeout(function() {
-            if (typeof GlobalFilters !== 'undefined' && typeof GlobalFilters.onDateModeChange === 'function') {
-                GlobalFilters.onDateModeChange();
-                console.log('Fallback initialization of date mode display');
-            }
-        }, 500);
-        """
-
     @staticmethod
     def parse_query_filters(query: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -0,0 +1,75 @@
+"""
+Background job tracking for Signal Bot web interface.
+
+Thread-safe store for the status of analysis jobs that run in background
+threads and are polled or streamed to the browser.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+class JobStore:
+    """Bounded, lock-protected job registry whose entries expire after a TTL."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        # Signalled on every change, so streams can wait for a job instead of polling it
+        self._changed = threading.Condition(self._lock)
+
+    def create(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Register a new job, evicting expired and then oldest entries to stay bounded."""
+        with self._lock:
+            self._purge_expired()
+            while len(self._jobs) >= self.maxsize:
+                oldest_id, _ = self._jobs.popitem(last=False)
+                self._expires.pop(oldest_id, None)
+            self._jobs[job_id] = dict(job)
+            self._expires[job_id] = time.monotonic() + self.ttl
+            self._changed.notify_all()
+
+    def update(self, job_id: str, **fields) -> None:
+        """Update fields of a job; ignored if the job has expired or been removed."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+                self._changed.notify_all()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a snapshot of a job, or None if it is unknown or expired."""
+        with self._lock:
+            return self._snapshot(job_id)
+
+    def wait_for_change(self, job_id: str, last: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait until a job no longer matches the snapshot last, then get a new snapshot.
+
+        Returns the unchanged snapshot if the timeout passes first, or None once the job is gone.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._jobs.get(job_id) != last, timeout)
+            return self._snapshot(job_id)
+
+    def _snapshot(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Copy a job, dropping it if it has expired; caller must hold the lock."""
+        expires = self._expires.get(job_id)
+        if expires is None:
+            return None
+        if expires <= time.monotonic():
+            self._jobs.pop(job_id, None)
+            self._expires.pop(job_id, None)
+            return None
+        return dict(self._jobs[job_id])
+
+    def _purge_expired(self) -> None:
+        """Drop expired jobs; caller must hold the lock."""
+        now = time.monotonic()
+        for job_id in [job_id for job_id, expires in self._expires.items() if expires <= now]:
+            self._jobs.pop(job_id, None)
+            self._expires.pop(job_id, None)
@@ -0,0 +1,109 @@
+"""
+Rendered page cache for Signal Bot web interface.
+
+Keeps the encoded HTML of data-versioned pages so a reload with no
+database change is answered without rendering or recompressing, and lets
+concurrent requests for a page that is not cached yet share one render.
+"""
+
+import gzip
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .content_encoding import accepts_encoding
+
+# Try to import brotli for smaller cached pages, fallback to gzip only
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Content-Encoding -> compressor for cached bodies; each runs at most once per entry
+_COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {'gzip': lambda body: gzip.compress(body, compresslevel=6)}
+if BROTLI_AVAILABLE:
+    _COMPRESSORS['br'] = lambda body: brotli.compress(body, quality=5)
+
+
+class PageCache:
+    """Bounded, lock-protected LRU of rendered pages, each tagged with the ETag it was rendered under."""
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        # Entries are [etag, body, {content-encoding: compressed body}], filled as clients ask for each encoding
+        self._pages: "OrderedDict[str, List]" = OrderedDict()
+        # Renders in progress, resolved once their body is stored
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def pick_encoding(accept_encoding: str) -> Optional[str]:
+        """Choose the best content encoding the cache can serve for an Accept-Encoding header."""
+        if BROTLI_AVAILABLE and accepts_encoding(accept_encoding, 'br'):
+            return 'br'
+        if accepts_encoding(accept_encoding, 'gzip'):
+            return 'gzip'
+        return None
+
+    def get(self, key: str, etag: str, encoding: Optional[str] = None) -> Optional[bytes]:
+        """Get the cached body for a key if it was rendered under this ETag, compressed with encoding if given."""
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is None or entry[0] != etag:
+                return None
+            self._pages.move_to_end(key)
+            if encoding is None:
+                return entry[1]
+            compressed = entry[2].get(encoding)
+            if compressed is not None:
+                return compressed
+            body = entry[1]
+
+        # Compress once per entry and encoding, outside the lock; later hits reuse it
+        compressed = _COMPRESSORS[encoding](body)
+        with self._lock:
+            if self._pages.get(key) is entry:
+                entry[2][encoding] = compressed
+        return compressed
+
+    def join(self, key: str, etag: str) -> Optional[Future]:
+        """Claim the render of a key under this ETag, or join one already running.
+
+        Returns None when the caller should render the page through record(); otherwise
+        a future that resolves once the other render has stored its body, or fails if it
+        did not finish.
+        """
+        with self._lock:
+            flight = self._inflight.get((key, etag))
+            if flight is None:
+                self._inflight[(key, etag)] = Future()
+            return flight
+
+    def record(self, key: str, etag: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Pass chunks through unchanged, storing the full body once the last one has been produced.
+
+        Must follow a join() that returned None; waiters on that render are released when it ends.
+        """
+        parts = []
+        stored = False
+        try:
+            for chunk in chunks:
+                parts.append(chunk)
+                yield chunk
+            with self._lock:
+                self._pages[key] = [etag, b''.join(parts), {}]
+                self._pages.move_to_end(key)
+                while len(self._pages) > self.maxsize:
+                    self._pages.popitem(last=False)
+            stored = True
+        finally:
+            # Also runs when the render raises or the client goes away mid-stream
+            with self._lock:
+                flight = self._inflight.pop((key, etag), None)
+            if flight is not None:
+                if stored:
+                    flight.set_result(None)
+                else:
+                    flight.set_exception(RuntimeError(f"Render of {key} did not complete"))
@@ -0,0 +1,80 @@
+"""
+Stats request batching for Signal Bot web interface.
+
+Coalesces concurrent statistics requests so a burst of polling clients
+results in a single database query per distinct day boundary.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Any, List, Tuple
+
+from models.database import DatabaseManager
+from utils.logging import get_logger
+
+
+class StatsBatcher:
+    """Collects stats requests for a short window and answers them with one query."""
+
+    def __init__(self, db: DatabaseManager, window_seconds: float = 0.01, max_batch: int = 16):
+        self.db = db
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self.logger = get_logger(__name__)
+        self._queue: "queue.Queue[Tuple[int, Future]]" = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, start_of_today_ms: int) -> Future:
+        """Queue a stats request and return a future resolving to the stats dict."""
+        self._ensure_started()
+        future = Future()
+        self._queue.put((start_of_today_ms, future))
+        return future
+
+    def _ensure_started(self):
+        """Start the background worker on first use."""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="StatsBatcher")
+                self._thread.start()
+
+    def _collect_batch(self) -> List[Tuple[int, Future]]:
+        """Block for the first request, then gather more until the window closes or the batch is full."""
+        batch = [self._queue.get()]
+        # The window runs from the first request; later arrivals don't extend it
+        deadline = time.monotonic() + self.window_seconds
+        try:
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                batch.append(self._queue.get(timeout=remaining))
+        except queue.Empty:
+            pass
+        return batch
+
+    def _run(self):
+        """Worker loop: one combined query per distinct day boundary in each batch."""
+        while True:
+            batch = self._collect_batch()
+
+            waiting: Dict[int, List[Future]] = {}
+            for start_of_today_ms, future in batch:
+                waiting.setdefault(start_of_today_ms, []).append(future)
+
+            for start_of_today_ms, futures in waiting.items():
+                try:
+                    stats: Dict[str, Any] = self.db.get_combined_stats(start_of_today_ms)
+                except Exception as e:
+                    self.logger.error(f"Error computing batched stats: {e}")
+                    for future in futures:
+                        future.set_exception(e)
+                    continue
+
+                for future in futures:
+                    future.set_result(dict(stats))
@@ -0,0 +1,78 @@
+"""
+Attachment thumbnails for Signal Bot web interface.
+
+Scales image attachments down to the size the messages page displays them
+at, caching each result on disk so it is only built once.
+"""
+
+import io
+import logging
+import os
+import tempfile
+from typing import Callable, Optional, Tuple
+
+# Try to import Pillow for thumbnailing, fallback to serving originals
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Widths the pages ask for; anything else is served full size so the cache stays bounded
+THUMBNAIL_WIDTHS = frozenset({150, 300, 600})
+
+_FORMATS = (('.jpg', 'image/jpeg'), ('.png', 'image/png'))
+
+
+class ThumbnailCache:
+    """On-disk cache of downscaled attachment images, keyed by attachment row and width."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def get(self, key: str, width: int,
+            load_source: Callable[[], io.BufferedIOBase]) -> Optional[Tuple[str, str]]:
+        """Get (path, content type) of the thumbnail, building it on a miss.
+
+        Returns None when the original should be served instead: Pillow is missing,
+        the width is not one the pages use, the image is animated or already small
+        enough, or it cannot be decoded.
+        """
+        if not PIL_AVAILABLE or width not in THUMBNAIL_WIDTHS:
+            return None
+
+        base = os.path.join(self.cache_dir, f"{key}_{width}")
+        for ext, content_type in _FORMATS:
+            if os.path.exists(base + ext):
+                return base + ext, content_type
+
+        try:
+            with load_source() as source, Image.open(source) as img:
+                if getattr(img, 'is_animated', False) or (img.width <= width and img.height <= width):
+                    return None
+                img.thumbnail((width, width))
+                # Keep transparency (stickers, screenshots) as PNG; everything else becomes JPEG
+                if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+                    ext, content_type = _FORMATS[1]
+                    img = img.convert('RGBA')
+                    save_args = {'format': 'PNG', 'optimize': True}
+                else:
+                    ext, content_type = _FORMATS[0]
+                    img = img.convert('RGB')
+                    save_args = {'format': 'JPEG', 'quality': 82, 'optimize': True}
+
+                # Write to a temporary name and rename, so concurrent requests never see a partial file
+                os.makedirs(self.cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as out:
+                        img.save(out, **save_args)
+                    os.replace(tmp_path, base + ext)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+        except Exception as e:
+            logging.warning(f"Could not build thumbnail for attachment {key}: {e}")
+            return None
+
+        return base + ext, content_type
@@ -1,5 +1,16 @@
 // Activity Tab JavaScript - NO template literals, only string concatenation
 
+// Rapid filter or tab changes are coalesced into one request; a newer one aborts the last
+const ACTIVITY_LOAD_DELAY = 150;
+let activityLoadTimer = null;
+let activityRequest = null;
+let activityLoadedUrl = null;
+
+function scheduleActivityLoad() {
+    clearTimeout(activityLoadTimer);
+    activityLoadTimer = setTimeout(loadActivityData, ACTIVITY_LOAD_DELAY);
+}
+
 // Activity tab functions
 function loadActivityData() {
     const filters = SignalBotUtils.getGlobalFilters();
@@ -28,18 +39,27 @@ function loadActivityData() {
 
     const url = SignalBotUtils.buildUrl('/api/activity/hourly', params);
 
+    // The charts already show these filters
+    if (url === activityLoadedUrl) return;
+
+    if (activityRequest) activityRequest.abort();
+    const request = new AbortController();
+    activityRequest = request;
+
     // Clear and show loading state
     const container = document.getElementById('activity-charts-container');
     if (container) {
         container.innerHTML = SignalBotUtils.createLoadingSpinner('Loading activity data...');
     }
 
-    fetch(url)
+    fetch(url, { signal: request.signal })
         .then(response => response.json())
         .then(data => {
             renderActivityCharts(data);
+            if (!data.error) activityLoadedUrl = url;
         })
         .catch(error => {
+            if (error.name === 'AbortError') return;
             console.error('Error loading activity data:', error);
             if (container) {
                 container.innerHTML = SignalBotUtils.createEmptyState('Error loading activity data', '❌');
@@ -116,7 +136,7 @@ document.addEventListener('filtersChanged', function(event) {
     // Only reload if activity tab is active
     const activeTab = document.querySelector('.nav-link.active');
     if (activeTab && activeTab.getAttribute('data-bs-target') === '#activity') {
-        loadActivityData();
+        scheduleActivityLoad();
     }
 });
 
@@ -125,14 +145,12 @@ document.addEventListener('DOMContentLoaded', function() {
     // Check if activity tab is active on page load
     const activeTab = document.querySelector('.nav-link.active');
     if (activeTab && activeTab.getAttribute('data-bs-target') === '#activity') {
-        setTimeout(loadActivityData, 500);
+        setTimeout(scheduleActivityLoad, 500);
     }
 
     // Listen for tab changes
     const activityTabButton = document.querySelector('[data-bs-target="#activity"]');
     if (activityTabButton) {
-        activityTabButton.addEventListener('click', function() {
-            setTimeout(loadActivityData, 100);
-        });
+        activityTabButton.addEventListener('click', scheduleActivityLoad);
     }
 });
\ No newline at end of file
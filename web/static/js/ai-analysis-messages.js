@@ -150,9 +150,10 @@ function runMessageAnalysis() {
         .then(response => response.json())
         .then(data => {
             if (data.status === 'started' && data.job_id) {
-                // Poll for job completion
-                SignalBotUtils.pollJobStatus(
+                // Wait for job completion
+                SignalBotUtils.watchJobStatus(
                     data.job_id,
+                    '/api/ai-analysis/stream',
                     '/api/ai-analysis/status',
                     renderMessageAnalysisResults,
                     function(error) {
@@ -151,9 +151,10 @@ function runAnalysis() {
         .then(response => response.json())
         .then(data => {
             if (data.status === 'started' && data.job_id) {
-                // Poll for job completion
-                SignalBotUtils.pollJobStatus(
+                // Wait for job completion
+                SignalBotUtils.watchJobStatus(
                     data.job_id,
+                    '/api/ai-analysis/stream',
                     '/api/ai-analysis/status',
                     renderAnalysisResults,
                     function(error) {
@@ -0,0 +1,168 @@
+// Dashboard: auto-refreshing stats and status panels, plus maintenance actions
+
+// Auto-refresh every 30 seconds
+let refreshInterval;
+
+function initDashboard() {
+    loadDashboardData();
+    refreshInterval = setInterval(loadDashboardData, 30000);
+    initCharts();
+}
+
+function loadDashboardData() {
+    // Get user timezone
+    const timezone = Intl.DateTimeFormat().resolvedOptions().timeZone || 'Asia/Tokyo';
+
+    // Fetch all dashboard data with timezone
+    fetch(`/api/dashboard/comprehensive?timezone=${encodeURIComponent(timezone)}`)
+        .then(response => response.json())
+        .then(data => {
+            updateSystemStatus(data.system);
+            updateStatistics(data.statistics);
+            updateActivity(data.activity);
+            updateAIStatus(data.ai);
+            updateBackupStatus(data.backup);
+            updateAlerts(data.alerts);
+        })
+        .catch(error => {
+            console.error('Dashboard update failed:', error);
+        });
+}
+
+function updateSystemStatus(system) {
+    // Update service statuses
+    document.getElementById('signal-status').className =
+        'status-indicator status-' + (system.signal_service ? 'online' : 'offline');
+    document.getElementById('web-status').className =
+        'status-indicator status-' + (system.web_service ? 'online' : 'offline');
+
+    // Update metrics
+    document.getElementById('uptime').textContent = system.uptime || 'N/A';
+    document.getElementById('cpu-usage').textContent = system.cpu + '%';
+    document.getElementById('memory-usage').textContent = system.memory + ' MB';
+    document.getElementById('db-size').textContent = system.db_size;
+
+    // Update progress bars (cap CPU at 100% for display)
+    document.getElementById('cpu-bar').style.width = Math.min(100, system.cpu) + '%';
+    document.getElementById('memory-bar').style.width = system.memory_percent + '%';
+}
+
+function updateStatistics(stats) {
+    // Update stat boxes
+    document.getElementById('total-messages').textContent = stats.total_messages || '0';
+    document.getElementById('active-groups').textContent = stats.active_groups || '0';
+    document.getElementById('total-users').textContent = stats.total_users || '0';
+    document.getElementById('messages-today').textContent = stats.messages_today || '0';
+
+    // Update activity chart
+    if (stats.hourly_activity) {
+        updateActivityChart(stats.hourly_activity);
+    }
+}
+
+function updateActivity(activity) {
+    const container = document.getElementById('recent-activity');
+    if (activity && activity.length > 0) {
+        container.innerHTML = activity.map(item => `
+            <div class="activity-item">
+                <strong>${item.type}</strong>: ${item.description}
+                <div class="activity-time">${item.time}</div>
+            </div>
+        `).join('');
+    }
+}
+
+function updateAIStatus(ai) {
+    // Update AI provider status
+    document.getElementById('ai-provider').textContent = ai.provider || 'None';
+    document.getElementById('ai-model').textContent = ai.model || 'N/A';
+    document.getElementById('ai-status').className =
+        'status-indicator status-' + (ai.available ? 'online' : 'offline');
+}
+
+function updateBackupStatus(backup) {
+    document.getElementById('last-backup').textContent = backup.last || 'Never';
+    document.getElementById('backup-size').textContent = backup.size || 'N/A';
+    document.getElementById('next-backup').textContent = backup.next || 'Not scheduled';
+}
+
+function updateAlerts(alerts) {
+    const container = document.getElementById('alerts-container');
+    if (alerts && alerts.length > 0) {
+        container.innerHTML = alerts.map(alert => `
+            <div class="alert-banner">
+                <strong>${alert.title}</strong>: ${alert.message}
+            </div>
+        `).join('');
+    } else {
+        container.innerHTML = '';
+    }
+}
+
+function initCharts() {
+    // Initialize activity chart using simple canvas
+    const canvas = document.getElementById('activity-chart');
+    if (canvas) {
+        // Simple bar chart implementation
+    }
+}
+
+// Quick action functions
+function syncUsers() {
+    executeAction('/api/users/sync', 'Syncing users...');
+}
+
+function syncGroups() {
+    executeAction('/api/groups/sync', 'Syncing groups...');
+}
+
+function runBackup() {
+    executeAction('/api/backup/quick', 'Creating backup...');
+}
+
+function clearCache() {
+    executeAction('/api/cache/clear', 'Clearing cache...');
+}
+
+function executeAction(url, message) {
+    const btn = event.target;
+    const originalText = btn.textContent;
+    btn.disabled = true;
+    btn.textContent = message;
+
+    fetch(url, { method: 'POST' })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                showNotification('Success', data.message || 'Operation completed');
+                loadDashboardData(); // Refresh
+            } else {
+                showNotification('Error', data.error || 'Operation failed');
+            }
+        })
+        .catch(error => {
+            showNotification('Error', 'Request failed: ' + error);
+        })
+        .finally(() => {
+            btn.disabled = false;
+            btn.textContent = originalText;
+        });
+}
+
+function showNotification(title, message) {
+    // Simple notification
+    const notification = document.createElement('div');
+    notification.className = 'alert-banner';
+    notification.innerHTML = `<strong>${title}:</strong> ${message}`;
+    document.getElementById('alerts-container').appendChild(notification);
+
+    setTimeout(() => notification.remove(), 5000);
+}
+
+// Initialize on load
+document.addEventListener('DOMContentLoaded', initDashboard);
+
+// Cleanup on page unload
+window.addEventListener('beforeunload', () => {
+    if (refreshInterval) clearInterval(refreshInterval);
+});
@@ -0,0 +1,35 @@
+// Single-icon emoji picker modal
+
+let currentIconInputId = null;
+
+function showIconEmojiPicker(inputId) {
+    currentIconInputId = inputId;
+    document.getElementById('iconEmojiPickerModal').style.display = 'block';
+}
+
+function closeIconEmojiPicker() {
+    document.getElementById('iconEmojiPickerModal').style.display = 'none';
+}
+
+function selectIconEmoji(emoji) {
+    if (currentIconInputId) {
+        document.getElementById(currentIconInputId).value = emoji;
+    }
+    closeIconEmojiPicker();
+}
+
+// One delegated listener for the whole emoji grid instead of a handler per emoji
+document.querySelector('#iconEmojiPickerModal .icon-emoji-grid').addEventListener('click', function(event) {
+    const item = event.target.closest('.emoji-picker-item');
+    if (item) {
+        selectIconEmoji(item.textContent);
+    }
+});
+
+// Close modal when clicking outside
+window.onclick = function(event) {
+    const modal = document.getElementById('iconEmojiPickerModal');
+    if (event.target == modal) {
+        closeIconEmojiPicker();
+    }
+}
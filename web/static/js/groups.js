@@ -0,0 +1,27 @@
+// Groups page: tab switching and monitoring toggles
+
+function switchTab(tab) {
+    // Navigate to the tab URL like Messages page does
+    window.location.href = '/groups?tab=' + tab;
+}
+
+async function toggleGroupMonitoring(groupId, monitor) {
+    try {
+        const payload = {group_id: groupId, is_monitored: monitor};
+
+        const response = await fetch('/api/groups/monitor', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(payload)
+        });
+
+        if (response.ok) {
+            location.reload();
+        } else {
+            const errorText = await response.text();
+            alert('Failed to update group monitoring: ' + errorText);
+        }
+    } catch (error) {
+        alert('Error: ' + error.message);
+    }
+}
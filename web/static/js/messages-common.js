@@ -120,14 +120,17 @@ function formatRelativeTime(dateString) {
     return diffDays + ' day' + (diffDays === 1 ? '' : 's') + ' ago';
 }
 
-// Escape HTML for safe display
+// Escape HTML for safe display, in a single pass over the string
+const HTML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#039;'
+};
+
 function escapeHtml(unsafe) {
-    return unsafe
-        .replace(/&/g, "&amp;")
-        .replace(/</g, "&lt;")
-        .replace(/>/g, "&gt;")
-        .replace(/"/g, "&quot;")
-        .replace(/'/g, "&#039;");
+    return unsafe.replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
 }
 
 // Convert markdown to HTML (basic version)
@@ -139,13 +142,13 @@ function markdownToHtml(text) {
         .replace(/\n/g, '<br>');
 }
 
-// Poll for async job status
+// Poll for async job status; the server holds each request until the job changes
 function pollJobStatus(jobId, endpoint, onSuccess, onError, onProgress) {
     const startTime = Date.now();
     const maxDuration = 180000; // 3 minutes timeout
 
     function checkStatus() {
-        const url = endpoint + '?job_id=' + jobId;
+        const url = endpoint + '?job_id=' + jobId + '&wait=25';
 
         fetch(url)
             .then(response => response.json())
@@ -154,13 +157,13 @@ function pollJobStatus(jobId, endpoint, onSuccess, onError, onProgress) {
                     if (onSuccess) onSuccess(data.result);
                 } else if (data.status === 'processing') {
                     if (onProgress) onProgress(data.current_step || 'Processing');
-                    setTimeout(checkStatus, 2000);
+                    checkStatus();
                 } else if (data.status === 'error') {
                     if (onError) onError(data.error || 'Unknown error');
                 } else {
                     const elapsed = Date.now() - startTime;
                     if (elapsed < maxDuration) {
-                        setTimeout(checkStatus, 2000);
+                        checkStatus();
                     } else {
                         if (onError) onError('Operation timed out');
                     }
@@ -178,7 +181,41 @@ function pollJobStatus(jobId, endpoint, onSuccess, onError, onProgress) {
             });
     }
 
-    setTimeout(checkStatus, 1000);
+    checkStatus();
+}
+
+// Follow an async job over server-sent events, falling back to polling if the stream is unavailable
+function watchJobStatus(jobId, streamEndpoint, pollEndpoint, onSuccess, onError, onProgress) {
+    if (!window.EventSource) {
+        pollJobStatus(jobId, pollEndpoint, onSuccess, onError, onProgress);
+        return;
+    }
+
+    const source = new EventSource(streamEndpoint + '?job_id=' + encodeURIComponent(jobId));
+    let finished = false;
+
+    source.onmessage = function(event) {
+        const data = JSON.parse(event.data);
+        if (data.status === 'completed' && data.result) {
+            finished = true;
+            source.close();
+            if (onSuccess) onSuccess(data.result);
+        } else if (data.status === 'error') {
+            finished = true;
+            source.close();
+            if (onError) onError(data.error || 'Unknown error');
+        } else if (onProgress) {
+            onProgress(data.current_step || data.step || 'Processing');
+        }
+    };
+
+    source.onerror = function() {
+        // Stop the browser reconnecting on its own; polling takes over and applies its own timeout
+        source.close();
+        if (!finished) {
+            pollJobStatus(jobId, pollEndpoint, onSuccess, onError, onProgress);
+        }
+    };
 }
 
 // Create loading spinner
@@ -216,6 +253,7 @@ window.SignalBotUtils = {
     escapeHtml: escapeHtml,
     markdownToHtml: markdownToHtml,
     pollJobStatus: pollJobStatus,
+    watchJobStatus: watchJobStatus,
     createLoadingSpinner: createLoadingSpinner,
     createEmptyState: createEmptyState
 };
\ No newline at end of file
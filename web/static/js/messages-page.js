@@ -0,0 +1,70 @@
+// Tab switching and filter wiring for the Messages page
+
+function showTab(tabName) {
+    const tabs = document.querySelectorAll('.tab-content');
+    tabs.forEach(tab => tab.classList.remove('active'));
+
+    const tabButtons = document.querySelectorAll('.tab-btn');
+    tabButtons.forEach(btn => btn.classList.remove('active'));
+
+    document.getElementById(tabName + '-tab').classList.add('active');
+    event.target.classList.add('active');
+}
+
+function switchTab(newTab) {
+    // Keep current filters when switching tabs
+    const filters = GlobalFilters.getValues();
+    const newUrl = new URL('/messages', window.location.origin);
+    newUrl.searchParams.set('tab', newTab);
+
+    if (filters.groupId) newUrl.searchParams.set('group_id', filters.groupId);
+    if (filters.senderId) newUrl.searchParams.set('sender_id', filters.senderId);
+    if (filters.hours) newUrl.searchParams.set('hours', filters.hours);
+    if (filters.attachmentsOnly) newUrl.searchParams.set('attachments_only', 'true');
+
+    // Handle date based on mode
+    if (filters.dateMode === 'today') {
+        const today = new Date().toISOString().split('T')[0];
+        newUrl.searchParams.set('date', today);
+        newUrl.searchParams.set('date_mode', 'today');
+    } else if (filters.dateMode === 'specific' && filters.date) {
+        newUrl.searchParams.set('date', filters.date);
+        newUrl.searchParams.set('date_mode', 'specific');
+    } else {
+        newUrl.searchParams.set('date_mode', 'all');
+    }
+
+    window.location.href = newUrl.toString();
+}
+
+
+// Initialize default tab
+document.addEventListener('DOMContentLoaded', function() {
+    const urlParams = new URLSearchParams(window.location.search);
+    const tab = urlParams.get('tab') || 'groups';
+
+    const tabButton = document.querySelector(`[onclick="showTab('${tab}')"]`);
+    if (tabButton) {
+        tabButton.classList.add('active');
+    }
+
+    const tabContent = document.getElementById(tab + '-tab');
+    if (tabContent) {
+        tabContent.classList.add('active');
+    }
+
+    // Show/hide member filter based on group selection
+    const groupFilter = document.getElementById('group-filter');
+    if (groupFilter) {
+        groupFilter.addEventListener('change', function() {
+            const memberContainer = document.getElementById('member-filter-container');
+            if (memberContainer) {
+                if (this.value) {
+                    memberContainer.style.display = 'block';
+                } else {
+                    memberContainer.style.display = 'none';
+                }
+            }
+        });
+    }
+});
@@ -0,0 +1,646 @@
+// Settings page: setup actions, AI provider configuration and analysis types
+
+// Tab switching using URL navigation
+function switchTab(tab) {
+    window.location.href = '/settings?tab=' + tab;
+}
+
+// Setup functions
+async function runSetup() {
+    const btn = document.getElementById('run-setup');
+    const output = document.getElementById('setup-output');
+
+    btn.disabled = true;
+    btn.textContent = 'Running Setup...';
+    output.textContent = 'Starting setup...\n';
+
+    try {
+        const response = await fetch('/api/setup/run');
+        const result = await response.json();
+
+        output.textContent += `Setup completed:\n`;
+        output.textContent += `Success: ${result.success}\n`;
+        output.textContent += `Steps: ${result.steps_completed.join(', ')}\n`;
+
+        if (result.errors.length > 0) {
+            output.textContent += `Errors: ${result.errors.join(', ')}\n`;
+        }
+
+        // Display QR code if available
+        if (result.linking_qr) {
+            output.innerHTML += `<br><strong>Device Linking Required:</strong><br>`;
+            output.innerHTML += `<p>Scan this QR code with your Signal app:</p>`;
+
+            if (result.linking_qr.qr_code) {
+                output.innerHTML += `<div style="text-align: center; margin: 20px 0;">`;
+                output.innerHTML += `<img src="${result.linking_qr.qr_code}" alt="QR Code" style="max-width: 300px; border: 1px solid #ccc;">`;
+                output.innerHTML += `</div>`;
+            }
+
+            output.innerHTML += `<p><em>After scanning, setup will complete automatically.</em></p>`;
+        } else if (result.success) {
+            output.textContent += '\nSetup completed successfully! Refreshing...';
+            setTimeout(() => location.reload(), 2000);
+        }
+    } catch (error) {
+        output.textContent += `Error: ${error.message}\n`;
+    } finally {
+        btn.disabled = false;
+        btn.textContent = 'Run Setup';
+    }
+}
+
+async function syncGroups() {
+    const btn = document.getElementById('sync-groups');
+    const output = document.getElementById('setup-output');
+
+    btn.disabled = true;
+    btn.textContent = 'Syncing...';
+    output.textContent = 'Syncing groups...\n';
+
+    try {
+        const response = await fetch('/api/setup/sync', { method: 'POST' });
+        const result = await response.json();
+
+        output.textContent += `Groups synced: ${result.synced_count}\n`;
+        output.textContent += 'Sync completed! Refreshing...';
+        setTimeout(() => location.reload(), 2000);
+    } catch (error) {
+        output.textContent += `Error: ${error.message}\n`;
+    } finally {
+        btn.disabled = false;
+        btn.textContent = 'Sync Groups';
+    }
+}
+
+async function syncUsers() {
+    const btn = document.getElementById('sync-users');
+    const output = document.getElementById('setup-output');
+
+    btn.disabled = true;
+    btn.textContent = 'Syncing...';
+    output.textContent = 'Syncing users...\n';
+
+    try {
+        const response = await fetch('/api/setup/sync-users', { method: 'POST' });
+        const result = await response.json();
+
+        if (result.success) {
+            output.textContent += `Users synced successfully!\n`;
+            output.textContent += `Total users: ${result.total_users || 0}\n`;
+            output.textContent += `Configured users: ${result.configured_users || 0}\n`;
+            output.textContent += 'Refreshing...';
+            setTimeout(() => location.reload(), 2000);
+        } else {
+            output.textContent += `Sync failed: ${result.error || 'Unknown error'}\n`;
+        }
+    } catch (error) {
+        output.textContent += `Error: ${error.message}\n`;
+    } finally {
+        btn.disabled = false;
+        btn.textContent = 'Sync Users';
+    }
+}
+
+async function cleanImport() {
+    const btn = document.getElementById('clean-import');
+    const output = document.getElementById('setup-output');
+
+    if (!confirm('This will clear all users and group memberships, then reimport clean data. Continue?')) {
+        return;
+    }
+
+    btn.disabled = true;
+    btn.textContent = 'Importing...';
+    output.textContent = 'Starting clean import...\n';
+
+    try {
+        const response = await fetch('/api/setup/clean-import', { method: 'POST' });
+        const result = await response.json();
+
+        if (result.success) {
+            output.textContent += `Import completed!\n`;
+            output.textContent += `Contacts: ${result.contacts_imported}\n`;
+            output.textContent += `Groups: ${result.groups_synced}\n`;
+            output.textContent += 'Refreshing...';
+            setTimeout(() => location.reload(), 2000);
+        } else {
+            output.textContent += `Import failed: ${result.error || 'Unknown error'}\n`;
+        }
+    } catch (error) {
+        output.textContent += `Error: ${error.message}\n`;
+    } finally {
+        btn.disabled = false;
+        btn.textContent = 'Clean Import';
+    }
+}
+
+// AI Config functions
+let currentConfig = {};
+
+async function refreshAIStatus() {
+    const container = document.getElementById('providers-container');
+    container.innerHTML = '<div class="loading" style="text-align: center; padding: 40px; color: #666;">Loading AI provider status...</div>';
+
+    try {
+        const response = await fetch('/api/ai-status');
+        const data = await response.json();
+        displayProviders(data);
+        loadConfiguration(data.configuration);
+    } catch (error) {
+        container.innerHTML = `<div class="error">Error loading AI status: ${error.message}</div>`;
+    }
+}
+
+function loadConfiguration(config) {
+    if (!config) return;
+    currentConfig = config;
+
+    // Load Ollama configuration
+    if (config.ollama) {
+        document.getElementById('ollama-host').value = config.ollama.host || '';
+        document.getElementById('ollama-enabled').checked = config.ollama.enabled === 'true';
+
+        // Load models if host is configured
+        if (config.ollama.host) {
+            loadOllamaModels(config.ollama.host, config.ollama.model);
+        }
+    }
+
+    // Load Gemini configuration
+    if (config.gemini) {
+        document.getElementById('gemini-path').value = config.gemini.path || 'gemini';
+        document.getElementById('gemini-enabled').checked = config.gemini.enabled === 'true';
+    }
+}
+
+async function loadOllamaModels(host, selectedModel) {
+    const select = document.getElementById('ollama-model');
+
+    try {
+        // Use our proxy endpoint to avoid CORS issues
+        const response = await fetch(`/api/ollama-models?host=${encodeURIComponent(host)}`);
+        if (response.ok) {
+            const data = await response.json();
+            const models = data.models || [];
+
+            select.innerHTML = models.length > 0
+                ? '<option value="">Select a model...</option>'
+                : '<option value="">No models available</option>';
+
+            models.forEach(model => {
+                const option = document.createElement('option');
+                option.value = model;
+                option.textContent = model;
+                if (model === selectedModel) {
+                    option.selected = true;
+                }
+                select.appendChild(option);
+            });
+        } else {
+            select.innerHTML = '<option value="">Failed to load models</option>';
+        }
+    } catch (error) {
+        select.innerHTML = '<option value="">Error loading models</option>';
+    }
+}
+
+async function testOllama() {
+    const host = document.getElementById('ollama-host').value;
+    if (!host) {
+        alert('Please enter Ollama host URL');
+        return;
+    }
+
+    try {
+        // Use our proxy endpoint to test connection
+        const response = await fetch(`/api/ollama-models?host=${encodeURIComponent(host)}`);
+        if (response.ok) {
+            const data = await response.json();
+            if (data.status === 'success') {
+                loadOllamaModels(host);
+                alert(`✅ Connected successfully! Found ${data.models?.length || 0} models.`);
+            } else {
+                alert(`❌ Failed to connect: ${data.error}`);
+            }
+        } else {
+            alert(`❌ Failed to connect: HTTP ${response.status}`);
+        }
+    } catch (error) {
+        alert(`❌ Connection failed: ${error.message}`);
+    }
+}
+
+async function saveAIConfiguration() {
+    const config = {
+        ollama: {
+            host: document.getElementById('ollama-host').value,
+            model: document.getElementById('ollama-model').value,
+            enabled: document.getElementById('ollama-enabled').checked
+        },
+        gemini: {
+            path: document.getElementById('gemini-path').value,
+            enabled: document.getElementById('gemini-enabled').checked
+        }
+    };
+
+    const messageDiv = document.getElementById('config-message');
+    messageDiv.innerHTML = '<div class="alert alert-info">Saving configuration...</div>';
+
+    try {
+        const response = await fetch('/api/ai-config', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(config)
+        });
+
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            messageDiv.innerHTML = '<div class="alert alert-success">✅ Configuration saved successfully!</div>';
+            setTimeout(() => refreshAIStatus(), 1000);
+        } else {
+            messageDiv.innerHTML = `<div class="alert alert-error">❌ Error: ${data.error}</div>`;
+        }
+    } catch (error) {
+        messageDiv.innerHTML = `<div class="alert alert-error">❌ Error: ${error.message}</div>`;
+    }
+}
+
+// AI Analysis Types functions
+async function loadAnalysisTypes() {
+    const container = document.getElementById('analysis-types-list');
+    container.innerHTML = '<div class="loading">Loading analysis types...</div>';
+
+    try {
+        const response = await fetch('/api/ai-analysis/types');
+        const data = await response.json();
+
+        if (data.status === 'success' && data.types) {
+            displayAnalysisTypes(data.types);
+        } else {
+            container.innerHTML = '<div class="error">Error loading analysis types</div>';
+        }
+    } catch (error) {
+        container.innerHTML = '<div class="error">Error: ' + error.message + '</div>';
+    }
+}
+
+function displayAnalysisTypes(types) {
+    const container = document.getElementById('analysis-types-list');
+
+    if (types.length === 0) {
+        container.innerHTML = '<div class="empty-state">No analysis types configured</div>';
+        return;
+    }
+
+    let html = '<div class="analysis-types">';
+    types.forEach(type => {
+        const isBuiltin = type.is_builtin === 1;
+        const isActive = type.is_active === 1;
+
+        html += `
+            <div class="analysis-type-card" style="border: 1px solid #dee2e6; padding: 15px; margin-bottom: 15px; border-radius: 8px;">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <h4 style="margin: 0;">
+                        <span style="font-size: 1.5em; margin-right: 10px;">${type.icon || '🤖'}</span>
+                        ${type.display_name}
+                        ${isBuiltin ? '<span style="background: #e7f3ff; color: #004085; padding: 2px 6px; border-radius: 3px; font-size: 0.7em; margin-left: 10px;">Built-in</span>' : ''}
+                    </h4>
+                    <div>
+                        <button class="btn btn-sm ${isActive ? 'btn-success' : 'btn-secondary'}"
+                                onclick="toggleAnalysisType(${type.id})"
+                                style="padding: 5px 10px; margin-right: 5px;">
+                            ${isActive ? 'Active' : 'Inactive'}
+                        </button>
+                        ${!isBuiltin ? `
+                            <button class="btn btn-sm btn-primary" onclick="editAnalysisType(${type.id})" style="padding: 5px 10px; margin-right: 5px;">Edit</button>
+                            <button class="btn btn-sm btn-danger" onclick="deleteAnalysisType(${type.id})" style="padding: 5px 10px;">Delete</button>
+                        ` : ''}
+                    </div>
+                </div>
+                <p style="color: #666; margin: 10px 0 5px 0;">${type.description || 'No description'}</p>
+                <div style="font-size: 0.85em; color: #999;">
+                    <span style="margin-right: 15px;">Min messages: ${type.min_messages}</span>
+                    <span style="margin-right: 15px;">Max hours: ${type.max_hours}</span>
+                    ${type.requires_group ? '<span style="margin-right: 15px;">Requires group</span>' : ''}
+                    ${type.requires_sender ? '<span>Requires sender filter</span>' : ''}
+                </div>
+            </div>
+        `;
+    });
+    html += '</div>';
+
+    container.innerHTML = html;
+}
+
+async function toggleAnalysisType(id) {
+    try {
+        const response = await fetch(`/api/ai-analysis/type/${id}/toggle`, { method: 'POST' });
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            loadAnalysisTypes();
+        } else {
+            alert('Error toggling analysis type: ' + data.error);
+        }
+    } catch (error) {
+        alert('Error: ' + error.message);
+    }
+}
+
+async function deleteAnalysisType(id) {
+    if (!confirm('Are you sure you want to delete this analysis type?')) return;
+
+    try {
+        const response = await fetch(`/api/ai-analysis/type/${id}`, { method: 'DELETE' });
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            loadAnalysisTypes();
+        } else {
+            alert('Error deleting analysis type: ' + data.error);
+        }
+    } catch (error) {
+        alert('Error: ' + error.message);
+    }
+}
+
+async function fetchAnalysisTypes() {
+    // Helper function to fetch analysis types
+    try {
+        const response = await fetch('/api/ai-analysis/types');
+        const data = await response.json();
+        if (data.status === 'success' && data.types) {
+            return data.types;
+        }
+        return [];
+    } catch (error) {
+        console.error('Error fetching analysis types:', error);
+        return [];
+    }
+}
+
+async function editAnalysisType(id) {
+    try {
+        // First get the basic type data
+        const types = await fetchAnalysisTypes();
+        const basicType = types.find(t => t.id === id);
+        if (!basicType) {
+            alert('Analysis type not found');
+            return;
+        }
+
+        // Get the full type data including prompt_template
+        const response = await fetch(`/api/ai-analysis/type/${id}`);
+        const fullType = await response.json();
+
+        // Merge the data, using full type data when available
+        const type = fullType.id ? fullType : basicType;
+
+        // Create edit modal HTML
+        const modalHTML = `
+            <div id="edit-modal-${id}" style="position: fixed; top: 0; left: 0; right: 0; bottom: 0; background: rgba(0,0,0,0.5); z-index: 1000; display: flex; align-items: center; justify-content: center;">
+                <div style="background: white; border-radius: 8px; padding: 20px; max-width: 600px; width: 90%; max-height: 80vh; overflow-y: auto;">
+                    <h3>Edit Analysis Type: ${type.display_name}</h3>
+                    <form id="edit-form-${id}">
+                        <div style="margin-bottom: 15px;">
+                            <label>Display Name:</label>
+                            <input type="text" id="edit-display-name-${id}" value="${type.display_name}" style="width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 4px;">
+                        </div>
+                        <div style="margin-bottom: 15px;">
+                            <label>Description:</label>
+                            <textarea id="edit-description-${id}" rows="3" style="width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 4px;">${type.description || ''}</textarea>
+                        </div>
+                        <div style="margin-bottom: 15px;">
+                            <label>Prompt Template:</label>
+                            <textarea id="edit-prompt-${id}" rows="8" style="width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 4px; font-family: monospace;">${type.prompt_template || ''}</textarea>
+                            <small style="color: #666;">Use placeholders: {group_name}, {hours}, {messages}, {message_count}</small>
+                        </div>
+                        <div style="margin-bottom: 15px;">
+                            <label>Icon:</label>
+                            <div style="display: flex; gap: 10px;">
+                                <input type="text" id="edit-icon-${id}" value="${type.icon || '🤖'}" readonly style="width: 60px; padding: 8px; border: 1px solid #ddd; border-radius: 4px; text-align: center; font-size: 24px;">
+                                <button type="button" onclick="showIconEmojiPicker('edit-icon-${id}')" style="padding: 8px 16px; background: #6c757d; color: white; border: none; border-radius: 4px; cursor: pointer;">Select Icon</button>
+                            </div>
+                        </div>
+                        <div style="margin-bottom: 15px;">
+                            <label>Max Hours:</label>
+                            <input type="number" id="edit-max-hours-${id}" value="${type.max_hours || 168}" min="1" style="width: 100px; padding: 8px; border: 1px solid #ddd; border-radius: 4px;">
+                        </div>
+                        <div style="margin-bottom: 15px;">
+                            <label>Min Messages:</label>
+                            <input type="number" id="edit-min-messages-${id}" value="${type.min_messages || 5}" min="0" style="width: 100px; padding: 8px; border: 1px solid #ddd; border-radius: 4px;">
+                        </div>
+                        <div style="margin-bottom: 15px;">
+                            <label>
+                                <input type="checkbox" id="edit-requires-group-${id}" ${type.requires_group ? 'checked' : ''}>
+                                Requires Group Selection
+                            </label>
+                        </div>
+                        <div style="margin-bottom: 15px;">
+                            <label>
+                                <input type="checkbox" id="edit-requires-sender-${id}" ${type.requires_sender ? 'checked' : ''}>
+                                Requires Sender Selection
+                            </label>
+                        </div>
+                        <div style="margin-bottom: 15px;">
+                            <label>
+                                <input type="checkbox" id="edit-active-${id}" ${type.is_active !== false ? 'checked' : ''}>
+                                Active
+                            </label>
+                        </div>
+                        <div style="display: flex; gap: 10px; justify-content: flex-end;">
+                            <button type="button" onclick="document.getElementById('edit-modal-${id}').remove()" style="padding: 8px 16px; background: #6c757d; color: white; border: none; border-radius: 4px; cursor: pointer;">Cancel</button>
+                            <button type="button" onclick="saveEditAnalysisType(${id})" style="padding: 8px 16px; background: #007bff; color: white; border: none; border-radius: 4px; cursor: pointer;">Save Changes</button>
+                        </div>
+                    </form>
+                </div>
+            </div>
+        `;
+
+        // Add modal to page
+        document.body.insertAdjacentHTML('beforeend', modalHTML);
+
+    } catch (error) {
+        alert('Error loading analysis type: ' + error.message);
+    }
+}
+
+async function saveEditAnalysisType(id) {
+    const updateData = {
+        display_name: document.getElementById(`edit-display-name-${id}`).value,
+        description: document.getElementById(`edit-description-${id}`).value,
+        prompt_template: document.getElementById(`edit-prompt-${id}`).value,
+        icon: document.getElementById(`edit-icon-${id}`).value,
+        max_hours: parseInt(document.getElementById(`edit-max-hours-${id}`).value),
+        min_messages: parseInt(document.getElementById(`edit-min-messages-${id}`).value),
+        requires_group: document.getElementById(`edit-requires-group-${id}`).checked,
+        requires_sender: document.getElementById(`edit-requires-sender-${id}`).checked,
+        is_active: document.getElementById(`edit-active-${id}`).checked ? 1 : 0
+    };
+
+    if (!updateData.display_name || !updateData.prompt_template) {
+        alert('Display name and prompt template are required');
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/ai-analysis/type/${id}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(updateData)
+        });
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            document.getElementById(`edit-modal-${id}`).remove();
+            loadAnalysisTypes();
+            alert('Analysis type updated successfully');
+        } else {
+            alert('Error updating analysis type: ' + data.error);
+        }
+    } catch (error) {
+        alert('Error: ' + error.message);
+    }
+}
+
+function showAddAnalysisType() {
+    const form = document.getElementById('add-analysis-form');
+    form.style.display = form.style.display === 'none' ? 'block' : 'none';
+}
+
+async function saveNewAnalysisType() {
+    const config = {
+        name: document.getElementById('new-type-name').value,
+        display_name: document.getElementById('new-type-display').value,
+        description: document.getElementById('new-type-description').value,
+        icon: document.getElementById('new-type-icon').value || '🤖',
+        prompt_template: document.getElementById('new-type-prompt').value,
+        requires_group: document.getElementById('new-type-requires-group').checked,
+        requires_sender: document.getElementById('new-type-requires-sender').checked,
+        min_messages: parseInt(document.getElementById('new-type-min-messages').value) || 5,
+        max_hours: parseInt(document.getElementById('new-type-max-hours').value) || 168
+    };
+
+    if (!config.name || !config.display_name || !config.prompt_template) {
+        alert('Please fill in all required fields');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/ai-analysis/type', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(config)
+        });
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            // Clear form
+            document.getElementById('add-analysis-form').style.display = 'none';
+            document.getElementById('new-analysis-form').reset();
+            loadAnalysisTypes();
+        } else {
+            alert('Error saving analysis type: ' + data.error);
+        }
+    } catch (error) {
+        alert('Error: ' + error.message);
+    }
+}
+
+function displayProviders(data) {
+    const container = document.getElementById('providers-container');
+
+    if (!data.providers || data.providers.length === 0) {
+        container.innerHTML = '<div class="error">No AI providers configured</div>';
+        return;
+    }
+
+    let html = '';
+
+    if (data.active_provider) {
+        html += `<div class="alert alert-success">
+            <strong>✅ Active Provider:</strong> ${data.active_provider}
+        </div>`;
+    } else {
+        html += `<div class="alert alert-error">
+            <strong>❌ No AI providers available</strong><br>
+            Please install and configure Ollama or Gemini CLI below.
+        </div>`;
+    }
+
+    data.providers.forEach(provider => {
+        const isAvailable = provider.available;
+        const statusClass = isAvailable ? 'provider-available' : 'provider-unavailable';
+        const badgeClass = isAvailable ? 'status-available' : 'status-unavailable';
+        const statusText = isAvailable ? 'Available' : 'Unavailable';
+
+        html += `
+            <div class="provider-card ${statusClass}">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <h3 style="margin: 0;">${provider.name}</h3>
+                    <span class="status-badge ${badgeClass}">${statusText}</span>
+                </div>
+                <dl class="provider-details">
+                    <dt>Type:</dt>
+                    <dd>${provider.type === 'local' ? '🏠 Local' : '🌐 External'}</dd>
+                    ${provider.host ? `<dt>Host:</dt><dd>${provider.host}</dd>` : ''}
+                    ${provider.model ? `<dt>Current Model:</dt><dd>${provider.model} ${provider.current_model_loaded ? '✅' : '⏸️'}</dd>` : ''}
+                    ${provider.command ? `<dt>Command:</dt><dd>${provider.command}</dd>` : ''}
+
+                    ${provider.type === 'local' && provider.available ? `
+                        <dt>Memory Usage:</dt>
+                        <dd>📊 ${provider.total_vram_usage_gb || 0} GB VRAM (${provider.loaded_models_count || 0} models loaded)</dd>
+
+                        ${provider.loaded_models && provider.loaded_models.length > 0 ? `
+                            <dt>Loaded Models:</dt>
+                            <dd>
+                                ${provider.loaded_models.map(model => `
+                                    <div style="background: #f8f9fa; padding: 8px; margin: 4px 0; border-radius: 3px; border-left: 3px solid ${model.is_current_model ? '#28a745' : '#6c757d'};">
+                                        <strong>${model.name}</strong> ${model.is_current_model ? '🎯' : ''}
+                                        <br><small>📏 ${model.parameter_size} | 💾 ${model.size_vram_gb}GB VRAM | 🔧 ${model.quantization || 'N/A'} | 📝 ${(model.context_length / 1000).toFixed(0)}K context</small>
+                                    </div>
+                                `).join('')}
+                            </dd>
+                        ` : ''}
+
+                        <dt>Available Models:</dt>
+                        <dd>📦 ${provider.total_available_models || 0} models (${provider.total_models_size_gb || 0} GB total)</dd>
+                    ` : ''}
+
+                    ${provider.available_models && provider.type !== 'local' ? `<dt>Available Models:</dt><dd>${provider.available_models.join(', ') || 'None'}</dd>` : ''}
+                </dl>
+            </div>
+        `;
+    });
+
+    container.innerHTML = html;
+}
+
+async function preloadModel() {
+    const host = document.getElementById('ollama-host').value;
+    const model = document.getElementById('ollama-model').value;
+    if (!host || !model) {
+        document.getElementById('config-message').innerHTML = '<div class="alert alert-error">Please configure Ollama host and select a model first</div>';
+        return;
+    }
+
+    const messageDiv = document.getElementById('config-message');
+    messageDiv.innerHTML = '<div class="alert alert-info">🚀 Loading model... This may take several minutes for large models.</div>';
+
+    try {
+        const response = await fetch(`/api/ollama-preload?host=${encodeURIComponent(host)}&model=${encodeURIComponent(model)}`);
+        const data = await response.json();
+
+        if (data.status === 'success') {
+            messageDiv.innerHTML = `<div class="alert alert-success">✅ Model ${model} loaded successfully!</div>`;
+        } else {
+            messageDiv.innerHTML = `<div class="alert alert-error">❌ Failed to load model: ${data.error}</div>`;
+        }
+    } catch (error) {
+        messageDiv.innerHTML = `<div class="alert alert-error">❌ Error loading model: ${error.message}</div>`;
+    }
+}
@@ -0,0 +1,135 @@
+// User emoji reaction management for the Users page
+
+function switchTab(tab) {
+    // Navigate to the tab URL like Messages page does
+    window.location.href = '/users?tab=' + tab;
+}
+
+function saveReactions(userId) {
+    const selectedEmojis = Array.from(document.querySelectorAll('#emoji-' + userId + ' .emoji-item.selected'))
+        .map(item => item.dataset.emoji);
+    const mode = document.getElementById('mode-' + userId).value;
+
+    fetch('/api/save-user-reactions', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ user_id: userId, emojis: selectedEmojis, mode: mode })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            alert('Reactions saved successfully!');
+            location.reload();
+        } else {
+            alert('Error saving reactions');
+        }
+    });
+}
+
+function removeReactions(userId) {
+    if (confirm('Remove all emoji reactions for this user?')) {
+        fetch('/api/remove-user-reactions', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ user_id: userId })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                alert('Reactions removed successfully!');
+                location.reload();
+            } else {
+                alert('Error removing reactions');
+            }
+        });
+    }
+}
+
+function toggleEmoji(element) {
+    element.classList.toggle('selected');
+}
+
+function editUserReactions(button) {
+    // Current reactions are rendered onto the button, so no round trip is needed
+    openEmojiPicker(button.dataset.uuid, JSON.parse(button.dataset.emojis || '[]'), button.dataset.mode);
+}
+
+// Emojis picked in the modal, in order, mapped to their badge element
+let selectedEmojis = new Map();
+// Grid item per emoji, built once so a selection change touches only that item
+const emojiGridItems = new Map(
+    Array.from(document.querySelectorAll('#emojiModal .emoji-item'), item => [item.textContent, item])
+);
+
+function openEmojiPicker(userId, emojis, mode) {
+    // Only the previously selected items need their highlight cleared
+    selectedEmojis.forEach((badge, emoji) => emojiGridItems.get(emoji)?.classList.remove('selected'));
+    selectedEmojis = new Map();
+    document.getElementById('selectedEmojis').innerHTML = '';
+    document.getElementById('reactionMode').value = mode || 'random';
+    emojis.forEach(addEmoji);
+
+    document.getElementById('currentUserId').value = userId;
+    document.getElementById('emojiModal').style.display = 'block';
+}
+
+function closeEmojiPicker() {
+    document.getElementById('emojiModal').style.display = 'none';
+}
+
+function addEmoji(emoji) {
+    if (selectedEmojis.has(emoji)) {
+        return;
+    }
+    const span = document.createElement('span');
+    span.className = 'emoji-badge';
+    span.textContent = emoji;
+    span.onclick = function() { removeEmoji(emoji); };
+    document.getElementById('selectedEmojis').appendChild(span);
+    selectedEmojis.set(emoji, span);
+    emojiGridItems.get(emoji)?.classList.add('selected');
+}
+
+function removeEmoji(emoji) {
+    const badge = selectedEmojis.get(emoji);
+    if (badge) {
+        badge.remove();
+        selectedEmojis.delete(emoji);
+        emojiGridItems.get(emoji)?.classList.remove('selected');
+    }
+}
+
+function saveFromModal() {
+    const userId = document.getElementById('currentUserId').value;
+    const emojis = Array.from(selectedEmojis.keys());
+    const mode = document.getElementById('reactionMode').value;
+
+    fetch('/api/save-user-reactions', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ user_id: userId, emojis: emojis, mode: mode })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            alert('Reactions saved successfully!');
+            location.reload();
+        } else {
+            alert('Error saving reactions');
+        }
+    });
+    closeEmojiPicker();
+}
+
+// One delegated listener for the whole emoji grid instead of a handler per emoji
+document.querySelector('#emojiModal .emoji-grid').addEventListener('click', function(event) {
+    const item = event.target.closest('.emoji-item');
+    if (item) {
+        // Clicking a selected emoji in the grid deselects it
+        if (selectedEmojis.has(item.textContent)) {
+            removeEmoji(item.textContent);
+        } else {
+            addEmoji(item.textContent);
+        }
+    }
+});